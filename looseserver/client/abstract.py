@@ -1,6 +1,7 @@
 """Module with base client for server configuration."""
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 
 import urllib.parse as urlparse
 
@@ -33,16 +34,24 @@ class AbstractClient(ABC):
             contains error from API.
         """
 
-    def create_rule(self, rule):
+    def create_rule(self, rule, ttl=None, remaining_uses=None):
         """Create a rule.
 
         :param rule: instance of :class:`ClientRule <looseserver.client.rule.ClientRule>`.
+        :param ttl: number of seconds after which the rule is removed by the server.
+        :param remaining_uses: number of matches after which the rule is removed
+            by the server.
         :returns: rule created by rule factory.
         """
         rule_data = self._rule_factory.serialize_rule(rule)
+        if ttl is not None:
+            rule_data["ttl"] = ttl
+        if remaining_uses is not None:
+            rule_data["remaining_uses"] = remaining_uses
         created_rule_data = self._send_request(url="rules", method="POST", json=rule_data)
         rule = self._rule_factory.parse_rule(created_rule_data)
         rule.rule_id = created_rule_data["rule_id"]
+        rule.remaining_uses = created_rule_data.get("remaining_uses")
         return rule
 
     def get_rule(self, rule_id):
@@ -55,6 +64,7 @@ class AbstractClient(ABC):
         rule_data = self._send_request(url=rule_url)
         rule = self._rule_factory.parse_rule(rule_data)
         rule.rule_id = rule_id
+        rule.remaining_uses = rule_data.get("remaining_uses")
         return rule
 
     def remove_rule(self, rule_id):
@@ -65,6 +75,17 @@ class AbstractClient(ABC):
         rule_url = "rule/{0}".format(rule_id)
         self._send_request(url=rule_url, method="DELETE")
 
+    def get_shadowed_rules(self):
+        """Get rules, that are shadowed by the preceding rules.
+
+        :returns: ordered dictionary with IDs of the shadowing rules by IDs of
+            the shadowed rules.
+        """
+        shadowed_rules_data = self._send_request(url="shadowed_rules")
+        return OrderedDict(
+            (data["rule_id"], data["shadowing_rule_id"]) for data in shadowed_rules_data
+            )
+
     def set_response(self, rule_id, response):
         """Set response for the rule.
 
@@ -6,6 +6,7 @@ class ClientRule:
 
     def __init__(self, rule_type, rule_id=None):
         self.rule_id = rule_id
+        self.remaining_uses = None
         self._type = rule_type
 
     @property
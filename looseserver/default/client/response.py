@@ -9,14 +9,27 @@ from looseserver.default.common.configuration import ResponseFactoryPreparator
 
 
 class FixedResponse(ClientResponse):
-    """Response that does not depend on request or rule."""
+    """Response that does not depend on request or rule.
 
-    def __init__(self, body="", status=200, headers=(), response_type=ResponseType.FIXED.name):
+    If compression is enabled, the server also serves the body compressed with gzip
+    to the clients, that accept it.
+    """
+
+    def __init__(
+            self,
+            body="",
+            status=200,
+            headers=(),
+            response_type=ResponseType.FIXED.name,
+            compress=False,
+        ):
+        # pylint: disable=too-many-arguments
         super(FixedResponse, self).__init__(response_type)
         self._body = body
         self._status = status
         self._headers = {}
         self._headers.update(headers)
+        self._compress = compress
 
     @property
     def body(self):
@@ -33,6 +46,143 @@ class FixedResponse(ClientResponse):
         """Headers of the response."""
         return copy(self._headers)
 
+    @property
+    def compress(self):
+        """Flag if the body can be compressed."""
+        return self._compress
+
+    def __repr__(self):
+        return "{class_name}()".format(class_name=self.__class__.__name__)
+
+
+class FileResponse(ClientResponse):
+    """Response with the body read from a file on the server.
+
+    The path is resolved by the server, so the file must exist on the server side.
+    """
+
+    def __init__(self, path, status=200, headers=(), response_type=ResponseType.FILE.name):
+        super(FileResponse, self).__init__(response_type)
+        self._path = path
+        self._status = status
+        self._headers = {}
+        self._headers.update(headers)
+
+    @property
+    def path(self):
+        """Path to the file on the server."""
+        return self._path
+
+    @property
+    def status(self):
+        """Status of the response."""
+        return self._status
+
+    @property
+    def headers(self):
+        """Headers of the response."""
+        return copy(self._headers)
+
+    def __repr__(self):
+        return "{class_name}(path='{path}')".format(
+            class_name=self.__class__.__name__,
+            path=self._path,
+            )
+
+
+class StreamResponse(ClientResponse):
+    """Response with the body streamed in chunks.
+
+    Body is either a list of chunks or a pattern repeated in chunks of the specified size
+    until the total size is reached.
+    """
+
+    def __init__(
+            self,
+            chunks=None,
+            pattern=None,
+            chunk_size=64 * 1024,
+            total_size=0,
+            status=200,
+            headers=(),
+            response_type=ResponseType.STREAM.name,
+        ):
+        # pylint: disable=too-many-arguments
+        super(StreamResponse, self).__init__(response_type)
+        if (chunks is None) == (pattern is None):
+            raise ValueError("Either chunks or pattern must be specified")
+
+        self._chunks = None if chunks is None else list(chunks)
+        self._pattern = pattern
+        self._chunk_size = None if pattern is None else chunk_size
+        self._total_size = None if pattern is None else total_size
+        self._status = status
+        self._headers = {}
+        self._headers.update(headers)
+
+    @property
+    def chunks(self):
+        """List of chunks or None if the body is a repeated pattern."""
+        return None if self._chunks is None else list(self._chunks)
+
+    @property
+    def pattern(self):
+        """Repeated pattern or None if the body is a list of chunks."""
+        return self._pattern
+
+    @property
+    def chunk_size(self):
+        """Size of the chunks of the pattern."""
+        return self._chunk_size
+
+    @property
+    def total_size(self):
+        """Total size of the body with the pattern."""
+        return self._total_size
+
+    @property
+    def status(self):
+        """Status of the response."""
+        return self._status
+
+    @property
+    def headers(self):
+        """Headers of the response."""
+        return copy(self._headers)
+
+    def __repr__(self):
+        return "{class_name}()".format(class_name=self.__class__.__name__)
+
+
+class TemplateResponse(ClientResponse):
+    """Response with the body rendered from a template on the server.
+
+    Placeholders ``{path[1]}``, ``{query[name]}`` and ``{header[Name]}`` are replaced
+    with a segment of the request path, a query parameter and a header of the request.
+    """
+
+    def __init__(self, template, status=200, headers=(), response_type=ResponseType.TEMPLATE.name):
+        super(TemplateResponse, self).__init__(response_type)
+        self._template = template
+        self._status = status
+        self._headers = {}
+        self._headers.update(headers)
+
+    @property
+    def template(self):
+        """Template of the body."""
+        return self._template
+
+    @property
+    def status(self):
+        """Status of the response."""
+        return self._status
+
+    @property
+    def headers(self):
+        """Headers of the response."""
+        return copy(self._headers)
+
     def __repr__(self):
         return "{class_name}()".format(class_name=self.__class__.__name__)
 
@@ -46,5 +196,8 @@ def create_response_factory():
 
     client_factory_preparator = ResponseFactoryPreparator(response_factory=response_factory)
     client_factory_preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+    client_factory_preparator.prepare_file_response(file_response_class=FileResponse)
+    client_factory_preparator.prepare_stream_response(stream_response_class=StreamResponse)
+    client_factory_preparator.prepare_template_response(template_response_class=TemplateResponse)
 
     return response_factory
@@ -1,8 +1,10 @@
 """Default client rules."""
 
+import hashlib
+
 from looseserver.common.rule import RuleFactory
 from looseserver.client.rule import ClientRule
-from looseserver.default.common.constants import RuleType
+from looseserver.default.common.constants import RuleType, HeaderMatchMode
 from looseserver.default.common.configuration import RuleFactoryPreparator
 
 
@@ -25,6 +27,44 @@ class PathRule(ClientRule):
             )
 
 
+class PathPrefixRule(ClientRule):
+    """Rule to match requests by prefix of the path."""
+
+    def __init__(self, prefix, rule_type=RuleType.PATH_PREFIX.name, rule_id=None):
+        super(PathPrefixRule, self).__init__(rule_type, rule_id)
+        self._prefix = prefix
+
+    @property
+    def prefix(self):
+        """Prefix of the path to match."""
+        return self._prefix
+
+    def __repr__(self):
+        return "{class_name}(prefix='{prefix}')".format(
+            class_name=self.__class__.__name__,
+            prefix=self._prefix,
+            )
+
+
+class PathRegexRule(ClientRule):
+    """Rule to match requests by regular expression of the path."""
+
+    def __init__(self, pattern, rule_type=RuleType.PATH_REGEX.name, rule_id=None):
+        super(PathRegexRule, self).__init__(rule_type, rule_id)
+        self._pattern = pattern
+
+    @property
+    def pattern(self):
+        """Regular expression to match the path."""
+        return self._pattern
+
+    def __repr__(self):
+        return "{class_name}(pattern='{pattern}')".format(
+            class_name=self.__class__.__name__,
+            pattern=self._pattern,
+            )
+
+
 class MethodRule(ClientRule):
     """Rule to match requests by method."""
 
@@ -44,6 +84,145 @@ class MethodRule(ClientRule):
             )
 
 
+class HostRule(ClientRule):
+    """Rule to match requests by host name."""
+
+    def __init__(self, host, rule_type=RuleType.HOST.name, rule_id=None):
+        super(HostRule, self).__init__(rule_type, rule_id)
+        self._host = host.lower()
+
+    @property
+    def host(self):
+        """Host name to match."""
+        return self._host
+
+    def __repr__(self):
+        return "{class_name}(host='{host}')".format(
+            class_name=self.__class__.__name__,
+            host=self._host,
+            )
+
+
+class HeaderRule(ClientRule):
+    """Rule to match requests by a header."""
+
+    def __init__(
+            self,
+            name,
+            value=None,
+            mode=HeaderMatchMode.EXACT.name,
+            rule_type=RuleType.HEADER.name,
+            rule_id=None,
+        ):
+        # pylint: disable=too-many-arguments
+        super(HeaderRule, self).__init__(rule_type, rule_id)
+        self._name = name
+        self._value = value
+        self._mode = mode
+
+    @property
+    def name(self):
+        """Name of the header."""
+        return self._name
+
+    @property
+    def value(self):
+        """Value to match."""
+        return self._value
+
+    @property
+    def mode(self):
+        """Name of the match mode."""
+        return self._mode
+
+    def __repr__(self):
+        return "{class_name}(name='{name}', value={value!r}, mode='{mode}')".format(
+            class_name=self.__class__.__name__,
+            name=self._name,
+            value=self._value,
+            mode=self._mode,
+            )
+
+
+class QueryRule(ClientRule):
+    """Rule to match requests by a query parameter."""
+
+    def __init__(self, name, value=None, rule_type=RuleType.QUERY.name, rule_id=None):
+        super(QueryRule, self).__init__(rule_type, rule_id)
+        self._name = name
+        self._value = value
+
+    @property
+    def name(self):
+        """Name of the parameter."""
+        return self._name
+
+    @property
+    def value(self):
+        """Value to match."""
+        return self._value
+
+    def __repr__(self):
+        return "{class_name}(name='{name}', value={value!r})".format(
+            class_name=self.__class__.__name__,
+            name=self._name,
+            value=self._value,
+            )
+
+
+class JsonBodyRule(ClientRule):
+    """Rule to match requests by JSON body."""
+
+    def __init__(self, value, path="$", rule_type=RuleType.JSON_BODY.name, rule_id=None):
+        super(JsonBodyRule, self).__init__(rule_type, rule_id)
+        self._value = value
+        self._path = path
+
+    @property
+    def value(self):
+        """Value, that the selected part of the body must contain."""
+        return self._value
+
+    @property
+    def path(self):
+        """Path of the selected part of the body."""
+        return self._path
+
+    def __repr__(self):
+        return "{class_name}(value={value!r}, path='{path}')".format(
+            class_name=self.__class__.__name__,
+            value=self._value,
+            path=self._path,
+            )
+
+
+class BodyDigestRule(ClientRule):
+    """Rule to match requests by SHA-256 digest of the body.
+
+    Digest is computed from the body on the client, so the body is not sent to the server.
+    Either body or digest must be specified.
+    """
+
+    def __init__(self, body=None, digest=None, rule_type=RuleType.BODY_DIGEST.name, rule_id=None):
+        super(BodyDigestRule, self).__init__(rule_type, rule_id)
+        if digest is None:
+            if isinstance(body, str):
+                body = body.encode("utf8")
+            digest = hashlib.sha256(body).hexdigest()
+        self._digest = digest
+
+    @property
+    def digest(self):
+        """Hexadecimal SHA-256 digest of the expected body."""
+        return self._digest
+
+    def __repr__(self):
+        return "{class_name}(digest='{digest}')".format(
+            class_name=self.__class__.__name__,
+            digest=self._digest,
+            )
+
+
 class CompositeRule(ClientRule):
     """Composite rule to match request by several rules simultaneously."""
 
@@ -73,7 +252,14 @@ def create_rule_factory():
 
     client_factory_preparator = RuleFactoryPreparator(rule_factory=rule_factory)
     client_factory_preparator.prepare_path_rule(path_rule_class=PathRule)
+    client_factory_preparator.prepare_path_prefix_rule(path_prefix_rule_class=PathPrefixRule)
+    client_factory_preparator.prepare_path_regex_rule(path_regex_rule_class=PathRegexRule)
     client_factory_preparator.prepare_method_rule(method_rule_class=MethodRule)
+    client_factory_preparator.prepare_host_rule(host_rule_class=HostRule)
+    client_factory_preparator.prepare_header_rule(header_rule_class=HeaderRule)
+    client_factory_preparator.prepare_query_rule(query_rule_class=QueryRule)
+    client_factory_preparator.prepare_json_body_rule(json_body_rule_class=JsonBodyRule)
+    client_factory_preparator.prepare_body_digest_rule(body_digest_rule_class=BodyDigestRule)
     client_factory_preparator.prepare_composite_rule(composite_rule_class=CompositeRule)
 
     return rule_factory
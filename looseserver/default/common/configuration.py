@@ -2,11 +2,19 @@
 
 import binascii
 import base64
+import hashlib
+import re
 from urllib.parse import urljoin
 
 from looseserver.common.rule import RuleParseError, RuleSerializeError
 from looseserver.common.response import ResponseParseError, ResponseSerializeError
-from looseserver.default.common.constants import RuleType, ResponseType
+from looseserver.default.common.constants import RuleType, ResponseType, HeaderMatchMode
+
+
+_SHA256_DIGEST = re.compile("[0-9a-fA-F]{64}")
+_LEADING_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+MAX_CHUNK_SIZE = 2 ** 20
 
 
 class RuleFactoryPreparator:
@@ -64,6 +72,114 @@ class RuleFactoryPreparator:
             serializer=_serializer,
             )
 
+    def prepare_path_prefix_rule(self, path_prefix_rule_class, base_url=None):
+        """Prepare path prefix rule in the rule factory.
+
+        :param path_prefix_rule_class: class of the path prefix rule.
+        :param base_url: base url for dynamically configured endpoints.
+        """
+        def _parser(rule_type, parameters):
+            """Create path prefix rule.
+
+            :param rule_type: type of the rule.
+            :param parameters: dictionary with parameters of the rule.
+            :returns: instance of configured path prefix rule class.
+            """
+            try:
+                relative_prefix = parameters["prefix"]
+            except (TypeError, KeyError) as error:
+                message = "Rule parameters must be a dictionary with 'prefix' key"
+                raise RuleParseError(message) from error
+
+            if base_url is None:
+                prefix = relative_prefix
+            else:
+                prefix = urljoin(base_url, relative_prefix)
+
+            return path_prefix_rule_class(rule_type=rule_type, prefix=prefix)
+
+        def _serializer(rule_type, rule):
+            # pylint: disable=unused-argument
+            """Serialize path prefix rule.
+
+            :param rule_type: type of the rule.
+            :param rule: path prefix rule.
+            :returns: dictionary with data.
+            """
+            try:
+                prefix = rule.prefix
+            except AttributeError as error:
+                raise RuleSerializeError("Path prefix rule must have prefix attribute") from error
+
+            return {
+                "prefix": prefix,
+                }
+
+        self._rule_factory.register_rule(
+            rule_type=RuleType.PATH_PREFIX.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+    def prepare_path_regex_rule(self, path_regex_rule_class, base_url=None):
+        """Prepare path regex rule in the rule factory.
+
+        :param path_regex_rule_class: class of the path regex rule.
+        :param base_url: base url for dynamically configured endpoints. It is escaped and
+            prepended to the pattern, which is wrapped in a non-capturing group, so that
+            alternatives of the pattern are not separated from the base url. Leading inline
+            flags of the pattern are scoped to the group. Python 3.5 doesn't support scoped
+            flags, so they apply to the whole expression there.
+        """
+        def _parser(rule_type, parameters):
+            """Create path regex rule.
+
+            :param rule_type: type of the rule.
+            :param parameters: dictionary with parameters of the rule.
+            :returns: instance of configured path regex rule class.
+            """
+            try:
+                relative_pattern = parameters["pattern"]
+            except (TypeError, KeyError) as error:
+                message = "Rule parameters must be a dictionary with 'pattern' key"
+                raise RuleParseError(message) from error
+
+            if not isinstance(relative_pattern, str):
+                raise RuleParseError("Pattern must be a string")
+
+            if base_url is None:
+                pattern = relative_pattern
+            else:
+                pattern = _join_pattern(base_url=base_url, pattern=relative_pattern)
+
+            try:
+                return path_regex_rule_class(rule_type=rule_type, pattern=pattern)
+            except re.error as error:
+                raise RuleParseError("Pattern can't be compiled") from error
+
+        def _serializer(rule_type, rule):
+            # pylint: disable=unused-argument
+            """Serialize path regex rule.
+
+            :param rule_type: type of the rule.
+            :param rule: path regex rule.
+            :returns: dictionary with data.
+            """
+            try:
+                pattern = rule.pattern
+            except AttributeError as error:
+                raise RuleSerializeError("Path regex rule must have pattern attribute") from error
+
+            return {
+                "pattern": pattern,
+                }
+
+        self._rule_factory.register_rule(
+            rule_type=RuleType.PATH_REGEX.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
     def prepare_method_rule(self, method_rule_class):
         """Prepare method rule in the rule factory.
 
@@ -107,6 +223,281 @@ class RuleFactoryPreparator:
             serializer=_serializer,
             )
 
+    def prepare_host_rule(self, host_rule_class):
+        """Prepare host rule in the rule factory.
+
+        :param host_rule_class: class of the host rule.
+        """
+        def _parser(rule_type, parameters):
+            """Create host rule.
+
+            :param rule_type: type of the rule.
+            :param parameters: dictionary with parameters of the rule.
+            :returns: instance of configured host rule class.
+            """
+            try:
+                host = parameters["host"]
+            except (TypeError, KeyError) as error:
+                message = "Rule parameters must be a dictionary with 'host' key"
+                raise RuleParseError(message) from error
+
+            if not isinstance(host, str):
+                raise RuleParseError("Host must be a string")
+
+            return host_rule_class(rule_type=rule_type, host=host)
+
+        def _serializer(rule_type, rule):
+            # pylint: disable=unused-argument
+            """Serialize host rule.
+
+            :param rule_type: type of the rule.
+            :param rule: host rule.
+            :returns: dictionary with data.
+            """
+            try:
+                host = rule.host
+            except AttributeError as error:
+                raise RuleSerializeError("Host rule must have host attribute") from error
+
+            return {
+                "host": host,
+                }
+
+        self._rule_factory.register_rule(
+            rule_type=RuleType.HOST.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+    def prepare_header_rule(self, header_rule_class):
+        """Prepare header rule in the rule factory.
+
+        :param header_rule_class: class of the header rule.
+        """
+        def _parser(rule_type, parameters):
+            """Create header rule.
+
+            :param rule_type: type of the rule.
+            :param parameters: dictionary with parameters of the rule.
+            :returns: instance of configured header rule class.
+            """
+            try:
+                name = parameters["name"]
+                mode = parameters.get("mode", HeaderMatchMode.EXACT.name)
+            except (TypeError, KeyError, AttributeError) as error:
+                message = "Rule parameters must be a dictionary with 'name' key"
+                raise RuleParseError(message) from error
+
+            if not isinstance(name, str):
+                raise RuleParseError("Name must be a string")
+
+            if mode not in HeaderMatchMode.__members__:
+                raise RuleParseError("Unknown match mode '{0}'".format(mode))
+
+            value = parameters.get("value")
+            if mode != HeaderMatchMode.PRESENT.name and not isinstance(value, str):
+                raise RuleParseError("Value must be a string")
+
+            try:
+                return header_rule_class(rule_type=rule_type, name=name, value=value, mode=mode)
+            except re.error as error:
+                raise RuleParseError("Pattern can't be compiled") from error
+
+        def _serializer(rule_type, rule):
+            # pylint: disable=unused-argument
+            """Serialize header rule.
+
+            :param rule_type: type of the rule.
+            :param rule: header rule.
+            :returns: dictionary with data.
+            """
+            try:
+                name = rule.name
+                value = rule.value
+                mode = rule.mode
+            except AttributeError as error:
+                message = "Header rule must have attributes 'name', 'value' and 'mode'"
+                raise RuleSerializeError(message) from error
+
+            return {
+                "name": name,
+                "value": value,
+                "mode": mode,
+                }
+
+        self._rule_factory.register_rule(
+            rule_type=RuleType.HEADER.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+    def prepare_query_rule(self, query_rule_class):
+        """Prepare query rule in the rule factory.
+
+        :param query_rule_class: class of the query rule.
+        """
+        def _parser(rule_type, parameters):
+            """Create query rule.
+
+            :param rule_type: type of the rule.
+            :param parameters: dictionary with parameters of the rule.
+            :returns: instance of configured query rule class.
+            """
+            try:
+                name = parameters["name"]
+                value = parameters.get("value")
+            except (TypeError, KeyError, AttributeError) as error:
+                message = "Rule parameters must be a dictionary with 'name' key"
+                raise RuleParseError(message) from error
+
+            if not isinstance(name, str):
+                raise RuleParseError("Name must be a string")
+
+            if value is not None and not isinstance(value, str):
+                raise RuleParseError("Value must be a string")
+
+            return query_rule_class(rule_type=rule_type, name=name, value=value)
+
+        def _serializer(rule_type, rule):
+            # pylint: disable=unused-argument
+            """Serialize query rule.
+
+            :param rule_type: type of the rule.
+            :param rule: query rule.
+            :returns: dictionary with data.
+            """
+            try:
+                name = rule.name
+                value = rule.value
+            except AttributeError as error:
+                message = "Query rule must have attributes 'name' and 'value'"
+                raise RuleSerializeError(message) from error
+
+            return {
+                "name": name,
+                "value": value,
+                }
+
+        self._rule_factory.register_rule(
+            rule_type=RuleType.QUERY.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+    def prepare_json_body_rule(self, json_body_rule_class):
+        """Prepare JSON body rule in the rule factory.
+
+        :param json_body_rule_class: class of the JSON body rule.
+        """
+        def _parser(rule_type, parameters):
+            """Create JSON body rule.
+
+            :param rule_type: type of the rule.
+            :param parameters: dictionary with parameters of the rule.
+            :returns: instance of configured JSON body rule class.
+            """
+            try:
+                value = parameters["value"]
+                path = parameters.get("path", "$")
+            except (TypeError, KeyError, AttributeError) as error:
+                message = "Rule parameters must be a dictionary with 'value' key"
+                raise RuleParseError(message) from error
+
+            if not isinstance(path, str):
+                raise RuleParseError("Path must be a string")
+
+            try:
+                return json_body_rule_class(rule_type=rule_type, value=value, path=path)
+            except ValueError as error:
+                raise RuleParseError("Path can't be parsed") from error
+
+        def _serializer(rule_type, rule):
+            # pylint: disable=unused-argument
+            """Serialize JSON body rule.
+
+            :param rule_type: type of the rule.
+            :param rule: JSON body rule.
+            :returns: dictionary with data.
+            """
+            try:
+                value = rule.value
+                path = rule.path
+            except AttributeError as error:
+                message = "JSON body rule must have attributes 'value' and 'path'"
+                raise RuleSerializeError(message) from error
+
+            return {
+                "value": value,
+                "path": path,
+                }
+
+        self._rule_factory.register_rule(
+            rule_type=RuleType.JSON_BODY.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+    def prepare_body_digest_rule(self, body_digest_rule_class):
+        """Prepare body digest rule in the rule factory.
+
+        The rule is parsed either from the hexadecimal SHA-256 digest of the body or from
+        the body itself, encoded with base64. Only the digest is kept and serialized.
+
+        :param body_digest_rule_class: class of the body digest rule.
+        """
+        def _parser(rule_type, parameters):
+            """Create body digest rule.
+
+            :param rule_type: type of the rule.
+            :param parameters: dictionary with parameters of the rule.
+            :returns: instance of configured body digest rule class.
+            """
+            message = "Rule parameters must be a dictionary with 'digest' or 'body' key"
+            try:
+                digest = parameters.get("digest")
+                encoded_body = parameters.get("body")
+            except AttributeError as error:
+                raise RuleParseError(message) from error
+
+            if digest is None:
+                if encoded_body is None:
+                    raise RuleParseError(message)
+
+                try:
+                    body = base64.b64decode(encoded_body.encode("utf8"))
+                except (AttributeError, binascii.Error) as error:
+                    message = "Body can't be decoded with base64 encoding"
+                    raise RuleParseError(message) from error
+                digest = hashlib.sha256(body).hexdigest()
+
+            if not isinstance(digest, str) or not _SHA256_DIGEST.fullmatch(digest):
+                raise RuleParseError("Digest must be a hexadecimal SHA-256 digest")
+
+            return body_digest_rule_class(rule_type=rule_type, digest=digest.lower())
+
+        def _serializer(rule_type, rule):
+            # pylint: disable=unused-argument
+            """Serialize body digest rule.
+
+            :param rule_type: type of the rule.
+            :param rule: body digest rule.
+            :returns: dictionary with data.
+            """
+            try:
+                digest = rule.digest
+            except AttributeError as error:
+                raise RuleSerializeError("Body digest rule must have digest attribute") from error
+
+            return {
+                "digest": digest,
+                }
+
+        self._rule_factory.register_rule(
+            rule_type=RuleType.BODY_DIGEST.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
     def prepare_composite_rule(self, composite_rule_class):
         """Prepare composite rule in the rule factory.
 
@@ -164,6 +555,10 @@ class ResponseFactoryPreparator:
     def prepare_fixed_response(self, fixed_response_class):
         """Prepare fixed response in the response factory.
 
+        Compression is optional. Keyword argument ``compress`` is passed to the class and
+        serialized only if compression is enabled, so classes without compression are
+        supported too.
+
         :param fixed_response_class: class of the fixed response.
         """
         def _parser(response_type, parameters):
@@ -189,11 +584,17 @@ class ResponseFactoryPreparator:
                 message = "Body can't be decoded with base64 encoding"
                 raise ResponseParseError(message) from error
 
+            compress = parameters.get("compress", False)
+            if not isinstance(compress, bool):
+                raise ResponseParseError("Compress flag must be a boolean")
+
+            options = {"compress": True} if compress else {}
             return fixed_response_class(
                 response_type=response_type,
                 body=body,
                 status=status,
                 headers=headers,
+                **options
                 )
 
         def _serializer(response_type, response):
@@ -221,14 +622,355 @@ class ResponseFactoryPreparator:
                 message = "Body can't be encoded with base64 encoding"
                 raise ResponseSerializeError(message) from error
 
-            return {
+            data = {
                 "body": encoded_body,
                 "status": status,
                 "headers": headers,
                 }
+            if getattr(response, "compress", False):
+                data["compress"] = True
+
+            return data
 
         self._response_factory.register_response(
             response_type=ResponseType.FIXED.name,
             parser=_parser,
             serializer=_serializer,
             )
+
+    def prepare_file_response(self, file_response_class, root=None):
+        """Prepare file response in the response factory.
+
+        :param file_response_class: class of the file response.
+        :param root: directory with files for the responses. It is passed to the file
+            response class, which resolves paths relative to it and rejects files outside
+            of it. Any file can be used if not specified.
+        """
+        def _parser(response_type, parameters):
+            """Create file response.
+
+            :param response_type: type of the response.
+            :param parameters: dictionary with parameters of the response.
+            :returns: instance of configured file response class.
+            """
+            try:
+                path = parameters["path"]
+                status = parameters["status"]
+                headers = parameters["headers"]
+            except (TypeError, KeyError) as error:
+                message = (
+                    "Response parameters must be a dictionary with keys 'path', 'status', 'headers'"
+                    )
+                raise ResponseParseError(message) from error
+
+            if not isinstance(path, str):
+                raise ResponseParseError("Path must be a string")
+
+            options = {"root": root} if root is not None else {}
+            try:
+                return file_response_class(
+                    response_type=response_type,
+                    path=path,
+                    status=status,
+                    headers=headers,
+                    **options
+                    )
+            except OSError as error:
+                raise ResponseParseError("File can't be accessed") from error
+            except ValueError as error:
+                if root is None:
+                    raise ResponseParseError("File can't be accessed") from error
+                raise ResponseParseError("File must be inside the root directory") from error
+
+        def _serializer(response_type, response):
+            # pylint: disable=unused-argument
+            """Serialize file response.
+
+            :param response_type: type of the response.
+            :param response: file response.
+            :returns: dictionary with data.
+            """
+            try:
+                path = response.path
+                status = response.status
+                headers = response.headers
+            except AttributeError as error:
+                message = "Response must have attributes 'path', 'status' and 'headers'"
+                raise ResponseSerializeError(message) from error
+
+            return {
+                "path": path,
+                "status": status,
+                "headers": headers,
+                }
+
+        self._response_factory.register_response(
+            response_type=ResponseType.FILE.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+    def prepare_stream_response(self, stream_response_class):
+        # pylint: disable=too-many-statements
+        """Prepare stream response in the response factory.
+
+        Body of the response is either a list of chunks or a pattern repeated until
+        the total size is reached. Chunks of the pattern are prepared in memory, so their
+        size must not exceed :data:`MAX_CHUNK_SIZE` bytes.
+
+        :param stream_response_class: class of the stream response.
+        """
+        def _parser(response_type, parameters):
+            """Create stream response.
+
+            :param response_type: type of the response.
+            :param parameters: dictionary with parameters of the response.
+            :returns: instance of configured stream response class.
+            """
+            message = (
+                "Response parameters must be a dictionary with keys 'status', 'headers' "
+                "and either 'chunks' or 'pattern'"
+                )
+            try:
+                status = parameters["status"]
+                headers = parameters["headers"]
+                encoded_chunks = parameters.get("chunks")
+                encoded_pattern = parameters.get("pattern")
+            except (TypeError, KeyError, AttributeError) as error:
+                raise ResponseParseError(message) from error
+
+            if (encoded_chunks is None) == (encoded_pattern is None):
+                raise ResponseParseError(message)
+
+            if encoded_chunks is not None:
+                message = "Chunks must be a list of strings encoded with base64 encoding"
+                if not isinstance(encoded_chunks, list):
+                    raise ResponseParseError(message)
+
+                try:
+                    chunks = [base64.b64decode(chunk.encode("utf8")) for chunk in encoded_chunks]
+                except (AttributeError, binascii.Error) as error:
+                    raise ResponseParseError(message) from error
+
+                return stream_response_class(
+                    response_type=response_type,
+                    status=status,
+                    headers=headers,
+                    chunks=chunks,
+                    )
+
+            try:
+                pattern = base64.b64decode(encoded_pattern.encode("utf8"))
+            except (AttributeError, binascii.Error) as error:
+                message = "Pattern can't be decoded with base64 encoding"
+                raise ResponseParseError(message) from error
+
+            if not pattern:
+                raise ResponseParseError("Pattern must not be empty")
+
+            chunk_size = parameters.get("chunk_size")
+            if not _is_integer(chunk_size) or chunk_size <= 0:
+                raise ResponseParseError("Chunk size must be a positive integer")
+
+            if chunk_size > MAX_CHUNK_SIZE:
+                message = "Chunk size must not be greater than {0}".format(MAX_CHUNK_SIZE)
+                raise ResponseParseError(message)
+
+            total_size = parameters.get("total_size")
+            if not _is_integer(total_size) or total_size < 0:
+                raise ResponseParseError("Total size must be a non-negative integer")
+
+            return stream_response_class(
+                response_type=response_type,
+                status=status,
+                headers=headers,
+                pattern=pattern,
+                chunk_size=chunk_size,
+                total_size=total_size,
+                )
+
+        def _serializer(response_type, response):
+            # pylint: disable=unused-argument
+            """Serialize stream response.
+
+            :param response_type: type of the response.
+            :param response: stream response.
+            :returns: dictionary with data.
+            """
+            try:
+                status = response.status
+                headers = response.headers
+                chunks = response.chunks
+                pattern = response.pattern
+                chunk_size = response.chunk_size
+                total_size = response.total_size
+            except AttributeError as error:
+                message = (
+                    "Response must have attributes 'status', 'headers', 'chunks', 'pattern', "
+                    "'chunk_size' and 'total_size'"
+                    )
+                raise ResponseSerializeError(message) from error
+
+            data = {
+                "status": status,
+                "headers": headers,
+                }
+
+            try:
+                if chunks is not None:
+                    data["chunks"] = [
+                        base64.b64encode(_encode_body(chunk)).decode("utf8") for chunk in chunks
+                        ]
+                else:
+                    data["pattern"] = base64.b64encode(_encode_body(pattern)).decode("utf8")
+                    data["chunk_size"] = chunk_size
+                    data["total_size"] = total_size
+            except TypeError as error:
+                message = "Body can't be encoded with base64 encoding"
+                raise ResponseSerializeError(message) from error
+
+            return data
+
+        self._response_factory.register_response(
+            response_type=ResponseType.STREAM.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+    def prepare_template_response(self, template_response_class, base_url=None):
+        """Prepare template response in the response factory.
+
+        :param template_response_class: class of the template response.
+        :param base_url: base url for dynamically configured endpoints. It is passed to
+            the template response class, so that segments of the path are counted after it.
+        """
+        def _parser(response_type, parameters):
+            """Create template response.
+
+            :param response_type: type of the response.
+            :param parameters: dictionary with parameters of the response.
+            :returns: instance of configured template response class.
+            """
+            try:
+                template = parameters["template"]
+                status = parameters["status"]
+                headers = parameters["headers"]
+            except (TypeError, KeyError) as error:
+                message = (
+                    "Response parameters must be a dictionary with keys "
+                    "'template', 'status' and 'headers'"
+                    )
+                raise ResponseParseError(message) from error
+
+            if not isinstance(template, str):
+                raise ResponseParseError("Template must be a string")
+
+            options = {"base_url": base_url} if base_url is not None else {}
+            try:
+                return template_response_class(
+                    response_type=response_type,
+                    template=template,
+                    status=status,
+                    headers=headers,
+                    **options
+                    )
+            except ValueError as error:
+                raise ResponseParseError("Template can't be compiled") from error
+
+        def _serializer(response_type, response):
+            # pylint: disable=unused-argument
+            """Serialize template response.
+
+            :param response_type: type of the response.
+            :param response: template response.
+            :returns: dictionary with data.
+            """
+            try:
+                template = response.template
+                status = response.status
+                headers = response.headers
+            except AttributeError as error:
+                message = "Response must have attributes 'template', 'status' and 'headers'"
+                raise ResponseSerializeError(message) from error
+
+            return {
+                "template": template,
+                "status": status,
+                "headers": headers,
+                }
+
+        self._response_factory.register_response(
+            response_type=ResponseType.TEMPLATE.name,
+            parser=_parser,
+            serializer=_serializer,
+            )
+
+
+def _supports_scoped_flags():
+    """Check if inline flags can be scoped to a group, which requires Python 3.6.
+
+    :returns: boolean if scoped inline flags are supported.
+    """
+    try:
+        re.compile("(?i:)")
+    except re.error:
+        return False
+    return True
+
+
+_SCOPED_FLAGS_SUPPORTED = _supports_scoped_flags()
+
+
+def _join_pattern(base_url, pattern):
+    """Prepend the escaped base url to the pattern wrapped in a non-capturing group.
+
+    Leading inline flags, that apply to the whole pattern, are moved into the group,
+    because global flags are allowed only at the start of the expression. If scoped flags
+    are not supported, the flags are kept global and placed before the base url.
+
+    :param base_url: base url for dynamically configured endpoints.
+    :param pattern: string with a regular expression.
+    :returns: string with the joined regular expression.
+    """
+    flags = ""
+    match = _LEADING_FLAGS.match(pattern)
+    while match is not None:
+        flags += match.group(1)
+        pattern = pattern[match.end():]
+        match = _LEADING_FLAGS.match(pattern)
+
+    if not flags:
+        return "{base_url}(?:{pattern})".format(base_url=re.escape(base_url), pattern=pattern)
+
+    if _SCOPED_FLAGS_SUPPORTED:
+        return "{base_url}(?{flags}:{pattern})".format(
+            base_url=re.escape(base_url),
+            flags=flags,
+            pattern=pattern,
+            )
+
+    return "(?{flags}){base_url}(?:{pattern})".format(
+        flags=flags,
+        base_url=re.escape(base_url),
+        pattern=pattern,
+        )
+
+
+def _is_integer(value):
+    """Check if the value is an integer, but not a boolean.
+
+    :param value: value to check.
+    :returns: boolean if the value is an integer.
+    """
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _encode_body(body):
+    """Encode string body with UTF-8.
+
+    :param body: string or bytes.
+    :returns: bytes of the body.
+    """
+    if isinstance(body, str):
+        return body.encode("utf8")
+    return body
@@ -6,10 +6,28 @@ import enum
 class RuleType(enum.Enum):
     """Default rule types."""
     PATH = "path"
+    PATH_PREFIX = "path_prefix"
+    PATH_REGEX = "path_regex"
     METHOD = "method"
+    HOST = "host"
+    HEADER = "header"
+    QUERY = "query"
+    JSON_BODY = "json_body"
+    BODY_DIGEST = "body_digest"
     COMPOSITE = "composite"
 
 
+class HeaderMatchMode(enum.Enum):
+    """Modes to match values of the headers."""
+    EXACT = "exact"
+    PREFIX = "prefix"
+    REGEX = "regex"
+    PRESENT = "present"
+
+
 class ResponseType(enum.Enum):
     """Default response types."""
     FIXED = "fixed"
+    FILE = "file"
+    STREAM = "stream"
+    TEMPLATE = "template"
@@ -15,7 +15,11 @@ def configure_application(
         response_factory=None,
         base_endpoint=DEFAULT_BASE_ENDPOINT,
         configuration_endpoint=DEFAULT_CONFIGURATION_ENDPOINT,
+        core_manager=None,
+        file_root=None,
+        unrestricted_files=False,
     ):
+    # pylint: disable=too-many-arguments
     """Configure application with default factories.
 
     :param rule_factory: :class:`RuleFactory <looseserver.common.rule.RuleFactory>`
@@ -24,6 +28,14 @@ def configure_application(
         to parse and serialize responses. Default response factory is used if not specified.
     :param base_endpoint: string with base endpoint for configured routes.
     :param configuration_endpoint: string with endpoint to configure routes.
+    :param core_manager: :class:`Manager <looseserver.server.core.Manager>` to manage
+        configured routes. New manager for the base endpoint is created if not specified.
+    :param file_root: directory with files for file responses of the default response
+        factory. File responses are disabled if neither the directory is specified
+        nor unrestricted access to the files is allowed.
+    :param unrestricted_files: boolean if file responses of the default response factory
+        can use any file readable by the server. It is ignored if the root directory
+        is specified.
     :returns: configured application, created by
         :meth:`configure_application <looseserver.server.application.configure_application>`.
     """
@@ -33,11 +45,16 @@ def configure_application(
     if rule_factory is None:
         rule_factory = create_rule_factory(base_url=base_endpoint)
     if response_factory is None:
-        response_factory = create_response_factory()
+        response_factory = create_response_factory(
+            base_url=base_endpoint,
+            file_root=file_root,
+            unrestricted_files=unrestricted_files,
+            )
 
     return main_configure_application(
         rule_factory=rule_factory,
         response_factory=response_factory,
         base_endpoint=base_endpoint,
         configuration_endpoint=configuration_endpoint,
+        core_manager=core_manager,
         )
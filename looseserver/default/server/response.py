@@ -1,24 +1,295 @@
 """Default server responses."""
 
+import gzip
+import hashlib
+import io
+import itertools
 import logging
+import mimetypes
+import os
+import re
+import string
+import uuid
+import zlib
+from collections import namedtuple
 from copy import copy
 
 import flask
+from werkzeug.datastructures import Headers
+from werkzeug.http import quote_etag
+from werkzeug.utils import get_content_type
+from werkzeug.wsgi import ClosingIterator, wrap_file
 
 from looseserver.server.response import ServerResponse
 from looseserver.common.response import ResponseFactory
 from looseserver.default.common.configuration import ResponseFactoryPreparator
 
 
+_PrebuiltParts = namedtuple("_PrebuiltParts", "status headers wsgi_headers body is_empty")
+_Variant = namedtuple("_Variant", "parts etag not_modified_parts")
+_Placeholder = namedtuple("_Placeholder", "position source key")
+
+_PLACEHOLDER_FIELD = re.compile(r"(path|query|header)\[([^\[\]]+)\]\Z")
+
+_FILE_BUFFER_SIZE = 64 * 1024
+
+
+def _prebuild_parts(response):
+    """Build the parts of the response, that do not depend on the request.
+
+    :param response: instance of :class:flask.Response.
+    :returns: instance of :class:`_PrebuiltParts`.
+    """
+    return _PrebuiltParts(
+        status=response.status,
+        headers=tuple(response.headers.to_wsgi_list()),
+        wsgi_headers=tuple(response.get_wsgi_headers(environ={}).to_wsgi_list()),
+        body=(response.get_data(), ),
+        is_empty=_has_no_body(response.status_code),
+        )
+
+
+def _has_no_body(status_code):
+    """Check if responses with the status code must not have a body.
+
+    :param status_code: integer status code.
+    :returns: boolean if the body must not be sent.
+    """
+    return 100 <= status_code < 200 or status_code in (204, 304)
+
+
+def _prebuild_variant(response):
+    """Prebuild the variant of the response and the response for conditional requests.
+
+    Successful response gets a strong ETag computed from its body, if it has no ETag,
+    and advertises support of byte ranges.
+
+    :param response: instance of :class:flask.Response.
+    :returns: instance of :class:`_Variant`.
+    """
+    if response.status_code != 200:
+        return _Variant(parts=_prebuild_parts(response), etag=None, not_modified_parts=None)
+
+    etag, _ = response.get_etag()
+    if etag is None:
+        etag = hashlib.sha256(response.get_data()).hexdigest()
+        response.set_etag(etag)
+
+    if "Accept-Ranges" not in response.headers:
+        response.accept_ranges = "bytes"
+
+    not_modified_response = flask.Response(status=304, headers=Headers(response.headers))
+    return _Variant(
+        parts=_prebuild_parts(response),
+        etag=etag,
+        not_modified_parts=_prebuild_parts(not_modified_response),
+        )
+
+
+def _compress(body):
+    """Compress the body with gzip.
+
+    Modification time is not written, so the same body is always compressed the same way.
+
+    :param body: bytes to compress.
+    :returns: compressed bytes.
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as gzip_file:
+        gzip_file.write(body)
+    return buffer.getvalue()
+
+
+def _get_byte_ranges(request, etag, size):
+    """Get byte ranges of the body requested with the Range header.
+
+    Ranges are ignored for other methods than GET, for unknown units, for invalid,
+    overlapping or unordered ranges and if the If-Range header does not contain
+    the ETag of the body.
+
+    :param request: instance of :class:flask.Request.
+    :param etag: strong ETag of the body.
+    :param size: size of the body.
+    :returns: None if the full body should be sent, otherwise list of pairs
+        (start, stop) with offsets of the satisfiable ranges.
+    """
+    if request.method != "GET" or "Range" not in request.headers:
+        return None
+
+    byte_range = request.range
+    if byte_range is None or byte_range.units != "bytes":
+        return None
+
+    if_range = request.headers.get("If-Range")
+    if if_range is not None and if_range.strip() != quote_etag(etag):
+        return None
+
+    ranges = []
+    for start, stop in byte_range.ranges:
+        if start < 0:
+            start, stop = max(size + start, 0), size
+        elif stop is None or stop > size:
+            stop = size
+
+        if start < stop:
+            ranges.append((start, stop))
+
+    return ranges
+
+
+def _build_range_parts(parts, ranges, size, read_range):
+    """Build parts of the response for the byte ranges of the body.
+
+    Single range is sent as the body of the response. Several ranges are sent as
+    parts of a ``multipart/byteranges`` body. If none of the ranges can be satisfied,
+    the response has 416 status.
+
+    :param parts: instance of :class:`_PrebuiltParts` of the response with the full body.
+    :param ranges: list of pairs (start, stop) returned by :func:`_get_byte_ranges`.
+    :param size: size of the full body.
+    :param read_range: function, that accepts offsets of a range and returns
+        iterable over bytes of the range.
+    :returns: pair (instance of :class:`_PrebuiltParts`, iterable over bytes of the body).
+        Iterable is None if the response has no body.
+    """
+    headers = Headers(parts.headers)
+    if not ranges:
+        headers.remove("Content-Type")
+        headers.remove("Content-Encoding")
+        headers["Content-Length"] = "0"
+        headers["Content-Range"] = "bytes */{size}".format(size=size)
+        response = flask.Response(status=416, headers=headers)
+        return _prebuild_parts(response), None
+
+    if len(ranges) == 1:
+        start, stop = ranges[0]
+        headers["Content-Length"] = str(stop - start)
+        headers["Content-Range"] = _format_content_range(start, stop, size)
+        response = flask.Response(status=206, headers=headers)
+        return _prebuild_parts(response), read_range(start, stop)
+
+    boundary = uuid.uuid4().hex
+    content_type = headers.get("Content-Type")
+    content_type_line = "" if content_type is None else "Content-Type: {0}\r\n".format(
+        content_type,
+        )
+
+    segments = []
+    length = 0
+    for start, stop in ranges:
+        delimiter = "\r\n--{boundary}\r\n{content_type}Content-Range: {range}\r\n\r\n".format(
+            boundary=boundary,
+            content_type=content_type_line,
+            range=_format_content_range(start, stop, size),
+            ).encode("latin-1")
+        segments.extend([(delimiter, ), read_range(start, stop)])
+        length += len(delimiter) + stop - start
+
+    closing_delimiter = "\r\n--{boundary}--\r\n".format(boundary=boundary).encode("latin-1")
+    segments.append((closing_delimiter, ))
+    length += len(closing_delimiter)
+
+    headers["Content-Length"] = str(length)
+    headers["Content-Type"] = "multipart/byteranges; boundary={boundary}".format(
+        boundary=boundary,
+        )
+    response = flask.Response(status=206, headers=headers)
+    return _prebuild_parts(response), itertools.chain.from_iterable(segments)
+
+
+def _format_content_range(start, stop, size):
+    """Format value of the Content-Range header.
+
+    :param start: offset of the first byte of the range.
+    :param stop: offset of the byte after the range.
+    :param size: size of the full body.
+    :returns: string value of the header.
+    """
+    return "bytes {start}-{end}/{size}".format(start=start, end=stop - 1, size=size)
+
+
+class _PrebuiltResponse(flask.Response):
+    """Response, that serves prebuilt status line, headers and body.
+
+    Headers are converted into :class:werkzeug.datastructures.Headers only on access.
+    If the response is not changed, it is served without further processing.
+
+    :param parts: instance of :class:`_PrebuiltParts`.
+    :param app_iter: iterable over bytes of the body to pass directly to the server
+        instead of the prebuilt body.
+    """
+
+    def __init__(self, parts, app_iter=None):
+        # pylint: disable=super-init-not-called
+        self._parts = parts
+        self._headers = None
+        self.status = parts.status
+        self.direct_passthrough = app_iter is not None
+        self._on_close = []
+        self._app_iter = parts.body if app_iter is None else app_iter
+        self.response = self._app_iter
+
+    @property
+    def headers(self):
+        """Headers of the response."""
+        if self._headers is None:
+            self._headers = Headers(self._parts.headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers):
+        self._headers = headers
+
+    def __call__(self, environ, start_response):
+        parts = self._parts
+        is_changed = (
+            self._headers is not None
+            or self.response is not self._app_iter
+            or self.status != parts.status
+            or self._on_close
+            )
+        if is_changed:
+            return super(_PrebuiltResponse, self).__call__(environ, start_response)
+
+        start_response(parts.status, list(parts.wsgi_headers))
+        if parts.is_empty or environ["REQUEST_METHOD"] == "HEAD":
+            self.close()
+            return ()
+        return self._app_iter
+
+
 class FixedResponse(ServerResponse):
-    """Class for fixed responses."""
+    """Class for fixed responses.
+
+    Status line, headers and body are prepared once, when the response is created.
+    Successful responses get a strong ETag computed from the body, unless the ETag
+    is specified in the headers, and conditional GET and HEAD requests with matching
+    ``If-None-Match`` header are answered with 304 status.
+
+    If compression is enabled, the body is also compressed with gzip once and
+    the compressed variant is served to the clients, that accept gzip encoding.
+
+    Successful responses to GET requests with ``Range`` header contain only
+    the requested byte ranges of the served variant.
+    """
 
-    def __init__(self, response_type, body, status, headers):
+    def __init__(self, response_type, body, status, headers, compress=False):
+        # pylint: disable=too-many-arguments
         super(FixedResponse, self).__init__(response_type=response_type)
         self._body = body
         self._status = status
         self._headers = {}
         self._headers.update(headers)
+        self._compress = compress
+
+        self._variant = None
+        self._gzip_variant = None
+        try:
+            self._prebuild()
+        except Exception:   # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("Failed to prebuild fixed response")
+            self._variant = None
+            self._gzip_variant = None
 
     @property
     def body(self):
@@ -35,29 +306,550 @@ class FixedResponse(ServerResponse):
         """Headers of the response."""
         return copy(self._headers)
 
+    @property
+    def compress(self):
+        """Flag if the body can be compressed."""
+        return self._compress
+
     def build_response(self, request, rule):
         # pylint: disable=unused-argument
         """Build a response.
 
-        :param request: instance of :class:flask.Request. Ignored.
+        :param request: instance of :class:flask.Request.
         :param rule: instance of :class:`Rule <looseserver.server.rule.ServerRule>`. Ignored.
         :returns: instance of :class:flask.Response.
         """
         logging.getLogger(__name__).debug("Build fixed response")
-        return flask.Response(response=self._body, status=self._status, headers=self._headers)
+        variant = self._variant
+        if variant is None:
+            return flask.Response(response=self._body, status=self._status, headers=self._headers)
+
+        if self._gzip_variant is not None and request.accept_encodings["gzip"]:
+            variant = self._gzip_variant
+
+        if variant.etag is None:
+            return _PrebuiltResponse(parts=variant.parts)
+
+        if _is_not_modified(request, variant.etag):
+            return _PrebuiltResponse(parts=variant.not_modified_parts)
+
+        body = variant.parts.body[0]
+        ranges = _get_byte_ranges(request, variant.etag, len(body))
+        if ranges is None:
+            return _PrebuiltResponse(parts=variant.parts)
+
+        parts, app_iter = _build_range_parts(
+            parts=variant.parts,
+            ranges=ranges,
+            size=len(body),
+            read_range=lambda start, stop: (body[start:stop], ),
+            )
+        return _PrebuiltResponse(parts=parts, app_iter=app_iter)
+
+    def _prebuild(self):
+        """Prebuild variants of the response.
+
+        Nothing is prebuilt if the headers depend on the request. Compressed variant is
+        prebuilt only if it is smaller than the body and the body is not encoded yet.
+        """
+        response = flask.Response(response=self._body, status=self._status, headers=self._headers)
+        if response.autocorrect_location_header and "Location" in response.headers:
+            return
+
+        body = response.get_data()
+        is_compressible = (
+            self._compress
+            and body
+            and "Content-Encoding" not in response.headers
+            and not _has_no_body(response.status_code)
+            )
+        compressed_body = _compress(body) if is_compressible else body
+        if len(compressed_body) < len(body):
+            response.vary.add("Accept-Encoding")
+            gzip_response = flask.Response(
+                response=compressed_body,
+                status=response.status,
+                headers=Headers(response.headers),
+                )
+            gzip_response.headers["Content-Encoding"] = "gzip"
+            gzip_response.headers.pop("ETag", None)
+            self._gzip_variant = _prebuild_variant(gzip_response)
+
+        self._variant = _prebuild_variant(response)
 
     def __repr__(self):
         return """{class_name}()""".format(class_name=self.__class__.__name__)
 
 
-def create_response_factory():
+class FileResponse(ServerResponse):
+    """Class for responses with the body read from a server-local file.
+
+    The file is passed to the WSGI server with ``wsgi.file_wrapper``, so the server can
+    send it without reading it into memory. Size and modification time of the file are
+    cached together with the prebuilt headers, which are rebuilt only if the opened file
+    differs from the cached one.
+
+    Successful responses get a strong ETag computed from the path, size and modification
+    time, unless the ETag is specified in the headers. Successful responses to GET requests
+    with ``Range`` header contain only the requested byte ranges, which are read from
+    the file at their offsets.
+
+    If the root directory is specified, the path is resolved relative to it every time
+    the file is opened, and files outside of it are rejected.
+
+    :raises: :class:OSError if the file can't be accessed.
+    :raises: :class:ValueError if the file is outside of the root directory.
+    """
+
+    def __init__(self, response_type, path, status, headers, root=None):
+        # pylint: disable=too-many-arguments
+        super(FileResponse, self).__init__(response_type=response_type)
+        self._path = path
+        self._status = status
+        self._headers = {}
+        self._headers.update(headers)
+        self._root = None if root is None else os.path.realpath(root)
+
+        file_path = self._resolve_path()
+        self._path_hash = zlib.adler32(os.path.abspath(file_path).encode("utf8"))
+        file_stat = os.stat(file_path)
+        self._cache = (_get_file_key(file_stat), self._prebuild(file_stat))
+
+    @property
+    def path(self):
+        """Path to the file with the body."""
+        return self._path
+
+    @property
+    def status(self):
+        """Status of the response."""
+        return self._status
+
+    @property
+    def headers(self):
+        """Headers of the response."""
+        return copy(self._headers)
+
+    def build_response(self, request, rule):
+        # pylint: disable=unused-argument
+        """Build a response.
+
+        :param request: instance of :class:flask.Request.
+        :param rule: instance of :class:`Rule <looseserver.server.rule.ServerRule>`. Ignored.
+        :returns: instance of :class:flask.Response.
+        :raises: :class:OSError if the file can't be opened.
+        :raises: :class:ValueError if the file is outside of the root directory.
+        """
+        logging.getLogger(__name__).debug("Build file response")
+        body_file = open(self._resolve_path(), "rb")     # pylint: disable=consider-using-with
+        try:
+            file_stat = os.fstat(body_file.fileno())
+            variant = self._get_variant(file_stat)
+        except Exception:
+            body_file.close()
+            raise
+
+        ranges = None
+        if variant.etag is not None:
+            if _is_not_modified(request, variant.etag):
+                body_file.close()
+                return _PrebuiltResponse(parts=variant.not_modified_parts)
+
+            ranges = _get_byte_ranges(request, variant.etag, file_stat.st_size)
+
+        if ranges is None:
+            app_iter = wrap_file(request.environ, body_file, buffer_size=_FILE_BUFFER_SIZE)
+            return _PrebuiltResponse(parts=variant.parts, app_iter=app_iter)
+
+        try:
+            parts, app_iter = _build_range_parts(
+                parts=variant.parts,
+                ranges=ranges,
+                size=file_stat.st_size,
+                read_range=lambda start, stop: _read_file_range(body_file, start, stop),
+                )
+        except Exception:
+            body_file.close()
+            raise
+
+        if app_iter is None:
+            body_file.close()
+            return _PrebuiltResponse(parts=parts)
+
+        return _PrebuiltResponse(parts=parts, app_iter=ClosingIterator(app_iter, body_file.close))
+
+    def _resolve_path(self):
+        """Resolve the path to the file relative to the root directory.
+
+        :returns: path to the file.
+        :raises: :class:ValueError if the file is outside of the root directory.
+        """
+        if self._root is None:
+            return self._path
+
+        file_path = os.path.realpath(os.path.join(self._root, self._path))
+        if os.path.commonpath((self._root, file_path)) != self._root:
+            raise ValueError("File must be inside the root directory")
+        return file_path
+
+    def _get_variant(self, file_stat):
+        """Get prebuilt variant of the response for the file.
+
+        :param file_stat: result of :func:os.stat for the file.
+        :returns: instance of :class:`_Variant`.
+        """
+        file_key = _get_file_key(file_stat)
+        cached_key, variant = self._cache
+        if cached_key != file_key:
+            variant = self._prebuild(file_stat)
+            self._cache = (file_key, variant)
+        return variant
+
+    def _prebuild(self, file_stat):
+        """Prebuild the response for the file.
+
+        :param file_stat: result of :func:os.stat for the file.
+        :returns: instance of :class:`_Variant`.
+        """
+        headers = Headers(self._headers)
+        if "Content-Type" not in headers:
+            mimetype = mimetypes.guess_type(self._path)[0] or "application/octet-stream"
+            headers["Content-Type"] = get_content_type(mimetype, "utf-8")
+
+        response = flask.Response(status=self._status, headers=headers)
+        response.headers["Content-Length"] = str(file_stat.st_size)
+        response.last_modified = file_stat.st_mtime
+
+        if response.status_code == 200 and response.get_etag()[0] is None:
+            response.set_etag("{mtime}-{size}-{path}".format(
+                mtime=file_stat.st_mtime_ns,
+                size=file_stat.st_size,
+                path=self._path_hash,
+                ))
+
+        return _prebuild_variant(response)
+
+    def __repr__(self):
+        return "{class_name}(path='{path}')".format(
+            class_name=self.__class__.__name__,
+            path=self._path,
+            )
+
+
+class StreamResponse(ServerResponse):
+    """Class for responses with the body streamed in chunks.
+
+    Body is either a list of chunks or a pattern repeated in chunks of the specified size
+    until the total size is reached. Chunks of the pattern are produced lazily, so memory
+    used by the response does not depend on the total size. Content length is not sent,
+    so the body is transferred with chunked encoding. Empty chunks are skipped, because
+    an empty chunk terminates the chunked body.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+            self,
+            response_type,
+            status,
+            headers,
+            chunks=None,
+            pattern=None,
+            chunk_size=None,
+            total_size=None,
+        ):
+        # pylint: disable=too-many-arguments
+        super(StreamResponse, self).__init__(response_type=response_type)
+        self._status = status
+        self._headers = {}
+        self._headers.update(headers)
+        self._chunks = None if chunks is None else tuple(_encode_body(chunk) for chunk in chunks)
+        self._pattern = None if pattern is None else _encode_body(pattern)
+        self._chunk_size = chunk_size
+        self._total_size = total_size
+
+        self._cycle = None
+        if self._pattern is not None:
+            repeats = -(-(chunk_size + len(self._pattern)) // len(self._pattern))
+            self._cycle = self._pattern * repeats
+
+        response = flask.Response(response=iter(()), status=status, headers=self._headers)
+        self._parts = _prebuild_parts(response)
+
+    @property
+    def status(self):
+        """Status of the response."""
+        return self._status
+
+    @property
+    def headers(self):
+        """Headers of the response."""
+        return copy(self._headers)
+
+    @property
+    def chunks(self):
+        """List of chunks or None if the body is a repeated pattern."""
+        return None if self._chunks is None else list(self._chunks)
+
+    @property
+    def pattern(self):
+        """Repeated pattern or None if the body is a list of chunks."""
+        return self._pattern
+
+    @property
+    def chunk_size(self):
+        """Size of the chunks of the pattern."""
+        return self._chunk_size
+
+    @property
+    def total_size(self):
+        """Total size of the body with the pattern."""
+        return self._total_size
+
+    def build_response(self, request, rule):
+        # pylint: disable=unused-argument
+        """Build a response.
+
+        :param request: instance of :class:flask.Request. Ignored.
+        :param rule: instance of :class:`Rule <looseserver.server.rule.ServerRule>`. Ignored.
+        :returns: instance of :class:flask.Response.
+        """
+        logging.getLogger(__name__).debug("Build stream response")
+        if self._chunks is not None:
+            app_iter = (chunk for chunk in self._chunks if chunk)
+        else:
+            app_iter = self._iterate_pattern()
+        return _PrebuiltResponse(parts=self._parts, app_iter=app_iter)
+
+    def _iterate_pattern(self):
+        """Iterate over chunks of the repeated pattern.
+
+        Chunks are sliced from the precomputed repetition of the pattern, that is
+        longer than a chunk, starting at the current phase of the pattern.
+        """
+        cycle = self._cycle
+        pattern_size = len(self._pattern)
+        chunk_size = self._chunk_size
+        for offset in range(0, self._total_size, chunk_size):
+            phase = offset % pattern_size
+            size = min(chunk_size, self._total_size - offset)
+            yield cycle[phase:phase + size]
+
+    def __repr__(self):
+        return "{class_name}()".format(class_name=self.__class__.__name__)
+
+
+class TemplateResponse(ServerResponse):
+    """Class for responses with the body rendered from a template.
+
+    Placeholders of the template are replaced with the fields of the request:
+
+    - ``{path[1]}`` is replaced with a segment of the request path after the base url,
+      segments are numbered from 0 and negative numbers count from the end of the path;
+    - ``{query[name]}`` is replaced with the first value of the query parameter;
+    - ``{header[Name]}`` is replaced with the value of the header.
+
+    Missing fields are replaced with empty strings. Braces are escaped by doubling them.
+    Content length is computed for every rendered body, so the specified one is ignored.
+
+    The template is compiled once into literal segments and placeholders, so rendering
+    only extracts the fields of the request and joins the segments.
+
+    :raises: :class:ValueError if the template can't be compiled.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, response_type, template, status, headers, base_url="/"):
+        # pylint: disable=too-many-arguments
+        super(TemplateResponse, self).__init__(response_type=response_type)
+        self._template = template
+        self._status = status
+        self._headers = {}
+        self._headers.update(headers)
+        self._base_url = base_url
+
+        self._segments, self._placeholders = _compile_template(template)
+        self._uses_path = any(placeholder.source == "path" for placeholder in self._placeholders)
+
+        headers = Headers(self._headers)
+        headers.pop("Content-Length", None)
+        response = flask.Response(response=iter(()), status=status, headers=headers)
+        self._parts = _prebuild_parts(response)
+
+    @property
+    def template(self):
+        """Template of the body."""
+        return self._template
+
+    @property
+    def status(self):
+        """Status of the response."""
+        return self._status
+
+    @property
+    def headers(self):
+        """Headers of the response."""
+        return copy(self._headers)
+
+    def build_response(self, request, rule):
+        # pylint: disable=unused-argument
+        """Build a response.
+
+        :param request: instance of :class:flask.Request.
+        :param rule: instance of :class:`Rule <looseserver.server.rule.ServerRule>`. Ignored.
+        :returns: instance of :class:flask.Response.
+        """
+        logging.getLogger(__name__).debug("Build template response")
+        segments = list(self._segments)
+        path_segments = self._get_path_segments(request.path) if self._uses_path else None
+        for placeholder in self._placeholders:
+            if placeholder.source == "path":
+                try:
+                    value = path_segments[placeholder.key]
+                except IndexError:
+                    value = ""
+            elif placeholder.source == "query":
+                value = request.args.get(placeholder.key, "")
+            else:
+                value = request.headers.get(placeholder.key, "")
+            segments[placeholder.position] = value
+
+        body = "".join(segments).encode("utf8")
+        parts = self._parts
+        if parts.is_empty:
+            return _PrebuiltResponse(parts=parts)
+
+        return _PrebuiltResponse(parts=parts._replace(
+            headers=parts.headers + (("Content-Length", str(len(body))), ),
+            wsgi_headers=parts.wsgi_headers + (("Content-Length", str(len(body))), ),
+            body=(body, ),
+            ))
+
+    def _get_path_segments(self, path):
+        """Split the request path after the base url into segments.
+
+        :param path: path of the request.
+        :returns: list of the segments.
+        """
+        if path.startswith(self._base_url):
+            return path[len(self._base_url):].split("/")
+        return path.lstrip("/").split("/")
+
+    def __repr__(self):
+        return "{class_name}()".format(class_name=self.__class__.__name__)
+
+
+def _compile_template(template):
+    """Compile the template into literal segments and placeholders.
+
+    :param template: string with the template.
+    :returns: pair (tuple of segments, tuple of :class:`_Placeholder`). Segments
+        at the positions of the placeholders are empty strings.
+    :raises: :class:ValueError if the template can't be compiled.
+    """
+    segments = []
+    placeholders = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if literal:
+            segments.append(literal)
+
+        if field is None:
+            continue
+
+        match = _PLACEHOLDER_FIELD.match(field)
+        if match is None or format_spec or conversion is not None:
+            raise ValueError("Unsupported placeholder '{0}'".format(field))
+
+        source, key = match.groups()
+        if source == "path":
+            try:
+                key = int(key)
+            except ValueError as error:
+                raise ValueError("Path segment number must be an integer") from error
+
+        placeholders.append(_Placeholder(position=len(segments), source=source, key=key))
+        segments.append("")
+
+    return tuple(segments), tuple(placeholders)
+
+
+def _encode_body(body):
+    """Encode string body with UTF-8.
+
+    :param body: string or bytes.
+    :returns: bytes of the body.
+    """
+    if isinstance(body, str):
+        return body.encode("utf8")
+    return body
+
+
+def _read_file_range(body_file, start, stop):
+    """Read the range of the file in chunks.
+
+    :param body_file: file object opened in binary mode.
+    :param start: offset of the first byte of the range.
+    :param stop: offset of the byte after the range.
+    """
+    body_file.seek(start)
+    remaining = stop - start
+    while remaining > 0:
+        chunk = body_file.read(min(remaining, _FILE_BUFFER_SIZE))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _get_file_key(file_stat):
+    """Get key of the file version.
+
+    :param file_stat: result of :func:os.stat for the file.
+    :returns: tuple with size and modification time of the file.
+    """
+    return (file_stat.st_size, file_stat.st_mtime_ns)
+
+
+def _is_not_modified(request, etag):
+    """Check if the request is a conditional request for the unchanged body.
+
+    :param request: instance of :class:flask.Request.
+    :param etag: ETag of the body.
+    :returns: boolean if the response is not modified.
+    """
+    if request.method not in ("GET", "HEAD") or "If-None-Match" not in request.headers:
+        return False
+
+    return request.if_none_match.contains_weak(etag)
+
+
+def create_response_factory(base_url="/", file_root=None, unrestricted_files=False):
     """Create and prepare response factory.
 
+    Clients of the configuration API are not authenticated, so file responses are
+    registered only if the root directory for the files is specified or unrestricted
+    access to the files is allowed explicitly.
+
+    :param base_url: base url for dynamically configured routes. Segments of the path
+        in template responses are counted after it.
+    :param file_root: directory with files for file responses. Paths are resolved relative
+        to it and files outside of it are rejected.
+    :param unrestricted_files: boolean if file responses can use any file readable by
+        the server. It is ignored if the root directory is specified.
     :returns: instance of :class:`ResponseFactory <looseserver.common.response.ResponseFactory>`.
     """
     response_factory = ResponseFactory()
 
     server_factory_preparator = ResponseFactoryPreparator(response_factory=response_factory)
     server_factory_preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+    if file_root is not None or unrestricted_files:
+        server_factory_preparator.prepare_file_response(
+            file_response_class=FileResponse,
+            root=file_root,
+            )
+    server_factory_preparator.prepare_stream_response(stream_response_class=StreamResponse)
+    server_factory_preparator.prepare_template_response(
+        template_response_class=TemplateResponse,
+        base_url=base_url,
+        )
 
     return response_factory
@@ -1,16 +1,32 @@
 """Default server rules."""
 
+import json
 import logging
-from urllib.parse import urlparse
+import re
 
 from looseserver.server.rule import ServerRule
+from looseserver.server.request import (
+    PATH_FEATURE,
+    METHOD_FEATURE,
+    HOST_FEATURE,
+    BODY_DIGEST_FEATURE,
+    INVALID_JSON,
+    get_header_feature,
+    get_query_feature,
+    )
 from looseserver.common.rule import RuleFactory
+from looseserver.default.common.constants import HeaderMatchMode
 from looseserver.default.common.configuration import RuleFactoryPreparator
 
 
+_JSON_PATH_STEP = re.compile(r"""\.([^.\[\]"]+)|\[(\d+)\]|\[("(?:[^"\\]|\\.)*")\]""")
+
+
 class PathRule(ServerRule):
     """Rule to match requests by path."""
 
+    uses_request_view = True
+
     def __init__(self, rule_type, path):
         super(PathRule, self).__init__(rule_type)
         self._path = path
@@ -20,14 +36,30 @@ class PathRule(ServerRule):
         """Path to match."""
         return self._path
 
+    @property
+    def index_keys(self):
+        """Exact request features required by the rule."""
+        return ((PATH_FEATURE, self._path), )
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((PATH_FEATURE, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return (PATH_FEATURE, self._path)
+
     def is_match_found(self, request):
         """Check if requested url matches the path of the rule.
 
-        :param request: incoming :class:flask.Request.
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
         :returns: boolean if match is found.
         """
         logging.getLogger(__name__).debug("Check request with %s", self)
-        return urlparse(request.base_url).path == self._path
+        return request.path == self._path
 
     def __repr__(self):
         return "{class_name}(path='{path}')".format(
@@ -36,9 +68,108 @@ class PathRule(ServerRule):
             )
 
 
+class PathPrefixRule(ServerRule):
+    """Rule to match requests by prefix of the path."""
+
+    uses_request_view = True
+
+    def __init__(self, rule_type, prefix):
+        super(PathPrefixRule, self).__init__(rule_type)
+        self._prefix = prefix
+
+    @property
+    def prefix(self):
+        """Prefix of the path to match."""
+        return self._prefix
+
+    @property
+    def prefix_keys(self):
+        """Prefixes of request features required by the rule."""
+        return ((PATH_FEATURE, self._prefix), )
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((PATH_FEATURE, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return ("path_prefix", self._prefix)
+
+    def is_match_found(self, request):
+        """Check if requested url starts with the prefix of the rule.
+
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
+        :returns: boolean if match is found.
+        """
+        logging.getLogger(__name__).debug("Check request with %s", self)
+        return request.path.startswith(self._prefix)
+
+    def __repr__(self):
+        return "{class_name}(prefix='{prefix}')".format(
+            class_name=self.__class__.__name__,
+            prefix=self._prefix,
+            )
+
+
+class PathRegexRule(ServerRule):
+    """Rule to match requests by regular expression of the path.
+
+    The expression is compiled once, when the rule is created, and must match
+    the whole path.
+    """
+
+    uses_request_view = True
+
+    def __init__(self, rule_type, pattern):
+        super(PathRegexRule, self).__init__(rule_type)
+        self._pattern = pattern
+        self._regex = re.compile(pattern)
+
+    @property
+    def pattern(self):
+        """Regular expression to match the path."""
+        return self._pattern
+
+    @property
+    def regex_keys(self):
+        """Regular expressions of request features checked by the rule."""
+        return ((PATH_FEATURE, self._regex), )
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((PATH_FEATURE, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return ("path_regex", self._pattern)
+
+    def is_match_found(self, request):
+        """Check if the regular expression of the rule matches requested url.
+
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
+        :returns: boolean if match is found.
+        """
+        logging.getLogger(__name__).debug("Check request with %s", self)
+        return request.match_regex(PATH_FEATURE, self._regex)
+
+    def __repr__(self):
+        return "{class_name}(pattern='{pattern}')".format(
+            class_name=self.__class__.__name__,
+            pattern=self._pattern,
+            )
+
+
 class MethodRule(ServerRule):
     """Rule to match requests by method."""
 
+    uses_request_view = True
+
     def __init__(self, rule_type, method):
         super(MethodRule, self).__init__(rule_type)
         self._method = method.upper()
@@ -48,10 +179,26 @@ class MethodRule(ServerRule):
         """Method to match."""
         return self._method
 
+    @property
+    def index_keys(self):
+        """Exact request features required by the rule."""
+        return ((METHOD_FEATURE, self._method), )
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((METHOD_FEATURE, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return (METHOD_FEATURE, self._method)
+
     def is_match_found(self, request):
         """Check if requested method matches the method of the rule.
 
-        :param request: incoming :class:flask.Request.
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
         :returns: boolean if match is found.
         """
         logging.getLogger(__name__).debug("Check request with %s", self)
@@ -64,9 +211,389 @@ class MethodRule(ServerRule):
             )
 
 
+class HostRule(ServerRule):
+    """Rule to match requests by host name.
+
+    Rules with hosts are partitioned by the host in the index, so the rules of one host
+    are not checked for requests to other hosts.
+    """
+
+    uses_request_view = True
+
+    def __init__(self, rule_type, host):
+        super(HostRule, self).__init__(rule_type)
+        self._host = host.lower()
+
+    @property
+    def host(self):
+        """Host name to match."""
+        return self._host
+
+    @property
+    def index_keys(self):
+        """Exact request features required by the rule."""
+        return ((HOST_FEATURE, self._host), )
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((HOST_FEATURE, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return (HOST_FEATURE, self._host)
+
+    def is_match_found(self, request):
+        """Check if requested host matches the host of the rule.
+
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
+        :returns: boolean if match is found.
+        """
+        logging.getLogger(__name__).debug("Check request with %s", self)
+        return request.host == self._host
+
+    def __repr__(self):
+        return "{class_name}(host='{host}')".format(
+            class_name=self.__class__.__name__,
+            host=self._host,
+            )
+
+
+class HeaderRule(ServerRule):
+    """Rule to match requests by a header.
+
+    Name of the header is case-insensitive. Value is matched according to the mode:
+    exactly, by prefix, by regular expression, that must match the whole value,
+    or only presence of the header is checked.
+    """
+
+    uses_request_view = True
+
+    def __init__(self, rule_type, name, value=None, mode=HeaderMatchMode.EXACT.name):
+        super(HeaderRule, self).__init__(rule_type)
+        self._name = name.lower()
+        self._value = value
+        self._mode = HeaderMatchMode[mode]
+        self._feature = get_header_feature(name)
+        self._regex = None
+        if self._mode == HeaderMatchMode.REGEX:
+            self._regex = re.compile(value)
+
+    @property
+    def name(self):
+        """Lowercased name of the header."""
+        return self._name
+
+    @property
+    def value(self):
+        """Value to match."""
+        return self._value
+
+    @property
+    def mode(self):
+        """Name of the match mode."""
+        return self._mode.name
+
+    @property
+    def index_keys(self):
+        """Exact request features required by the rule."""
+        if self._mode == HeaderMatchMode.EXACT:
+            return ((self._feature, self._value), )
+        return ()
+
+    @property
+    def regex_keys(self):
+        """Regular expressions of request features checked by the rule."""
+        if self._regex is not None:
+            return ((self._feature, self._regex), )
+        return ()
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((self._feature, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        if self._mode == HeaderMatchMode.EXACT:
+            return (self._feature, self._value)
+        return (self._feature, self._mode.name, self._value)
+
+    def is_match_found(self, request):
+        """Check if the header of the request matches the rule.
+
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
+        :returns: boolean if match is found.
+        """
+        logging.getLogger(__name__).debug("Check request with %s", self)
+        if self._regex is not None:
+            return request.match_regex(self._feature, self._regex)
+
+        value = request.get_feature(self._feature)
+        if value is None:
+            return False
+
+        if self._mode == HeaderMatchMode.PRESENT:
+            return True
+
+        if self._mode == HeaderMatchMode.PREFIX:
+            return value.startswith(self._value)
+
+        return value == self._value
+
+    def __repr__(self):
+        return "{class_name}(name='{name}', value={value!r}, mode='{mode}')".format(
+            class_name=self.__class__.__name__,
+            name=self._name,
+            value=self._value,
+            mode=self._mode.name,
+            )
+
+
+class QueryRule(ServerRule):
+    """Rule to match requests by a query parameter.
+
+    If the value is not specified, only presence of the parameter is checked. Only the first
+    value of the repeated parameter is compared with the value of the rule.
+    """
+
+    uses_request_view = True
+
+    def __init__(self, rule_type, name, value=None):
+        super(QueryRule, self).__init__(rule_type)
+        self._name = name
+        self._value = value
+        self._feature = get_query_feature(name)
+
+    @property
+    def name(self):
+        """Name of the parameter."""
+        return self._name
+
+    @property
+    def value(self):
+        """Value to match."""
+        return self._value
+
+    @property
+    def index_keys(self):
+        """Exact request features required by the rule."""
+        if self._value is None:
+            return ()
+        return ((self._feature, self._value), )
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((self._feature, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return (self._feature, self._value)
+
+    def is_match_found(self, request):
+        """Check if the query parameter of the request matches the rule.
+
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
+        :returns: boolean if match is found.
+        """
+        logging.getLogger(__name__).debug("Check request with %s", self)
+        value = request.get_feature(self._feature)
+        if value is None:
+            return False
+
+        return self._value is None or value == self._value
+
+    def __repr__(self):
+        return "{class_name}(name='{name}', value={value!r})".format(
+            class_name=self.__class__.__name__,
+            name=self._name,
+            value=self._value,
+            )
+
+
+class JsonBodyRule(ServerRule):
+    """Rule to match requests by JSON body.
+
+    The rule selects a part of the body by a simplified JSONPath, e.g. ``$.order.items[0]``
+    or ``$["key with spaces"]``, and checks that the selected part contains the value of
+    the rule. Objects contain their subsets, arrays must have the same length and contain
+    the corresponding elements, other values must be equal.
+
+    The body is parsed once per request by
+    :class:`RequestView <looseserver.server.request.RequestView>` and only if a rule
+    checks it.
+    """
+
+    uses_request_view = True
+
+    def __init__(self, rule_type, value, path="$"):
+        super(JsonBodyRule, self).__init__(rule_type)
+        self._value = value
+        self._path = path
+        self._steps = _parse_json_path(path)
+
+    @property
+    def value(self):
+        """Value, that the selected part of the body must contain."""
+        return self._value
+
+    @property
+    def path(self):
+        """Path of the selected part of the body."""
+        return self._path
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return ("json_body", self._steps, json.dumps(self._value, sort_keys=True))
+
+    def is_match_found(self, request):
+        """Check if the selected part of the JSON body contains the value of the rule.
+
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
+        :returns: boolean if match is found.
+        """
+        logging.getLogger(__name__).debug("Check request with %s", self)
+        document = request.json_body
+        if document is INVALID_JSON:
+            return False
+
+        for step in self._steps:
+            if isinstance(step, int):
+                if not isinstance(document, list) or step >= len(document):
+                    return False
+            elif not isinstance(document, dict) or step not in document:
+                return False
+            document = document[step]
+
+        return _is_contained(self._value, document)
+
+    def __repr__(self):
+        return "{class_name}(value={value!r}, path='{path}')".format(
+            class_name=self.__class__.__name__,
+            value=self._value,
+            path=self._path,
+            )
+
+
+def _parse_json_path(path):
+    """Parse the simplified JSONPath.
+
+    :param path: string with the path, that starts with ``$``.
+    :returns: tuple of steps. Step is a key of an object or an index of an array.
+    :raises: :class:ValueError if the path can't be parsed.
+    """
+    if not path.startswith("$"):
+        raise ValueError("Path must start with '$'")
+
+    steps = []
+    position = 1
+    while position < len(path):
+        match = _JSON_PATH_STEP.match(path, position)
+        if match is None:
+            raise ValueError("Unexpected character at position {0}".format(position))
+
+        key, index, quoted_key = match.groups()
+        if index is not None:
+            steps.append(int(index))
+        elif quoted_key is not None:
+            steps.append(json.loads(quoted_key))
+        else:
+            steps.append(key)
+        position = match.end()
+
+    return tuple(steps)
+
+
+def _is_contained(expected, actual):
+    """Check if the JSON value contains the expected value.
+
+    :param expected: expected JSON value.
+    :param actual: actual JSON value.
+    :returns: boolean if the expected value is contained.
+    """
+    if isinstance(expected, dict):
+        return isinstance(actual, dict) and all(
+            key in actual and _is_contained(value, actual[key])
+            for key, value in expected.items()
+            )
+
+    if isinstance(expected, list):
+        return (
+            isinstance(actual, list)
+            and len(expected) == len(actual)
+            and all(map(_is_contained, expected, actual))
+            )
+
+    if isinstance(expected, bool) or isinstance(actual, bool):
+        return expected is actual
+
+    return expected == actual
+
+
+class BodyDigestRule(ServerRule):
+    """Rule to match requests by SHA-256 digest of the body.
+
+    The digest of the request body is computed once per request and rules are found
+    by the digest in the index, so bodies are never compared byte by byte.
+    """
+
+    uses_request_view = True
+
+    def __init__(self, rule_type, digest):
+        super(BodyDigestRule, self).__init__(rule_type)
+        self._digest = digest
+
+    @property
+    def digest(self):
+        """Hexadecimal SHA-256 digest of the expected body."""
+        return self._digest
+
+    @property
+    def index_keys(self):
+        """Exact request features required by the rule."""
+        return ((BODY_DIGEST_FEATURE, self._digest), )
+
+    @property
+    def features(self):
+        """Request features checked by the rule."""
+        return frozenset((BODY_DIGEST_FEATURE, ))
+
+    @property
+    def predicate_key(self):
+        """Key of the predicate checked by the rule."""
+        return (BODY_DIGEST_FEATURE, self._digest)
+
+    def is_match_found(self, request):
+        """Check if digest of the request body matches the digest of the rule.
+
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
+        :returns: boolean if match is found.
+        """
+        logging.getLogger(__name__).debug("Check request with %s", self)
+        return request.body_digest == self._digest
+
+    def __repr__(self):
+        return "{class_name}(digest='{digest}')".format(
+            class_name=self.__class__.__name__,
+            digest=self._digest,
+            )
+
+
 class CompositeRule(ServerRule):
     """Composite rule to match request by several rules simultaneously."""
 
+    uses_request_view = True
+
     def __init__(self, rule_type, children):
         super(CompositeRule, self).__init__(rule_type)
         self._children = tuple(children)
@@ -76,17 +603,49 @@ class CompositeRule(ServerRule):
         """Child rules."""
         return tuple(self._children)
 
+    @property
+    def index_keys(self):
+        """Exact request features required by the child rules."""
+        return tuple(key for child in self._children for key in child.index_keys)
+
+    @property
+    def prefix_keys(self):
+        """Prefixes of request features required by the child rules."""
+        return tuple(key for child in self._children for key in child.prefix_keys)
+
+    @property
+    def regex_keys(self):
+        """Regular expressions of request features checked by the child rules."""
+        return tuple(key for child in self._children for key in child.regex_keys)
+
+    @property
+    def features(self):
+        """Request features checked by the child rules or None if any of them is unknown."""
+        features = frozenset()
+        for child in self._children:
+            child_features = child.features
+            if child_features is None:
+                return None
+            features |= child_features
+        return features
+
+    @property
+    def conjuncts(self):
+        """Child rules or None if there are no children."""
+        return self._children or None
+
     def is_match_found(self, request):
         """Check if request matches all the children rules.
 
-        :param request: incoming :class:flask.Request.
+        :param request: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the incoming request.
         :returns: boolean if match is found.
         """
         logging.getLogger(__name__).debug("Check request with %s", self)
         if not self._children:
             return False
 
-        return all(child.is_match_found(request) for child in self._children)
+        return all(child.is_match_found(request.select_for(child)) for child in self._children)
 
     def __repr__(self):
         return "{class_name}(children={children})".format(
@@ -105,7 +664,20 @@ def create_rule_factory(base_url):
 
     server_factory_preparator = RuleFactoryPreparator(rule_factory=rule_factory)
     server_factory_preparator.prepare_path_rule(path_rule_class=PathRule, base_url=base_url)
+    server_factory_preparator.prepare_path_prefix_rule(
+        path_prefix_rule_class=PathPrefixRule,
+        base_url=base_url,
+        )
+    server_factory_preparator.prepare_path_regex_rule(
+        path_regex_rule_class=PathRegexRule,
+        base_url=base_url,
+        )
     server_factory_preparator.prepare_method_rule(method_rule_class=MethodRule)
+    server_factory_preparator.prepare_host_rule(host_rule_class=HostRule)
+    server_factory_preparator.prepare_header_rule(header_rule_class=HeaderRule)
+    server_factory_preparator.prepare_query_rule(query_rule_class=QueryRule)
+    server_factory_preparator.prepare_json_body_rule(json_body_rule_class=JsonBodyRule)
+    server_factory_preparator.prepare_body_digest_rule(body_digest_rule_class=BodyDigestRule)
     server_factory_preparator.prepare_composite_rule(composite_rule_class=CompositeRule)
 
     return rule_factory
@@ -2,7 +2,9 @@
 
 import argparse
 
+from looseserver.common.utils import ensure_endpoint
 from looseserver.server.application import DEFAULT_BASE_ENDPOINT, DEFAULT_CONFIGURATION_ENDPOINT
+from looseserver.server.core import Manager
 from looseserver.default.server.application import configure_application
 
 
@@ -26,6 +28,54 @@ def create_parser():
         dest="base_endpoint",
         help="Base endpoint for configured routes",
         )
+    parser.add_argument(
+        "--compile-predicates",
+        action="store_true",
+        dest="compile_predicates",
+        help="Check identical predicates of the rules once per request",
+        )
+    parser.add_argument(
+        "--match-cache-size",
+        default=None,
+        dest="match_cache_size",
+        type=int,
+        help="Maximum number of cached matches. Cache is disabled by default",
+        )
+
+    parser.add_argument(
+        "--no-adaptive-dispatch",
+        action="store_false",
+        dest="adaptive_dispatch",
+        help="Check rules in the order of their creation without adaptive reordering",
+        )
+
+    parser.add_argument(
+        "--negative-cache-size",
+        default=None,
+        dest="negative_cache_size",
+        type=int,
+        help="Maximum number of cached requests without matches. Cache is disabled by default",
+        )
+
+    file_access = parser.add_mutually_exclusive_group()
+    file_access.add_argument(
+        "--file-root",
+        default=None,
+        dest="file_root",
+        help=(
+            "Directory with files for file responses. "
+            "File responses are disabled unless it or --unrestricted-files is specified"
+            ),
+        )
+    file_access.add_argument(
+        "--unrestricted-files",
+        action="store_true",
+        dest="unrestricted_files",
+        help=(
+            "Allow file responses with any file readable by the server. "
+            "Configuration API is not authenticated, so use it only in trusted environments"
+            ),
+        )
 
     return parser
 
@@ -35,9 +85,19 @@ def _run(commandline_arguments=None):
     if __name__ == "__main__":
         parser = create_parser()
         arguments = parser.parse_args(commandline_arguments)
+        core_manager = Manager(
+            base=ensure_endpoint(arguments.base_endpoint),
+            compile_predicates=arguments.compile_predicates,
+            match_cache_size=arguments.match_cache_size,
+            negative_cache_size=arguments.negative_cache_size,
+            adaptive_dispatch=arguments.adaptive_dispatch,
+            )
         application = configure_application(
             base_endpoint=arguments.base_endpoint,
             configuration_endpoint=arguments.configuration_endpoint,
+            core_manager=core_manager,
+            file_root=arguments.file_root,
+            unrestricted_files=arguments.unrestricted_files,
             )
 
         application.run(host=arguments.host, port=arguments.port)
@@ -0,0 +1,112 @@
+"""Module to reorder disjoint rules by the frequency of their matches."""
+
+import logging
+import threading
+from collections import Counter
+
+
+class HitCounter:
+    """Thread-safe counter of the matches found by the rules."""
+
+    def __init__(self):
+        self._counts = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, rule_id):
+        """Count a match of the rule.
+
+        :param rule_id: ID of the rule.
+        """
+        with self._lock:
+            self._counts[rule_id] += 1
+
+    def collect(self, rule_ids):
+        """Get counts of the matches and halve them, so that recent matches weigh more.
+
+        Counts of the rules, that are not specified, are discarded.
+
+        :param rule_ids: iterable of IDs of the existing rules.
+        :returns: dictionary with counts of the matches by rule IDs.
+        """
+        with self._lock:
+            counts = {rule_id: self._counts[rule_id] for rule_id in rule_ids}
+            self._counts = Counter({
+                rule_id: count // 2 for rule_id, count in counts.items() if count > 1
+                })
+        return counts
+
+
+def find_disjoint_runs(rules):
+    """Split rules into runs of consecutive rules, that can't find a match in the same request.
+
+    Rules are disjoint, if they require different exact values of the same request feature.
+    Values of the features shared by all rules of the current run are collected in sets,
+    that grow with the run, so the time to check a rule doesn't depend on the length of the run.
+
+    :param rules: iterable of pairs (rule ID, rule) in the order of the rules.
+    :returns: list of lists with rule IDs.
+    """
+    runs = []
+    run_values = {}
+    for rule_id, rule in rules:
+        rule_values = _get_exact_values(rule)
+
+        common_features = [
+            feature for feature, values in run_values.items()
+            if feature in rule_values and rule_values[feature] not in values
+            ]
+
+        if runs and common_features:
+            runs[-1].append(rule_id)
+            run_values = {feature: run_values[feature] for feature in common_features}
+            for feature in common_features:
+                run_values[feature].add(rule_values[feature])
+        else:
+            runs.append([rule_id])
+            run_values = {feature: {value} for feature, value in rule_values.items()}
+
+    return runs
+
+
+def rank_rules(runs, positions, hit_counts):
+    """Rank rules so that rules with more matches are checked first within their runs.
+
+    Runs with a single rule are not ranked, since the rule keeps its position.
+
+    :param runs: list of lists with rule IDs, returned by :func:`find_disjoint_runs`.
+    :param positions: dictionary with positions of the rules.
+    :param hit_counts: dictionary with counts of the matches.
+    :returns: dictionary with ranks of the rules. Rank is a pair
+        (position of the first rule in the run, order within the run).
+    """
+    ranks = {}
+    for run in runs:
+        if len(run) < 2:
+            continue
+
+        run_position = positions[run[0]]
+        ordered_run = sorted(
+            run,
+            key=lambda rule_id: (-hit_counts.get(rule_id, 0), positions[rule_id]),
+            )
+        for order, rule_id in enumerate(ordered_run):
+            ranks[rule_id] = (run_position, order)
+    return ranks
+
+
+def _get_exact_values(rule):
+    """Get exact values of the request features required by the rule.
+
+    :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+    :returns: dictionary with values by features.
+    """
+    try:
+        index_keys = tuple(rule.index_keys)
+    except Exception:   # pylint: disable=broad-except
+        logging.getLogger(__name__).exception("Failed to obtain index keys of %s", rule)
+        return {}
+
+    values = {}
+    for feature, value in index_keys:
+        values.setdefault(feature, value)
+    return values
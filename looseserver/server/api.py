@@ -1,6 +1,7 @@
 """Module with api resources."""
 
 import logging
+import math
 from collections import OrderedDict
 
 from flask import request
@@ -29,6 +30,8 @@ class RulesManager(Resource):
         logger.debug("Try to create new rule")
         try:
             rule = self._rule_factory.parse_rule(data=request_data)
+            ttl = _parse_ttl(data=request_data)
+            remaining_uses = _parse_remaining_uses(data=request_data)
         except RuleParseError as error:
             message = "Failed to create a rule for specified parameters. Error: '{0}'".format(error)
             logger.exception(message)
@@ -38,7 +41,7 @@ class RulesManager(Resource):
             logger.exception(message)
             return build_response(error=APIError(message)), 500
 
-        rule_id = self._manager.add_rule(rule)
+        rule_id = self._manager.add_rule(rule, ttl=ttl, remaining_uses=remaining_uses)
         logger.debug("Rule has been successfully created")
 
         try:
@@ -53,6 +56,10 @@ class RulesManager(Resource):
 
         response_data = {"rule_id": rule_id}
         response_data.update(rule_data)
+        if ttl is not None:
+            response_data["ttl"] = ttl
+        if remaining_uses is not None:
+            response_data["remaining_uses"] = remaining_uses
         return build_response(data=response_data)
 
 
@@ -83,6 +90,9 @@ class Rule(Resource):
         logger.info("Rule %s has been successfully obtained", rule_id)
         response_data = {"rule_id": rule_id}
         response_data.update(rule_data)
+        remaining_uses = self._manager.get_remaining_uses(rule_id=rule_id)
+        if remaining_uses is not None:
+            response_data["remaining_uses"] = remaining_uses
         return build_response(data=response_data)
 
     def delete(self, rule_id):
@@ -94,6 +104,25 @@ class Rule(Resource):
         return build_response()
 
 
+class ShadowedRules(Resource):
+    """API resource to find shadowed rules."""
+    def __init__(self, manager):
+        self._manager = manager
+
+    def get(self):
+        """Get rules, that are shadowed by the preceding rules."""
+        logger = logging.getLogger(__name__)
+        logger.debug("Try to get shadowed rules")
+        shadowed_rules = self._manager.get_shadowed_rules()
+
+        logger.info("Shadowed rules have been successfully obtained")
+        response_data = [
+            {"rule_id": rule_id, "shadowing_rule_id": shadowing_rule_id}
+            for rule_id, shadowing_rule_id in shadowed_rules.items()
+            ]
+        return build_response(data=response_data)
+
+
 class Response(Resource):
     """API resource to manage rule responses."""
     def __init__(self, manager, response_factory):
@@ -167,6 +196,44 @@ class Response(Resource):
         return build_response(data=response_data)
 
 
+def _parse_ttl(data):
+    """Parse optional TTL of the rule.
+
+    :param data: data with rule information.
+    :returns: number of seconds or None if TTL is not specified.
+    :raises: :class:`RuleParseError <looseserver.common.rule.RuleParseError>` if TTL
+        is not a positive finite number.
+    """
+    ttl = data.get("ttl")
+    if ttl is None:
+        return None
+
+    is_number = isinstance(ttl, (int, float)) and not isinstance(ttl, bool)
+    if not is_number or not math.isfinite(ttl) or ttl <= 0:
+        raise RuleParseError("TTL must be a positive finite number")
+
+    return ttl
+
+
+def _parse_remaining_uses(data):
+    """Parse optional number of uses of the rule.
+
+    :param data: data with rule information.
+    :returns: number of uses or None if uses are unlimited.
+    :raises: :class:`RuleParseError <looseserver.common.rule.RuleParseError>` if number
+        of uses is not a positive integer.
+    """
+    remaining_uses = data.get("remaining_uses")
+    if remaining_uses is None:
+        return None
+
+    is_integer = isinstance(remaining_uses, int) and not isinstance(remaining_uses, bool)
+    if not is_integer or remaining_uses <= 0:
+        raise RuleParseError("Remaining uses must be a positive integer")
+
+    return remaining_uses
+
+
 def build_response(data=None, error=None, version=DEFAULT_VERSION):
     """Build a response.
 
@@ -7,7 +7,7 @@ from flask_restful import Api
 
 from looseserver.common.utils import ensure_endpoint
 from looseserver.server.core import Manager
-from looseserver.server.api import RulesManager, Rule, Response
+from looseserver.server.api import RulesManager, Rule, ShadowedRules, Response
 
 
 DEFAULT_BASE_ENDPOINT = "/routes/"
@@ -19,6 +19,7 @@ def configure_application(
         response_factory,
         base_endpoint=DEFAULT_BASE_ENDPOINT,
         configuration_endpoint=DEFAULT_CONFIGURATION_ENDPOINT,
+        core_manager=None,
     ):
     """Configure application.
 
@@ -28,12 +29,15 @@ def configure_application(
         to parse and serialize responses.
     :param base_endpoint: string with base endpoint for configured routes.
     :param configuration_endpoint: string with endpoint to configure routes.
+    :param core_manager: :class:`Manager <looseserver.server.core.Manager>` to manage
+        configured routes. New manager for the base endpoint is created if not specified.
     :returns: flask.Flask object.
     """
     base_endpoint = ensure_endpoint(base_endpoint)
     configuration_endpoint = ensure_endpoint(configuration_endpoint)
 
-    core_manager = Manager(base=base_endpoint)
+    if core_manager is None:
+        core_manager = Manager(base=base_endpoint)
 
     application = Flask(__name__.split(".")[0])
     api = Api(application)
@@ -52,6 +56,13 @@ def configure_application(
         resource_class_args=(core_manager, rule_factory),
         )
 
+    api.add_resource(
+        ShadowedRules,
+        urlparse.urljoin(configuration_endpoint, "shadowed_rules"),
+        endpoint="configuration_shadowed_rules",
+        resource_class_args=(core_manager, ),
+        )
+
     api.add_resource(
         Response,
         urlparse.urljoin(configuration_endpoint, "response/<rule_id>"),
@@ -0,0 +1,88 @@
+"""Module with caches of the dispatch results."""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple("CacheInfo", "hits misses maxsize currsize")
+
+
+class LRUCache:
+    """Thread-safe bounded cache, that discards the least recently used items first.
+
+    Cache is bound to a version of the rules. Changing the version clears the cache.
+
+    :param maxsize: maximum number of the cached items.
+    """
+
+    def __init__(self, maxsize):
+        if maxsize <= 0:
+            raise ValueError("Size of the cache must be positive")
+
+        self._maxsize = maxsize
+        self._items = OrderedDict()
+        self._version = None
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, version, key, default=None):
+        """Get cached value.
+
+        :param version: current version of the rules.
+        :param key: hashable key of the item.
+        :param default: value to return if there is no cached item for the key.
+        :returns: cached value or default.
+        """
+        with self._lock:
+            if version != self._version:
+                self._reset(version)
+
+            try:
+                value = self._items[key]
+            except KeyError:
+                self._misses += 1
+                return default
+
+            self._items.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, version, key, value):
+        """Cache a value.
+
+        Values for outdated versions are ignored.
+
+        :param version: version of the rules, the value has been computed for.
+        :param key: hashable key of the item.
+        :param value: value to cache.
+        """
+        with self._lock:
+            if version != self._version:
+                return
+
+            self._items[key] = value
+            self._items.move_to_end(key)
+            if len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def info(self):
+        """Get statistics of the cache.
+
+        :returns: instance of :class:`CacheInfo`.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self._maxsize,
+                currsize=len(self._items),
+                )
+
+    def _reset(self, version):
+        """Clear cached items and bind the cache to the version.
+
+        :param version: new version of the rules.
+        """
+        self._items.clear()
+        self._version = version
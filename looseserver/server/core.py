@@ -1,25 +1,139 @@
 """Core module to manage dynamically configured routes."""
 
+import functools
+import heapq
+import itertools
+import math
+import threading
 from collections import OrderedDict
+from time import monotonic
 from uuid import uuid4
 import logging
 
 from flask import request, abort
 
+from looseserver.server.cache import LRUCache
+from looseserver.server.request import RequestView
+from looseserver.server.snapshot import RuleSnapshot
 
-class Manager:
-    """Class to manage routes."""
 
-    def __init__(self, base):
+REORDER_INTERVAL = 1000
+
+
+class UseCounter:
+    """Thread-safe counter of the remaining uses of a rule.
+
+    :param uses: number of uses.
+    :param on_exhausted: callable without arguments, that is invoked when the last use
+        is acquired.
+    """
+
+    def __init__(self, uses, on_exhausted):
+        self._remaining = uses
+        self._on_exhausted = on_exhausted
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self):
+        """Number of the remaining uses."""
+        return self._remaining
+
+    def acquire(self):
+        """Acquire a use.
+
+        :returns: boolean if the use has been acquired.
+        """
+        with self._lock:
+            if self._remaining <= 0:
+                return False
+            self._remaining -= 1
+            exhausted = not self._remaining
+
+        if exhausted:
+            self._on_exhausted()
+        return True
+
+
+class Manager:
+    """Class to manage routes.
+
+    Rules and responses are published as immutable snapshots. Every change creates a new
+    snapshot and replaces the published one atomically, so requests are dispatched
+    without locking, while changes are serialized by a lock.
+
+    Rules with TTL are kept in a heap by their deadlines. Expired rules are removed
+    before requests are dispatched and before rules are changed or obtained, so only
+    the earliest deadline is checked unless some rules have expired.
+
+    Rules with limited uses are removed as soon as their last use is acquired by
+    a request.
+
+    :param base: base path for endpoints.
+    :param compile_predicates: boolean if rules should be compiled into a graph of
+        shared predicates, so that identical predicates are checked once per request.
+    :param match_cache_size: maximum number of cached matches. Cache is disabled if
+        not specified.
+    :param negative_cache_size: maximum number of cached requests without matches.
+        Cache is disabled if not specified.
+    :param adaptive_dispatch: boolean if rules, that can't find a match in the same request,
+        should be reordered by the frequency of their matches every
+        :data:`REORDER_INTERVAL` requests. Rules are reordered by a background thread,
+        so requests are not delayed by the reordering.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+            self,
+            base,
+            compile_predicates=False,
+            match_cache_size=None,
+            negative_cache_size=None,
+            adaptive_dispatch=True,
+        ):
+        # pylint: disable=too-many-arguments
         self._base = base
-        self._rules = OrderedDict()
-        self._responses = {}
+        self._snapshot = RuleSnapshot(
+            compile_predicates=compile_predicates,
+            adaptive=adaptive_dispatch,
+            )
+        self._lock = threading.Lock()
+        self._dispatch_counter = itertools.count(1) if adaptive_dispatch else None
+        self._reorder_condition = threading.Condition()
+        self._reorder_worker = None
+        self._match_cache = LRUCache(maxsize=match_cache_size) if match_cache_size else None
+        self._negative_cache = None
+        if negative_cache_size:
+            self._negative_cache = LRUCache(maxsize=negative_cache_size)
+        self._expiry_queue = []
+        self._next_expiry = math.inf
 
     @property
     def base(self):
         """Base path for endpoints."""
         return self._base
 
+    @property
+    def match_cache_info(self):
+        """Statistics of the match cache.
+
+        :returns: instance of :class:`CacheInfo <looseserver.server.cache.CacheInfo>` or
+            None if the cache is disabled.
+        """
+        if self._match_cache is None:
+            return None
+        return self._match_cache.info()
+
+    @property
+    def negative_cache_info(self):
+        """Statistics of the negative cache.
+
+        :returns: instance of :class:`CacheInfo <looseserver.server.cache.CacheInfo>` or
+            None if the cache is disabled.
+        """
+        if self._negative_cache is None:
+            return None
+        return self._negative_cache.info()
+
     def view(self, path=""):
         # pylint: disable=unused-argument
         """View function for configured path.
@@ -27,29 +141,80 @@ class Manager:
         :param path: path relative to the routes endpoint.
         """
         logger = logging.getLogger(__name__)
-        for rule_id, rule in self._rules.items():
+        self._expire_rules()
+        if self._dispatch_counter is not None:
+            if next(self._dispatch_counter) % REORDER_INTERVAL == 0:
+                self._schedule_reordering()
+
+        request_view = RequestView(request)
+        snapshot = self._snapshot
+        matches = snapshot.find_matches(
+            request_view,
+            match_cache=self._match_cache,
+            negative_cache=self._negative_cache,
+            )
+        for rule, response in matches:
             try:
-                match_found = rule.is_match_found(request)
+                return response.build_response(request=request_view.request, rule=rule)
             except Exception:  # pylint: disable=broad-except
-                logger.exception("Error occured on attempt to find a match by %s", rule)
+                logger.exception("Error occured on attempt to build response by %s", response)
                 continue
 
-            if match_found:
-                response = self._responses.get(rule_id)
-                if response is None:
-                    continue
-                else:
-                    try:
-                        return response.build_response(request=request, rule=rule)
-                    except Exception:  # pylint: disable=broad-except
-                        logger.exception(
-                            "Error occured on attempt to build response by %s",
-                            response,
-                            )
-                        continue
-
         return abort(404)
 
+    def reorder_rules(self):
+        """Reorder rules, that can't find a match in the same request, by their matches.
+
+        Rules are reordered in a copy of the published snapshot without holding the lock,
+        so changes of the rules are not delayed. The copy is discarded if the rules have
+        been changed meanwhile or their order is the same.
+        """
+        logger = logging.getLogger(__name__)
+        with self._lock:
+            published_snapshot = self._snapshot
+            snapshot = published_snapshot.copy()
+
+        if not snapshot.reorder_rules():
+            return
+
+        with self._lock:
+            if self._snapshot is not published_snapshot:
+                logger.debug("Reordering is discarded, because rules have been changed")
+                return
+            self._snapshot = snapshot
+
+        logger.debug("Rules have been reordered")
+
+    def wait_reordering(self, timeout=None):
+        """Wait until the reordering started by the requests is finished.
+
+        :param timeout: timeout in seconds or None to wait forever.
+        :returns: boolean if there is no pending reordering.
+        """
+        with self._reorder_condition:
+            return self._reorder_condition.wait_for(
+                lambda: self._reorder_worker is None,
+                timeout=timeout,
+                )
+
+    def _schedule_reordering(self):
+        """Start reordering of the rules in background unless it is already running."""
+        with self._reorder_condition:
+            if self._reorder_worker is None:
+                self._reorder_worker = threading.Thread(target=self._reorder, daemon=True)
+                self._reorder_worker.start()
+
+    def _reorder(self):
+        """Reorder rules and notify the waiting threads."""
+        try:
+            self.reorder_rules()
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("Failed to reorder rules")
+        finally:
+            with self._reorder_condition:
+                self._reorder_worker = None
+                self._reorder_condition.notify_all()
+
     def get_rule(self, rule_id):
         """Get a rule by its ID.
 
@@ -59,7 +224,8 @@ class Manager:
         """
         logger = logging.getLogger(__name__)
         logger.debug("Try to get rule by ID '%s'", rule_id)
-        rule = self._rules.get(rule_id)
+        self._expire_rules()
+        rule = self._snapshot.rules.get(rule_id)
         if rule is None:
             raise KeyError("Failed to find a rule with ID: '{0}'".format(rule_id))
 
@@ -71,24 +237,44 @@ class Manager:
 
         :returns: tuple with rule IDs.
         """
-        return tuple(self._rules.keys())
+        self._expire_rules()
+        return self._snapshot.get_rules_order()
 
-    def add_rule(self, rule):
+    def add_rule(self, rule, ttl=None, remaining_uses=None):
         """Add a rule to match the request.
 
         :param rule: instance of :class:`Rule <looseserver.server.rule._AbstractRule>`.
+        :param ttl: number of seconds after which the rule is removed. The rule is kept
+            until it is removed explicitly if not specified.
+        :param remaining_uses: number of matches after which the rule is removed.
+            Uses are unlimited if not specified.
         :returns: ID of the created rule.
         """
         logger = logging.getLogger(__name__)
         logger.debug("Try to add rule %s", rule)
+        self._expire_rules()
 
-        rules = self._rules
+        with self._lock:
+            snapshot = self._snapshot.copy()
 
-        rule_id = str(uuid4())
-        while rule_id in rules:
             rule_id = str(uuid4())
+            while rule_id in snapshot.rules:
+                rule_id = str(uuid4())
+
+            use_counter = None
+            if remaining_uses is not None:
+                use_counter = UseCounter(
+                    uses=remaining_uses,
+                    on_exhausted=functools.partial(self._retire_rule, rule_id),
+                    )
+
+            snapshot.add_rule(rule_id=rule_id, rule=rule, use_counter=use_counter)
+            self._snapshot = snapshot
 
-        rules[rule_id] = rule
+            if ttl is not None:
+                deadline = monotonic() + ttl
+                heapq.heappush(self._expiry_queue, (deadline, rule_id))
+                self._next_expiry = self._expiry_queue[0][0]
 
         logger.info("Rule %s has been added with ID %s", rule, rule_id)
         return rule_id
@@ -101,11 +287,72 @@ class Manager:
         logger = logging.getLogger(__name__)
         logger.debug("Try to remove rule with ID '%s'", rule_id)
 
-        self._rules.pop(rule_id, None)
-        self._responses.pop(rule_id, None)
+        with self._lock:
+            snapshot = self._snapshot.copy()
+            snapshot.remove_rule(rule_id=rule_id)
+            self._snapshot = snapshot
 
         logger.info("Rule with ID %s has been removed", rule_id)
 
+    def get_remaining_uses(self, rule_id):
+        """Get number of the remaining uses of the rule.
+
+        :param rule_id: ID of the rule.
+        :returns: number of uses or None if uses are unlimited or the rule does not exist.
+        """
+        return self._snapshot.get_remaining_uses(rule_id=rule_id)
+
+    def _retire_rule(self, rule_id):
+        """Remove the rule without remaining uses.
+
+        :param rule_id: ID of the rule.
+        """
+        with self._lock:
+            snapshot = self._snapshot.copy()
+            snapshot.remove_rule(rule_id=rule_id)
+            self._snapshot = snapshot
+
+        logging.getLogger(__name__).info("Rule with ID %s has been retired", rule_id)
+
+    def _expire_rules(self):
+        """Remove rules, whose TTL has expired.
+
+        Entries of the rules, that have been removed explicitly, are discarded when
+        their deadlines are reached.
+        """
+        if self._next_expiry > monotonic():
+            return
+
+        with self._lock:
+            now = monotonic()
+            expired_rule_ids = []
+            while self._expiry_queue and self._expiry_queue[0][0] <= now:
+                _, rule_id = heapq.heappop(self._expiry_queue)
+                if rule_id in self._snapshot.rules:
+                    expired_rule_ids.append(rule_id)
+
+            self._next_expiry = self._expiry_queue[0][0] if self._expiry_queue else math.inf
+
+            if expired_rule_ids:
+                snapshot = self._snapshot.copy()
+                for rule_id in expired_rule_ids:
+                    snapshot.remove_rule(rule_id=rule_id)
+                self._snapshot = snapshot
+
+        for rule_id in expired_rule_ids:
+            logging.getLogger(__name__).info("Rule with ID %s has expired", rule_id)
+
+    def get_shadowed_rules(self):
+        """Get rules, that can't find a match, unless one of the preceding rules finds it too.
+
+        Shadowed rules are checked only if the response of the shadowing rule has failed.
+
+        :returns: ordered dictionary with IDs of the shadowing rules by IDs of
+            the shadowed rules in the order of the shadowed rules.
+        """
+        self._expire_rules()
+        return OrderedDict(self._snapshot.get_shadowed_rules())
+
     def get_response(self, rule_id):
         """Get a response for the rule.
 
@@ -116,10 +363,12 @@ class Manager:
         """
         logger = logging.getLogger(__name__)
         logger.debug("Try to get response for the rule with ID '%s'", rule_id)
-        if rule_id not in self._rules:
+        self._expire_rules()
+        snapshot = self._snapshot
+        if rule_id not in snapshot.rules:
             raise KeyError("Failed to find a rule with ID: '{0}'".format(rule_id))
 
-        response = self._responses.get(rule_id, None)
+        response = snapshot.responses.get(rule_id, None)
         if response is None:
             raise KeyError("Response has not been set for the rule with ID: '{0}'".format(rule_id))
 
@@ -137,9 +386,12 @@ class Manager:
         logger = logging.getLogger(__name__)
         logger.debug("Try to set response %s for the rule with ID %s", response, rule_id)
 
-        if rule_id not in self._rules:
-            raise KeyError("Failed to find a rule with ID: '{0}'".format(rule_id))
+        with self._lock:
+            if rule_id not in self._snapshot.rules:
+                raise KeyError("Failed to find a rule with ID: '{0}'".format(rule_id))
 
-        self._responses[rule_id] = response
+            snapshot = self._snapshot.copy()
+            snapshot.set_response(rule_id=rule_id, response=response)
+            self._snapshot = snapshot
 
         logger.info("Response %s has been set for the rule with ID %s", response, rule_id)
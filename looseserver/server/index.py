@@ -0,0 +1,520 @@
+"""Module with indexes to find candidate rules for a request."""
+
+import bisect
+import heapq
+import logging
+from collections import Counter
+
+from looseserver.server.mapping import CopyOnWriteDict
+from looseserver.server.request import (
+    PATH_FEATURE,
+    HOST_FEATURE,
+    BODY_DIGEST_FEATURE,
+    HEADER_FEATURE_PREFIX,
+    QUERY_FEATURE_PREFIX,
+    )
+
+
+_KEYED_FEATURE_PREFIXES = (HEADER_FEATURE_PREFIX, QUERY_FEATURE_PREFIX, BODY_DIGEST_FEATURE)
+
+
+class _RadixNode:
+    """Immutable node of the radix tree."""
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ("label", "children", "items")
+
+    def __init__(self, label, children, items):
+        self.label = label
+        self.children = children
+        self.items = items
+
+
+_EMPTY_NODE = _RadixNode(label="", children={}, items=())
+
+
+class PrefixTree:
+    """Persistent radix tree of the items stored by string prefixes.
+
+    Every change creates a new tree, that shares unchanged nodes with the original one,
+    so the tree can be safely used after the change.
+
+    Items of a node are kept in the order of their positions.
+    """
+
+    def __init__(self, root=_EMPTY_NODE):
+        self._root = root
+
+    def __bool__(self):
+        return bool(self._root.items or self._root.children)
+
+    def add(self, prefix, position, item):
+        """Add an item for the prefix.
+
+        :param prefix: string prefix.
+        :param position: position of the item to keep items ordered.
+        :param item: item to add.
+        :returns: new instance of :class:`PrefixTree`.
+        """
+        return PrefixTree(_insert(self._root, prefix, (position, item)))
+
+    def remove(self, prefix, position):
+        """Remove an item from the tree.
+
+        :param prefix: string prefix of the item.
+        :param position: position of the item.
+        :returns: new instance of :class:`PrefixTree`.
+        """
+        root = _delete(self._root, prefix, position)
+        if root is None:
+            root = _EMPTY_NODE
+        return PrefixTree(root)
+
+    def find(self, key):
+        """Find items for all prefixes of the key.
+
+        Cost of the search depends on the length of the key, not the number of items.
+
+        :param key: string to find prefixes for.
+        :returns: list of sorted tuples with pairs (position, item), one tuple per prefix.
+        """
+        node = self._root
+        found = []
+        while True:
+            if node.items:
+                found.append(node.items)
+
+            if not key:
+                return found
+
+            child = node.children.get(key[0])
+            if child is None or not key.startswith(child.label):
+                return found
+
+            key = key[len(child.label):]
+            node = child
+
+    def get_entries(self):
+        """Get all entries of the tree.
+
+        :returns: list of pairs (position, item) sorted by positions.
+        """
+        entries = []
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            entries.extend(node.items)
+            nodes.extend(node.children.values())
+        entries.sort(key=_get_entry_position)
+        return entries
+
+
+def _insert(node, key, entry):
+    """Insert an entry into the subtree.
+
+    :param node: root of the subtree.
+    :param key: remaining part of the prefix relative to the node.
+    :param entry: pair (position, item).
+    :returns: new root of the subtree.
+    """
+    if not key:
+        items = tuple(sorted(node.items + (entry, ), key=_get_entry_position))
+        return _RadixNode(label=node.label, children=node.children, items=items)
+
+    child = node.children.get(key[0])
+    if child is None:
+        new_child = _RadixNode(label=key, children={}, items=(entry, ))
+    else:
+        common_length = _get_common_length(child.label, key)
+        if common_length < len(child.label):
+            tail = _RadixNode(
+                label=child.label[common_length:],
+                children=child.children,
+                items=child.items,
+                )
+            child = _RadixNode(
+                label=child.label[:common_length],
+                children={tail.label[0]: tail},
+                items=(),
+                )
+        new_child = _insert(child, key[common_length:], entry)
+
+    children = node.children.copy()
+    children[key[0]] = new_child
+    return _RadixNode(label=node.label, children=children, items=node.items)
+
+
+def _delete(node, key, position):
+    """Delete an entry from the subtree.
+
+    :param node: root of the subtree.
+    :param key: remaining part of the prefix relative to the node.
+    :param position: position of the entry.
+    :returns: new root of the subtree or None if the subtree becomes empty.
+    """
+    children = node.children
+    items = node.items
+    if not key:
+        items = tuple(entry for entry in items if entry[0] != position)
+    else:
+        child = children.get(key[0])
+        if child is None or not key.startswith(child.label):
+            return node
+
+        new_child = _delete(child, key[len(child.label):], position)
+        children = children.copy()
+        if new_child is None:
+            del children[key[0]]
+        else:
+            children[key[0]] = new_child
+
+    if not items and not children:
+        return None
+
+    if not items and len(children) == 1 and node.label:
+        only_child, = children.values()
+        return _RadixNode(
+            label=node.label + only_child.label,
+            children=only_child.children,
+            items=only_child.items,
+            )
+
+    return _RadixNode(label=node.label, children=children, items=items)
+
+
+def _get_common_length(first, second):
+    """Get length of the common prefix of 2 strings.
+
+    :param first: first string.
+    :param second: second string.
+    :returns: length of the common prefix.
+    """
+    length = 0
+    for first_character, second_character in zip(first, second):
+        if first_character != second_character:
+            break
+        length += 1
+    return length
+
+
+def _get_entry_position(entry):
+    """Get position of the entry.
+
+    :param entry: pair (position, item).
+    :returns: position.
+    """
+    return entry[0]
+
+
+class RuleIndex:
+    """Index of the rules by the path, headers, query parameters and body of the request.
+
+    Rules are kept in the order of their positions. Rules, that require an exact path,
+    are stored in buckets by the path. Rules, that require a prefix of the path, are
+    stored in a radix tree. Rules, that require an exact value of a header, a query
+    parameter or the digest of the body, are stored in buckets by the feature and
+    the value. All other rules are checked for every request.
+
+    Rules, that require an exact host, are stored in separate partitions by the host,
+    so the number of hosts doesn't affect the search for a request to one of them.
+
+    Buckets and the tree are immutable, and mappings are copied on write, so a copy of
+    the index shares them with the original. Partitions are shared until they are changed.
+
+    :param partition_hosts: boolean if rules should be partitioned by hosts.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, partition_hosts=True):
+        self._partition_hosts = partition_hosts
+        self._hosts = CopyOnWriteDict()
+        self._host_partitions = CopyOnWriteDict()
+        self._owned_partitions = set()
+        self._positions = CopyOnWriteDict()
+        self._paths = CopyOnWriteDict()
+        self._path_buckets = CopyOnWriteDict()
+        self._prefixes = CopyOnWriteDict()
+        self._prefix_tree = PrefixTree()
+        self._feature_keys = CopyOnWriteDict()
+        self._feature_buckets = CopyOnWriteDict()
+        self._feature_references = Counter()
+        self._unindexed = ()
+
+    def copy(self):
+        """Create a copy of the index, that can be changed independently.
+
+        :returns: new instance of :class:`RuleIndex`.
+        """
+        # pylint: disable=protected-access
+        index = RuleIndex.__new__(RuleIndex)
+        index._partition_hosts = self._partition_hosts
+        index._hosts = self._hosts.copy()
+        index._host_partitions = self._host_partitions.copy()
+        index._owned_partitions = set()
+        self._owned_partitions = set()
+        index._positions = self._positions.copy()
+        index._paths = self._paths.copy()
+        index._path_buckets = self._path_buckets.copy()
+        index._prefixes = self._prefixes.copy()
+        index._prefix_tree = self._prefix_tree
+        index._feature_keys = self._feature_keys.copy()
+        index._feature_buckets = self._feature_buckets.copy()
+        index._feature_references = self._feature_references.copy()
+        index._unindexed = self._unindexed
+        return index
+
+    def __len__(self):
+        return len(self._positions)
+
+    def add_rule(self, rule_id, rule, position):
+        """Add a rule to the index.
+
+        Rules can be added in any order. Exact host of the rule takes precedence over
+        other features. Exact path takes precedence over the path prefix, and the path
+        prefix takes precedence over exact values of other features.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        :param position: comparable position of the rule among all rules.
+        """
+        self._positions[rule_id] = position
+
+        index_keys = _get_keys(rule, "index_keys")
+        host = _find_value(index_keys, HOST_FEATURE) if self._partition_hosts else None
+        if host is not None:
+            self._hosts[rule_id] = host
+            self._get_partition(host).add_rule(rule_id=rule_id, rule=rule, position=position)
+            return
+
+        path = _find_value(index_keys, PATH_FEATURE)
+        if path is not None:
+            self._paths[rule_id] = path
+            self._path_buckets[path] = self._insert_item(
+                items=self._path_buckets.get(path, ()),
+                item=(rule_id, rule),
+                )
+            return
+
+        prefix = _find_value(_get_keys(rule, "prefix_keys"), PATH_FEATURE)
+        if prefix is not None:
+            self._prefixes[rule_id] = prefix
+            self._prefix_tree = self._prefix_tree.add(
+                prefix=prefix,
+                position=position,
+                item=(rule_id, rule),
+                )
+            return
+
+        feature_key = _find_feature_key(index_keys)
+        if feature_key is not None:
+            self._feature_keys[rule_id] = feature_key
+            self._feature_references[feature_key[0]] += 1
+            self._feature_buckets[feature_key] = self._insert_item(
+                items=self._feature_buckets.get(feature_key, ()),
+                item=(rule_id, rule),
+                )
+            return
+
+        self._unindexed = self._insert_item(items=self._unindexed, item=(rule_id, rule))
+
+    def remove_rule(self, rule_id):
+        """Remove a rule from the index.
+
+        :param rule_id: ID of the rule.
+        """
+        position = self._positions.pop(rule_id, None)
+        if position is None:
+            return
+
+        host = self._hosts.pop(rule_id, None)
+        if host is not None:
+            partition = self._get_partition(host)
+            partition.remove_rule(rule_id=rule_id)
+            if not partition:
+                del self._host_partitions[host]
+            return
+
+        prefix = self._prefixes.pop(rule_id, None)
+        if prefix is not None:
+            self._prefix_tree = self._prefix_tree.remove(prefix=prefix, position=position)
+            return
+
+        path = self._paths.pop(rule_id, None)
+        if path is not None:
+            _remove_item(buckets=self._path_buckets, key=path, rule_id=rule_id)
+            return
+
+        feature_key = self._feature_keys.pop(rule_id, None)
+        if feature_key is not None:
+            _remove_item(buckets=self._feature_buckets, key=feature_key, rule_id=rule_id)
+            self._feature_references[feature_key[0]] -= 1
+            if self._feature_references[feature_key[0]] <= 0:
+                del self._feature_references[feature_key[0]]
+            return
+
+        self._unindexed = tuple(item for item in self._unindexed if item[0] != rule_id)
+
+    def find_candidates(self, request_view):
+        """Find rules that may find a match in the request.
+
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :returns: iterator over pairs (rule ID, rule) in the order of positions.
+        """
+        is_indexed = self._path_buckets or self._prefix_tree or self._feature_buckets
+        if not is_indexed and not self._host_partitions:
+            return iter(self._unindexed)
+
+        try:
+            sources = self._find_indexed_sources(request_view)
+        except Exception:   # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("Failed to obtain features of the request")
+            return self._iterate_all()
+
+        if self._unindexed:
+            sources.append(self._unindexed)
+
+        if len(sources) == 1:
+            return iter(sources[0])
+
+        return heapq.merge(*sources, key=self._get_position)
+
+    def _find_indexed_sources(self, request_view):
+        """Find indexed rules for the request.
+
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :returns: list of iterables over pairs (rule ID, rule) sorted by positions.
+        """
+        sources = []
+
+        if self._host_partitions:
+            partition = self._host_partitions.get(request_view.get_feature(HOST_FEATURE))
+            if partition:
+                sources.append(partition.find_candidates(request_view))
+
+        if self._path_buckets or self._prefix_tree:
+            path = request_view.path
+
+            bucket = self._path_buckets.get(path)
+            if bucket:
+                sources.append(bucket)
+
+            for entries in self._prefix_tree.find(path):
+                sources.append(item for _, item in entries)
+
+        for feature in self._feature_references:
+            bucket = self._feature_buckets.get((feature, request_view.get_feature(feature)))
+            if bucket:
+                sources.append(bucket)
+
+        return sources
+
+    def _iterate_all(self):
+        """Iterate over all rules in the order of positions."""
+        # pylint: disable=protected-access
+        sources = list(self._path_buckets.values())
+        sources.extend(self._feature_buckets.values())
+        sources.append(self._unindexed)
+        sources.append(item for _, item in self._prefix_tree.get_entries())
+        sources.extend(partition._iterate_all() for partition in self._host_partitions.values())
+        return heapq.merge(*sources, key=self._get_position)
+
+    def _get_partition(self, host):
+        """Get partition of the host, that can be changed.
+
+        Shared partition is copied and missing partition is created.
+
+        :param host: lowercased host name.
+        :returns: instance of :class:`RuleIndex`.
+        """
+        partition = self._host_partitions.get(host)
+        if partition is not None and host in self._owned_partitions:
+            return partition
+
+        if partition is None:
+            partition = RuleIndex(partition_hosts=False)
+        else:
+            partition = partition.copy()
+
+        self._host_partitions[host] = partition
+        self._owned_partitions.add(host)
+        return partition
+
+    def _insert_item(self, items, item):
+        """Insert the item into the sorted tuple.
+
+        :param items: tuple of pairs (rule ID, rule) sorted by positions.
+        :param item: pair (rule ID, rule) to insert.
+        :returns: new tuple of pairs sorted by positions.
+        """
+        position = self._get_position(item)
+        if not items or self._get_position(items[-1]) < position:
+            return items + (item, )
+
+        positions = [self._get_position(existing_item) for existing_item in items]
+        insertion_index = bisect.bisect(positions, position)
+        return items[:insertion_index] + (item, ) + items[insertion_index:]
+
+    def _get_position(self, item):
+        """Get position of the rule.
+
+        :param item: pair (rule ID, rule).
+        :returns: position of the rule in the index.
+        """
+        return self._positions[item[0]]
+
+
+def _remove_item(buckets, key, rule_id):
+    """Remove the rule from the bucket and remove the bucket if it becomes empty.
+
+    :param buckets: dictionary with tuples of pairs (rule ID, rule) by keys.
+    :param key: key of the bucket.
+    :param rule_id: ID of the rule.
+    """
+    bucket = tuple(item for item in buckets[key] if item[0] != rule_id)
+    if bucket:
+        buckets[key] = bucket
+    else:
+        del buckets[key]
+
+
+def _get_keys(rule, attribute):
+    """Get keys required by the rule.
+
+    :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+    :param attribute: name of the attribute with keys: "index_keys" or "prefix_keys".
+    :returns: tuple of pairs (feature, value).
+    """
+    try:
+        return tuple(getattr(rule, attribute))
+    except Exception:   # pylint: disable=broad-except
+        logging.getLogger(__name__).exception("Failed to obtain %s of %s", attribute, rule)
+        return ()
+
+
+def _find_value(keys, feature):
+    """Find a value of the feature among the keys.
+
+    :param keys: tuple of pairs (feature, value).
+    :param feature: name of the feature.
+    :returns: value or None if the feature is not required.
+    """
+    for key_feature, value in keys:
+        if key_feature == feature:
+            return value
+
+    return None
+
+
+def _find_feature_key(keys):
+    """Find the first key, that requires an exact value of a feature stored in buckets.
+
+    :param keys: tuple of pairs (feature, value).
+    :returns: pair (feature, value) or None if such features are not required.
+    """
+    for feature, value in keys:
+        if isinstance(feature, str) and feature.startswith(_KEYED_FEATURE_PREFIXES):
+            return (feature, value)
+
+    return None
@@ -0,0 +1,107 @@
+"""Module with mappings, that are cheap to copy."""
+
+from collections.abc import MutableMapping
+
+
+class CopyOnWriteDict(MutableMapping):
+    """Dictionary, whose copies share the stored items until they are changed.
+
+    Items are distributed among shards by the hashes of their keys. A copy shares all
+    shards with the original, and a shard is copied only when it is changed for the first
+    time after the copy. Number of shards grows with the square root of the number of
+    items, so both copying of the dictionary and the first change of a shard cost
+    about the square root of the size of the dictionary instead of its size.
+
+    :param items: iterable of pairs (key, value).
+    """
+
+    __slots__ = ("_shards", "_owned", "_mask", "_length")
+
+    def __init__(self, items=()):
+        self._shards = [{}]
+        self._owned = bytearray(b"\x01")
+        self._mask = 0
+        self._length = 0
+        for key, value in items:
+            self[key] = value
+
+    def copy(self):
+        """Create a copy of the dictionary, that can be changed independently.
+
+        :returns: new instance of :class:`CopyOnWriteDict`.
+        """
+        # pylint: disable=protected-access
+        mapping = CopyOnWriteDict.__new__(CopyOnWriteDict)
+        mapping._shards = list(self._shards)
+        mapping._owned = bytearray(len(self._shards))
+        mapping._mask = self._mask
+        mapping._length = self._length
+        self._owned = bytearray(len(self._shards))
+        return mapping
+
+    def __getitem__(self, key):
+        return self._shards[hash(key) & self._mask][key]
+
+    def get(self, key, default=None):
+        return self._shards[hash(key) & self._mask].get(key, default)
+
+    def __contains__(self, key):
+        return key in self._shards[hash(key) & self._mask]
+
+    def __setitem__(self, key, value):
+        shard = self._get_writable_shard(hash(key) & self._mask)
+        if key in shard:
+            shard[key] = value
+            return
+
+        shard[key] = value
+        self._length += 1
+        if self._length > len(self._shards) ** 2:
+            self._reshard(len(self._shards) * 2)
+
+    def __delitem__(self, key):
+        shard_index = hash(key) & self._mask
+        if key not in self._shards[shard_index]:
+            raise KeyError(key)
+
+        del self._get_writable_shard(shard_index)[key]
+        self._length -= 1
+
+    def __iter__(self):
+        for shard in self._shards:
+            yield from shard
+
+    def __len__(self):
+        return self._length
+
+    def __repr__(self):
+        return "{class_name}({items!r})".format(
+            class_name=self.__class__.__name__,
+            items=dict(self.items()),
+            )
+
+    def _get_writable_shard(self, shard_index):
+        """Get shard, that is not shared with other copies.
+
+        :param shard_index: index of the shard.
+        :returns: dictionary with items of the shard.
+        """
+        if not self._owned[shard_index]:
+            self._shards[shard_index] = self._shards[shard_index].copy()
+            self._owned[shard_index] = 1
+        return self._shards[shard_index]
+
+    def _reshard(self, shard_count):
+        """Distribute items among the new shards.
+
+        :param shard_count: number of the shards. It must be a power of 2.
+        """
+        mask = shard_count - 1
+        shards = [{} for _ in range(shard_count)]
+        for shard in self._shards:
+            for key, value in shard.items():
+                shards[hash(key) & mask][key] = value
+
+        self._shards = shards
+        self._owned = bytearray(b"\x01") * shard_count
+        self._mask = mask
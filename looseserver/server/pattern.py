@@ -0,0 +1,172 @@
+"""Module to combine regular expressions of the rules into a single pattern."""
+
+import logging
+import re
+import threading
+
+
+_DEFAULT_FLAGS = re.compile("").flags
+
+
+def get_regex_key(regex):
+    """Get hashable key of the compiled regular expression.
+
+    :param regex: compiled regular expression.
+    :returns: pair (pattern, flags).
+    """
+    return (regex.pattern, regex.flags)
+
+
+def is_combinable(regex):
+    """Check if the regular expression can be a part of the combined pattern.
+
+    Expressions with groups may contain backreferences, that depend on the numbers of
+    the groups, and expressions with global flags change the meaning of other expressions,
+    so they are matched separately.
+
+    :param regex: compiled regular expression.
+    :returns: boolean if the expression can be combined.
+    """
+    return (
+        isinstance(regex.pattern, str)
+        and regex.groups == 0
+        and regex.flags == _DEFAULT_FLAGS
+        )
+
+
+class CombinedPattern:
+    """Single pattern to find all regular expressions, that fully match a string.
+
+    Every expression is wrapped in an optional lookahead with a named group, so one match
+    of the combined pattern reports every matching expression.
+
+    :param regexes: iterable of combinable compiled regular expressions.
+    """
+
+    def __init__(self, regexes):
+        self._groups = {}
+        keys = set()
+        parts = []
+        for regex in regexes:
+            key = get_regex_key(regex)
+            if key in keys:
+                continue
+            keys.add(key)
+            group = "_{0}".format(len(self._groups))
+            self._groups[group] = key
+            parts.append("(?:(?=(?P<{group}>(?:{pattern})\\Z)))?".format(
+                group=group,
+                pattern=regex.pattern,
+                ))
+
+        self._keys = frozenset(keys)
+        self._regex = re.compile("".join(parts))
+
+    def covers(self, regex):
+        """Check if the expression is a part of the combined pattern.
+
+        :param regex: compiled regular expression.
+        :returns: boolean if the expression is covered.
+        """
+        return get_regex_key(regex) in self._keys
+
+    def match(self, value):
+        """Find all expressions, that fully match the value.
+
+        :param value: string to match.
+        :returns: frozenset with keys of the matching expressions.
+        """
+        match = self._regex.match(value)
+        if match is None:
+            return frozenset()
+
+        return frozenset(
+            self._groups[group]
+            for group, matched in match.groupdict().items()
+            if matched is not None
+            )
+
+
+class PatternCompiler:
+    """Compiler of the combined patterns, that works in background.
+
+    Combined patterns are built by a background thread, so changes of the rules are not
+    delayed by the compilation. Only the latest requested set of expressions is built.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._requested = None
+        self._built_key = None
+        self._built_patterns = None
+        self._worker = None
+
+    def get_patterns(self, key, regexes):
+        """Get combined patterns for the expressions.
+
+        If the patterns are not built yet, the compilation is started in background.
+
+        :param key: hashable key of the set of expressions.
+        :param regexes: tuple of pairs (feature, compiled regular expression).
+        :returns: dictionary with combined patterns by features or None if not ready.
+        """
+        with self._condition:
+            if self._built_key == key:
+                return self._built_patterns
+
+            if self._requested is None or self._requested[0] != key:
+                self._requested = (key, regexes)
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._build, daemon=True)
+                    self._worker.start()
+
+        return None
+
+    def wait(self, timeout=None):
+        """Wait until the requested patterns are built.
+
+        :param timeout: timeout in seconds or None to wait forever.
+        :returns: boolean if there are no pending compilations.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._worker is None, timeout=timeout)
+
+    def _build(self):
+        """Build requested patterns until there are no new requests."""
+        while True:
+            with self._condition:
+                key, regexes = self._requested
+                if key == self._built_key:
+                    self._worker = None
+                    self._condition.notify_all()
+                    return
+
+            patterns = _build_patterns(regexes)
+
+            with self._condition:
+                self._built_key = key
+                self._built_patterns = patterns
+
+
+def _build_patterns(regexes):
+    """Build combined patterns for the expressions.
+
+    :param regexes: tuple of pairs (feature, compiled regular expression).
+    :returns: dictionary with combined patterns by features.
+    """
+    features = {}
+    for feature, regex in regexes:
+        if is_combinable(regex):
+            features.setdefault(feature, []).append(regex)
+
+    patterns = {}
+    for feature, feature_regexes in features.items():
+        try:
+            patterns[feature] = CombinedPattern(feature_regexes)
+        except Exception:   # pylint: disable=broad-except
+            logging.getLogger(__name__).exception(
+                "Failed to combine regular expressions for the feature %s",
+                feature,
+                )
+
+    return patterns
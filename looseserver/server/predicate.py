@@ -0,0 +1,196 @@
+"""Module to compile rules into a graph of shared predicates."""
+
+import logging
+from collections import namedtuple
+
+from looseserver.server.mapping import CopyOnWriteDict
+
+
+_Node = namedtuple("_Node", "rule children references")
+
+
+class PredicateGraph:
+    """Directed acyclic graph of the predicates checked by the rules.
+
+    Identical predicates of different rules are represented by the same node, so
+    every distinct predicate is checked at most once per request.
+
+    Nodes are immutable, so a copy of the graph shares them with the original.
+    """
+
+    def __init__(self):
+        self._nodes = CopyOnWriteDict()
+        self._roots = CopyOnWriteDict()
+
+    def copy(self):
+        """Create a copy of the graph, that can be changed independently.
+
+        :returns: new instance of :class:`PredicateGraph`.
+        """
+        # pylint: disable=protected-access
+        graph = PredicateGraph.__new__(PredicateGraph)
+        graph._nodes = self._nodes.copy()
+        graph._roots = self._roots.copy()
+        return graph
+
+    def add_rule(self, rule_id, rule):
+        """Compile a rule into the graph.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        """
+        self.remove_rule(rule_id=rule_id)
+        self._roots[rule_id] = self._add_node(rule)
+
+    def remove_rule(self, rule_id):
+        """Remove a rule from the graph.
+
+        Nodes, that are not used by other rules, are removed too.
+
+        :param rule_id: ID of the rule.
+        """
+        key = self._roots.pop(rule_id, None)
+        if key is not None:
+            self._release_node(key)
+
+    def is_match_found(self, rule_id, request_view, results):
+        """Check if a match for the rule is found in the request.
+
+        :param rule_id: ID of the compiled rule.
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :param results: dictionary with results of the predicates checked for the request.
+            It is updated with the results of the checked predicates.
+        :returns: boolean if match is found.
+        :raises: exception, raised by one of the predicates.
+        """
+        return self._evaluate(self._roots[rule_id], request_view, results)
+
+    def _add_node(self, rule):
+        """Add node for the rule and all its conjuncts.
+
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        :returns: key of the node.
+        """
+        conjuncts = _get_conjuncts(rule)
+        if conjuncts:
+            children = tuple(self._add_node(conjunct) for conjunct in conjuncts)
+            key = ("all", children)
+            node = self._nodes.get(key)
+            if node is None:
+                node = _Node(rule=None, children=children, references=0)
+            else:
+                for child in children:
+                    self._release_node(child)
+        else:
+            predicate_key = _get_predicate_key(rule)
+            if predicate_key is None:
+                key = ("rule", id(rule))
+            else:
+                key = ("predicate", predicate_key)
+
+            node = self._nodes.get(key)
+            if node is None:
+                node = _Node(rule=rule, children=None, references=0)
+
+        self._nodes[key] = node._replace(references=node.references + 1)
+        return key
+
+    def _release_node(self, key):
+        """Release the node and remove it if it is not used anymore.
+
+        :param key: key of the node.
+        """
+        node = self._nodes[key]
+        if node.references > 1:
+            self._nodes[key] = node._replace(references=node.references - 1)
+            return
+
+        del self._nodes[key]
+        for child in node.children or ():
+            self._release_node(child)
+
+    def _evaluate(self, key, request_view, results):
+        """Evaluate the node for the request.
+
+        :param key: key of the node.
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :param results: dictionary with results of the checked predicates.
+        :returns: boolean if match is found.
+        """
+        try:
+            result = results[key]
+        except KeyError:
+            pass
+        else:
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        node = self._nodes[key]
+        try:
+            if node.children is None:
+                result = bool(node.rule.is_match_found(request_view.select_for(node.rule)))
+            else:
+                result = all(
+                    self._evaluate(child, request_view, results)
+                    for child in node.children
+                    )
+        except Exception as error:
+            results[key] = error
+            raise
+
+        results[key] = result
+        return result
+
+
+def get_leaf_keys(rule):
+    """Get keys of all leaf predicates, that must be satisfied for the rule to find a match.
+
+    :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+    :returns: frozenset of predicate keys or None if any of the predicates has no key.
+    """
+    conjuncts = _get_conjuncts(rule)
+    if not conjuncts:
+        predicate_key = _get_predicate_key(rule)
+        if predicate_key is None:
+            return None
+        return frozenset((predicate_key, ))
+
+    keys = set()
+    for conjunct in conjuncts:
+        conjunct_keys = get_leaf_keys(conjunct)
+        if conjunct_keys is None:
+            return None
+        keys.update(conjunct_keys)
+    return frozenset(keys)
+
+
+def _get_conjuncts(rule):
+    """Get conjuncts of the rule.
+
+    :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+    :returns: tuple of rules or None.
+    """
+    try:
+        return rule.conjuncts
+    except Exception:   # pylint: disable=broad-except
+        logging.getLogger(__name__).exception("Failed to obtain conjuncts of %s", rule)
+        return None
+
+
+def _get_predicate_key(rule):
+    """Get predicate key of the rule.
+
+    :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+    :returns: hashable key or None.
+    """
+    try:
+        predicate_key = rule.predicate_key
+        hash(predicate_key)
+    except Exception:   # pylint: disable=broad-except
+        logging.getLogger(__name__).exception("Failed to obtain predicate key of %s", rule)
+        return None
+
+    return predicate_key
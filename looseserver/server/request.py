@@ -0,0 +1,194 @@
+"""Module with a parsed view of the incoming request."""
+
+import hashlib
+import json
+from urllib.parse import urlparse
+
+from looseserver.server.pattern import get_regex_key
+
+
+PATH_FEATURE = "path"
+METHOD_FEATURE = "method"
+HOST_FEATURE = "host"
+BODY_DIGEST_FEATURE = "body_digest"
+HEADER_FEATURE_PREFIX = "header:"
+QUERY_FEATURE_PREFIX = "query:"
+
+INVALID_JSON = object()
+
+
+def get_header_feature(name):
+    """Get name of the request feature for the header.
+
+    :param name: case-insensitive name of the header.
+    :returns: name of the feature.
+    """
+    return HEADER_FEATURE_PREFIX + name.lower()
+
+
+def get_query_feature(name):
+    """Get name of the request feature for the query parameter.
+
+    :param name: case-sensitive name of the parameter.
+    :returns: name of the feature.
+    """
+    return QUERY_FEATURE_PREFIX + name
+
+
+class _LazyAttribute:
+    """Descriptor to compute value of the attribute on the first access."""
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, function):
+        self._function = function
+        self._name = function.__name__
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = self._function(instance)
+        instance.__dict__[self._name] = value
+        return value
+
+
+class RequestView:
+    """Lightweight view of the request shared by all rules.
+
+    Every attribute is computed once on the first access.
+
+    :param request: instance of :class:flask.Request.
+    """
+
+    def __init__(self, request):
+        get_current_object = getattr(request, "_get_current_object", None)
+        if get_current_object is not None:
+            request = get_current_object()
+        self._request = request
+        self._combined_patterns = {}
+        self._regex_matches = {}
+
+    @property
+    def request(self):
+        """Underlying :class:flask.Request."""
+        return self._request
+
+    @_LazyAttribute
+    def path(self):
+        """Path of the requested url."""
+        return urlparse(self._request.base_url).path
+
+    @_LazyAttribute
+    def method(self):
+        """Method of the request."""
+        return self._request.method
+
+    @_LazyAttribute
+    def host(self):
+        """Lowercased host name of the request without port."""
+        return (urlparse(self._request.host_url).hostname or "").lower()
+
+    @_LazyAttribute
+    def headers(self):
+        """Dictionary with headers of the request. Names of the headers are lowercased."""
+        headers = {}
+        for name, value in self._request.headers.items():
+            headers.setdefault(name.lower(), value)
+        return headers
+
+    @_LazyAttribute
+    def query(self):
+        """Multi dictionary with query parameters parsed once per request."""
+        return self._request.args
+
+    @_LazyAttribute
+    def body(self):
+        """Bytes of the request body."""
+        return self._request.get_data(cache=True)
+
+    @_LazyAttribute
+    def body_digest(self):
+        """Hexadecimal SHA-256 digest of the request body."""
+        return hashlib.sha256(self.body).hexdigest()
+
+    @_LazyAttribute
+    def json_body(self):
+        """Parsed JSON body of the request or :data:`INVALID_JSON` if the body is not
+        a valid JSON document in UTF-8."""
+        try:
+            return json.loads(self.body.decode("utf-8"))
+        except ValueError:
+            return INVALID_JSON
+
+    def get_feature(self, feature):
+        """Get value of the request feature.
+
+        :param feature: name of the feature.
+        :returns: value of the feature. Value of the missing header or query parameter
+            is None. Value of the repeated query parameter is its first value.
+        :raises: :class:KeyError if feature is unknown.
+        """
+        if feature == PATH_FEATURE:
+            return self.path
+
+        if feature == METHOD_FEATURE:
+            return self.method
+
+        if feature == HOST_FEATURE:
+            return self.host
+
+        if feature == BODY_DIGEST_FEATURE:
+            return self.body_digest
+
+        if feature.startswith(HEADER_FEATURE_PREFIX):
+            return self.headers.get(feature[len(HEADER_FEATURE_PREFIX):])
+
+        if feature.startswith(QUERY_FEATURE_PREFIX):
+            return self.query.get(feature[len(QUERY_FEATURE_PREFIX):])
+
+        raise KeyError("Unknown feature: '{0}'".format(feature))
+
+    def set_combined_patterns(self, patterns):
+        """Set combined patterns to match regular expressions of the rules.
+
+        :param patterns: dictionary with
+            :class:`CombinedPattern <looseserver.server.pattern.CombinedPattern>` by features.
+        """
+        self._combined_patterns = patterns
+        self._regex_matches = {}
+
+    def match_regex(self, feature, regex):
+        """Check if the regular expression fully matches value of the feature.
+
+        Expressions, covered by a combined pattern, are checked with a single match of
+        the combined pattern per request.
+
+        :param feature: name of the feature.
+        :param regex: compiled regular expression.
+        :returns: boolean if the expression matches. Missing value never matches.
+        """
+        value = self.get_feature(feature)
+        if value is None:
+            return False
+
+        pattern = self._combined_patterns.get(feature)
+        if pattern is None or not pattern.covers(regex):
+            return regex.fullmatch(value) is not None
+
+        matches = self._regex_matches.get(feature)
+        if matches is None:
+            matches = pattern.match(value)
+            self._regex_matches[feature] = matches
+
+        return get_regex_key(regex) in matches
+
+    def select_for(self, rule):
+        """Select the representation of the request, that the rule checks.
+
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        :returns: the request view if the rule uses it, underlying request otherwise.
+        """
+        if getattr(rule, "uses_request_view", False):
+            return self
+        return self._request
@@ -4,7 +4,14 @@ from abc import ABC, abstractmethod
 
 
 class ServerRule(ABC):
-    """Class for abstract rule."""
+    """Class for abstract rule.
+
+    Rules, that set the class attribute uses_request_view to True, receive
+    :class:`RequestView <looseserver.server.request.RequestView>` instead of
+    :class:flask.Request in :meth:`is_match_found`.
+    """
+
+    uses_request_view = False
 
     def __init__(self, rule_type):
         self._type = rule_type
@@ -14,10 +21,75 @@ class ServerRule(ABC):
         """Type of the rule."""
         return self._type
 
+    @property
+    def index_keys(self):
+        """Exact request features required by the rule.
+
+        Each key is a pair (feature, value). The rule can find a match only in requests,
+        whose features are equal to the specified values.
+
+        :returns: tuple of pairs. Empty tuple means that the rule can't be indexed.
+        """
+        return ()
+
+    @property
+    def prefix_keys(self):
+        """Prefixes of request features required by the rule.
+
+        Each key is a pair (feature, prefix). The rule can find a match only in requests,
+        whose features start with the specified prefixes.
+
+        :returns: tuple of pairs. Empty tuple means that the rule can't be indexed by prefix.
+        """
+        return ()
+
+    @property
+    def regex_keys(self):
+        """Regular expressions of request features checked by the rule.
+
+        Each key is a pair (feature, compiled regular expression). Expressions of all rules
+        are combined into a single pattern, if the rule checks them with
+        :meth:`RequestView.match_regex <looseserver.server.request.RequestView.match_regex>`.
+
+        :returns: tuple of pairs.
+        """
+        return ()
+
+    @property
+    def features(self):
+        """Names of the request features, the result of the match depends on.
+
+        Results of the rules, that declare their features, can be cached by the values
+        of these features.
+
+        :returns: frozenset of feature names or None if features are unknown.
+        """
+        return None
+
+    @property
+    def predicate_key(self):
+        """Hashable key of the predicate checked by the rule.
+
+        Rules with equal keys must find matches in exactly the same requests, so the result
+        of one of them can be reused for the others.
+
+        :returns: hashable object or None if the predicate can't be shared.
+        """
+        return None
+
+    @property
+    def conjuncts(self):
+        """Rules, all of which must find a match for this rule to find a match.
+
+        :returns: tuple of rules or None if the rule is not a conjunction.
+        """
+        return None
+
     @abstractmethod
     def is_match_found(self, request):
         """Check if a match for the rule is found in the request.
 
-        :param request: instance of :class:flask.Request.
+        :param request: instance of :class:flask.Request or
+            :class:`RequestView <looseserver.server.request.RequestView>` if the rule uses it.
         :returns: boolean if match is found.
         """
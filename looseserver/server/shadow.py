@@ -0,0 +1,187 @@
+"""Module to find rules, that are shadowed by the preceding rules."""
+
+from collections import OrderedDict
+from itertools import combinations
+
+from looseserver.server.mapping import CopyOnWriteDict
+from looseserver.server.predicate import get_leaf_keys
+
+
+MAX_ANALYZED_PREDICATES = 8
+
+
+def find_shadowed_rules(rules):
+    """Find rules, that can't find a match, unless one of the preceding rules finds it too.
+
+    Rule is shadowed by a preceding rule, if predicates of the preceding rule are a subset
+    of its own predicates. Rules with predicates without keys and rules with more than
+    :data:`MAX_ANALYZED_PREDICATES` predicates are not analyzed.
+
+    :param rules: iterable of pairs (rule ID, rule) in the order of the rules.
+    :returns: ordered dictionary with IDs of the first shadowing rules by IDs of
+        the shadowed rules in the order of the shadowed rules.
+    """
+    analysis = ShadowAnalysis()
+    for order, (rule_id, rule) in enumerate(rules):
+        analysis.add_rule(rule_id=rule_id, rule=rule, position=order)
+    return analysis.get_shadowed_rules()
+
+
+class ShadowAnalysis:
+    """Analysis of the shadowed rules, that is updated with every added or removed rule.
+
+    Rules added after all analyzed rules and removed rules only update the rules, that
+    can be affected by them, so the cost of the update doesn't depend on the number of
+    the rules. Analysis is rebuilt if a rule is added before the analyzed rules.
+
+    Mappings are copied on write, so a copy of the analysis shares them with the original.
+    """
+
+    def __init__(self):
+        self._rule_keys = CopyOnWriteDict()
+        self._key_rules = CopyOnWriteDict()
+        self._shadowing_rules = CopyOnWriteDict()
+        self._shadowed_rules = CopyOnWriteDict()
+        self._last_position = None
+
+    def copy(self):
+        """Create a copy of the analysis, that can be changed independently.
+
+        :returns: new instance of :class:`ShadowAnalysis`.
+        """
+        # pylint: disable=protected-access
+        analysis = ShadowAnalysis.__new__(ShadowAnalysis)
+        analysis._rule_keys = self._rule_keys.copy()
+        analysis._key_rules = self._key_rules.copy()
+        analysis._shadowing_rules = self._shadowing_rules.copy()
+        analysis._shadowed_rules = self._shadowed_rules.copy()
+        analysis._last_position = self._last_position
+        return analysis
+
+    @property
+    def shadowing_rules(self):
+        """Mapping from IDs of the shadowed rules to IDs of their first shadowing rules.
+        It must not be changed."""
+        return self._shadowing_rules
+
+    def get_shadowed_rules(self):
+        """Get shadowed rules in their order.
+
+        :returns: ordered dictionary with IDs of the first shadowing rules by IDs of
+            the shadowed rules.
+        """
+        shadowed_rule_ids = sorted(
+            self._shadowing_rules,
+            key=lambda rule_id: self._rule_keys[rule_id][0],
+            )
+        return OrderedDict(
+            (rule_id, self._shadowing_rules[rule_id]) for rule_id in shadowed_rule_ids
+            )
+
+    def add_rule(self, rule_id, rule, position):
+        """Add a rule to the analysis.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        :param position: comparable position of the rule among all rules.
+        """
+        leaf_keys = get_leaf_keys(rule)
+        if not leaf_keys or len(leaf_keys) > MAX_ANALYZED_PREDICATES:
+            return
+
+        if self._last_position is not None and position < self._last_position:
+            self._rebuild(added_entry=(rule_id, position, leaf_keys))
+            return
+
+        self._add_entry(rule_id=rule_id, position=position, leaf_keys=leaf_keys)
+
+    def remove_rule(self, rule_id):
+        """Remove a rule from the analysis.
+
+        Rules shadowed by the removed rule are analyzed again.
+
+        :param rule_id: ID of the rule.
+        """
+        entry = self._rule_keys.pop(rule_id, None)
+        if entry is None:
+            return
+
+        _, leaf_keys = entry
+        key_rules = tuple(item for item in self._key_rules[leaf_keys] if item[1] != rule_id)
+        if key_rules:
+            self._key_rules[leaf_keys] = key_rules
+        else:
+            del self._key_rules[leaf_keys]
+
+        shadowing_rule_id = self._shadowing_rules.pop(rule_id, None)
+        if shadowing_rule_id is not None:
+            self._unlink(shadowing_rule_id=shadowing_rule_id, shadowed_rule_id=rule_id)
+
+        for shadowed_rule_id in self._shadowed_rules.pop(rule_id, ()):
+            del self._shadowing_rules[shadowed_rule_id]
+            self._link(shadowed_rule_id)
+
+    def _add_entry(self, rule_id, position, leaf_keys):
+        """Add a rule, that follows all analyzed rules.
+
+        :param rule_id: ID of the rule.
+        :param position: position of the rule.
+        :param leaf_keys: frozenset of predicate keys of the rule.
+        """
+        self._rule_keys[rule_id] = (position, leaf_keys)
+        self._key_rules[leaf_keys] = self._key_rules.get(leaf_keys, ()) + ((position, rule_id), )
+        self._last_position = position
+        self._link(rule_id)
+
+    def _link(self, rule_id):
+        """Find the first shadowing rule of the rule and link them.
+
+        :param rule_id: ID of the analyzed rule.
+        """
+        position, leaf_keys = self._rule_keys[rule_id]
+        shadowing_rules = []
+        for size in range(1, len(leaf_keys) + 1):
+            for subset in combinations(leaf_keys, size):
+                key_rules = self._key_rules.get(frozenset(subset))
+                if key_rules and key_rules[0][0] < position:
+                    shadowing_rules.append(key_rules[0])
+
+        if not shadowing_rules:
+            return
+
+        _, shadowing_rule_id = min(shadowing_rules)
+        self._shadowing_rules[rule_id] = shadowing_rule_id
+        self._shadowed_rules[shadowing_rule_id] = (
+            self._shadowed_rules.get(shadowing_rule_id, frozenset()) | {rule_id}
+            )
+
+    def _unlink(self, shadowing_rule_id, shadowed_rule_id):
+        """Remove the shadowed rule from the rules shadowed by the shadowing rule.
+
+        :param shadowing_rule_id: ID of the shadowing rule.
+        :param shadowed_rule_id: ID of the shadowed rule.
+        """
+        shadowed_rule_ids = self._shadowed_rules[shadowing_rule_id] - {shadowed_rule_id}
+        if shadowed_rule_ids:
+            self._shadowed_rules[shadowing_rule_id] = shadowed_rule_ids
+        else:
+            del self._shadowed_rules[shadowing_rule_id]
+
+    def _rebuild(self, added_entry):
+        """Analyze all rules again in their order.
+
+        :param added_entry: triple (rule ID, position, leaf keys) of the added rule.
+        """
+        entries = [
+            (rule_id, position, leaf_keys)
+            for rule_id, (position, leaf_keys) in self._rule_keys.items()
+            ]
+        entries.append(added_entry)
+        entries.sort(key=lambda entry: entry[1])
+
+        self._rule_keys = CopyOnWriteDict()
+        self._key_rules = CopyOnWriteDict()
+        self._shadowing_rules = CopyOnWriteDict()
+        self._shadowed_rules = CopyOnWriteDict()
+        for rule_id, position, leaf_keys in entries:
+            self._add_entry(rule_id=rule_id, position=position, leaf_keys=leaf_keys)
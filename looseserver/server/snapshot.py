@@ -0,0 +1,568 @@
+"""Module with snapshots of the configured rules."""
+
+import logging
+from collections import Counter
+
+from looseserver.server.index import RuleIndex
+from looseserver.server.mapping import CopyOnWriteDict
+from looseserver.server.predicate import PredicateGraph
+from looseserver.server.pattern import PatternCompiler, get_regex_key
+from looseserver.server.shadow import ShadowAnalysis
+from looseserver.server.adaptive import HitCounter, find_disjoint_runs, rank_rules
+
+
+_MISSING = object()
+
+
+class RuleSnapshot:
+    """Snapshot of the rules and their responses used to dispatch requests.
+
+    Published snapshot must not be changed. Changes are applied to a copy of the snapshot,
+    that replaces the published one, so requests are always dispatched against
+    a consistent set of rules without locking.
+
+    Only armed rules, i.e. rules with responses, are indexed and checked during dispatch.
+    Armed rules, that are shadowed by preceding rules, are checked only if the response
+    of the shadowing rule has failed.
+
+    In adaptive mode, matches of the rules are counted and runs of consecutive rules,
+    that can't find a match in the same request, are reordered by :meth:`reorder_rules`,
+    so that frequently matching rules are checked first.
+
+    Rules with use counters are dispatched only while they have remaining uses.
+    A use is acquired for every match, that is yielded by :meth:`find_matches`.
+
+    :param compile_predicates: boolean if rules should be compiled into a graph of
+        shared predicates.
+    :param adaptive: boolean if rules should be reordered by the frequency of matches.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, compile_predicates=False, adaptive=False):
+        self._version = 0
+        self._rules = CopyOnWriteDict()
+        self._positions = CopyOnWriteDict()
+        self._next_position = 0
+        self._responses = CopyOnWriteDict()
+        self._index = RuleIndex()
+        self._predicates = PredicateGraph() if compile_predicates else None
+        self._rule_features = CopyOnWriteDict()
+        self._feature_references = Counter()
+        self._cache_features = ()
+        self._uncacheable_rules = 0
+        self._pattern_compiler = PatternCompiler()
+        self._rule_regexes = CopyOnWriteDict()
+        self._regex_references = CopyOnWriteDict()
+        self._regexes = ()
+        self._regexes_token = None
+        self._shadow_analysis = ShadowAnalysis()
+        self._hit_counter = HitCounter() if adaptive else None
+        self._ranks = {}
+        self._ranked_until = None
+        self._use_counters = CopyOnWriteDict()
+
+    @property
+    def version(self):
+        """Version of the snapshot. It is increased by every change."""
+        return self._version
+
+    @property
+    def pattern_compiler(self):
+        """:class:`PatternCompiler <looseserver.server.pattern.PatternCompiler>` shared by
+        all copies of the snapshot."""
+        return self._pattern_compiler
+
+    @property
+    def rules(self):
+        """Mapping from rule IDs to rules. It must not be changed."""
+        return self._rules
+
+    @property
+    def responses(self):
+        """Mapping from rule IDs to responses. It must not be changed."""
+        return self._responses
+
+    def copy(self):
+        """Create a copy of the snapshot, that can be changed independently.
+
+        :returns: new instance of :class:`RuleSnapshot`.
+        """
+        # pylint: disable=protected-access
+        snapshot = RuleSnapshot.__new__(RuleSnapshot)
+        snapshot._version = self._version
+        snapshot._rules = self._rules.copy()
+        snapshot._positions = self._positions.copy()
+        snapshot._next_position = self._next_position
+        snapshot._responses = self._responses.copy()
+        snapshot._index = self._index.copy()
+        snapshot._predicates = None if self._predicates is None else self._predicates.copy()
+        snapshot._rule_features = self._rule_features.copy()
+        snapshot._feature_references = self._feature_references.copy()
+        snapshot._cache_features = self._cache_features
+        snapshot._uncacheable_rules = self._uncacheable_rules
+        snapshot._pattern_compiler = self._pattern_compiler
+        snapshot._rule_regexes = self._rule_regexes.copy()
+        snapshot._regex_references = self._regex_references.copy()
+        snapshot._regexes = self._regexes
+        snapshot._regexes_token = self._regexes_token
+        snapshot._shadow_analysis = self._shadow_analysis.copy()
+        snapshot._hit_counter = self._hit_counter
+        snapshot._ranks = self._ranks
+        snapshot._ranked_until = self._ranked_until
+        snapshot._use_counters = self._use_counters.copy()
+        return snapshot
+
+    def add_rule(self, rule_id, rule, use_counter=None):
+        """Add a rule after all existing rules.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        :param use_counter: counter of the remaining uses of the rule with method
+            ``acquire``, that returns boolean if a use has been acquired, and property
+            ``remaining``. Uses are unlimited if not specified.
+        """
+        position = self._next_position
+        self._next_position += 1
+
+        self._rules[rule_id] = rule
+        self._positions[rule_id] = position
+        if use_counter is not None:
+            self._use_counters[rule_id] = use_counter
+        self._version += 1
+
+    def remove_rule(self, rule_id):
+        """Remove a rule and its response.
+
+        :param rule_id: ID of the rule.
+        """
+        self._rules.pop(rule_id, None)
+        self._positions.pop(rule_id, None)
+        self._use_counters.pop(rule_id, None)
+        if self._responses.pop(rule_id, None) is not None:
+            self._index.remove_rule(rule_id=rule_id)
+            if self._predicates is not None:
+                self._predicates.remove_rule(rule_id=rule_id)
+            self._unregister_features(rule_id=rule_id)
+            self._unregister_regexes(rule_id=rule_id)
+            self._shadow_analysis.remove_rule(rule_id=rule_id)
+        self._version += 1
+
+    def get_remaining_uses(self, rule_id):
+        """Get number of the remaining uses of the rule.
+
+        :param rule_id: ID of the rule.
+        :returns: number of uses or None if uses are unlimited or the rule does not exist.
+        """
+        use_counter = self._use_counters.get(rule_id)
+        if use_counter is None:
+            return None
+        return use_counter.remaining
+
+    def get_rules_order(self):
+        """Get order of the rules.
+
+        :returns: tuple with rule IDs.
+        """
+        return tuple(sorted(self._rules, key=self._positions.__getitem__))
+
+    def set_response(self, rule_id, response):
+        """Set a response for the existing rule.
+
+        The rule is armed by its first response, so it is dispatched since then.
+
+        :param rule_id: ID of the rule.
+        :param response: instance of
+            :class:`ServerResponse <looseserver.server.response.ServerResponse>`.
+        """
+        if rule_id not in self._responses:
+            self._arm_rule(rule_id=rule_id, rule=self._rules[rule_id])
+
+        self._responses[rule_id] = response
+        self._version += 1
+
+    def reorder_rules(self):
+        """Reorder disjoint rules by the number of their matches since the last reordering.
+
+        Only the order of the rules, that can't find a match in the same request, is
+        changed, so the result of the dispatch stays the same. Nothing is done if
+        the snapshot is not adaptive. Index is rebuilt only if the ranks have changed,
+        so it is kept when every run consists of a single rule.
+
+        :returns: boolean if the order of the rules has changed.
+        """
+        if self._hit_counter is None:
+            return False
+
+        armed_rule_ids = sorted(self._responses, key=self._positions.__getitem__)
+        runs = find_disjoint_runs((rule_id, self._rules[rule_id]) for rule_id in armed_rule_ids)
+        ranks = rank_rules(
+            runs=runs,
+            positions=self._positions,
+            hit_counts=self._hit_counter.collect(armed_rule_ids),
+            )
+        self._ranked_until = self._positions[armed_rule_ids[-1]] if ranks else None
+        if ranks == self._ranks:
+            return False
+
+        self._ranks = ranks
+        self._rebuild_index()
+        return True
+
+    def _get_rank(self, rule_id):
+        """Get rank of the rule, that defines its order in the index.
+
+        :param rule_id: ID of the rule.
+        :returns: position of the rule or its rank in adaptive mode.
+        """
+        position = self._positions[rule_id]
+        if self._hit_counter is None:
+            return position
+        return self._ranks.get(rule_id, (position, 0))
+
+    def _rebuild_index(self):
+        """Build the index of the armed rules from scratch."""
+        index = RuleIndex()
+        for rule_id in sorted(self._responses, key=self._get_rank):
+            rule = self._rules[rule_id]
+            index.add_rule(rule_id=rule_id, rule=rule, position=self._get_rank(rule_id))
+        self._index = index
+
+    def _arm_rule(self, rule_id, rule):
+        """Add the rule to the structures used to dispatch requests.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        """
+        if self._ranked_until is not None and self._positions[rule_id] < self._ranked_until:
+            self._ranks = {}
+            self._ranked_until = None
+            self._rebuild_index()
+
+        self._index.add_rule(rule_id=rule_id, rule=rule, position=self._get_rank(rule_id))
+        if self._predicates is not None:
+            self._predicates.add_rule(rule_id=rule_id, rule=rule)
+        self._register_features(rule_id=rule_id, rule=rule)
+        self._register_regexes(rule_id=rule_id, rule=rule)
+        self._shadow_analysis.add_rule(
+            rule_id=rule_id,
+            rule=rule,
+            position=self._positions[rule_id],
+            )
+
+    def get_shadowed_rules(self):
+        """Get armed rules, that are shadowed by the preceding armed rules.
+
+        Analysis is updated when rules are armed or removed, so it is ready before
+        the snapshot is published.
+
+        :returns: ordered dictionary with IDs of the shadowing rules by IDs of
+            the shadowed rules in the order of the shadowed rules.
+        """
+        return self._shadow_analysis.get_shadowed_rules()
+
+    def find_matches(self, request_view, match_cache=None, negative_cache=None):
+        """Find rules with responses, that find a match in the request.
+
+        Regular expressions of the rules are matched with combined patterns, once they are
+        built in background.
+
+        If the match cache is specified, the first matching rule among the rules with known
+        features is cached by the values of these features. Other rules are always checked.
+
+        If the negative cache is specified, requests, that are not matched by any rule with
+        known features, are cached by the same values, so that only the other rules are
+        checked for them.
+
+        Rules without remaining uses are skipped, but rules shadowed by them are checked.
+
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :param match_cache: :class:`LRUCache <looseserver.server.cache.LRUCache>` for matches.
+        :param negative_cache: :class:`LRUCache <looseserver.server.cache.LRUCache>`
+            for misses.
+        :returns: iterator over pairs (rule, response) in the order of the rules.
+        """
+        version = self._version
+        self._set_combined_patterns(request_view)
+
+        cache_key, cached_rule_id = self._lookup_caches(
+            request_view=request_view,
+            match_cache=match_cache,
+            negative_cache=negative_cache,
+            )
+        if cached_rule_id is None and not self._uncacheable_rules:
+            return
+
+        shadowing_rules = self._shadow_analysis.shadowing_rules
+        found_rule_ids = set()
+
+        predicate_results = {}
+        for rule_id, rule in self._index.find_candidates(request_view):
+            shadowing_rule_id = shadowing_rules.get(rule_id)
+            if shadowing_rule_id is not None and shadowing_rule_id not in found_rule_ids:
+                continue
+
+            cacheable = self._rule_features.get(rule_id) is not None
+
+            if cacheable and cached_rule_id is not _MISSING:
+                if rule_id != cached_rule_id:
+                    continue
+                match_found = True
+                cached_rule_id = _MISSING
+                cache_key = None
+            else:
+                match_found = self._is_match_found(
+                    rule_id=rule_id,
+                    rule=rule,
+                    request_view=request_view,
+                    predicate_results=predicate_results,
+                    )
+
+            if not match_found:
+                continue
+
+            if cacheable and cache_key is not None:
+                if match_cache is not None:
+                    match_cache.set(version, cache_key, rule_id)
+                cache_key = None
+
+            found_rule_ids.add(rule_id)
+            if not self._acquire_use(rule_id):
+                continue
+
+            if self._hit_counter is not None:
+                self._hit_counter.add(rule_id)
+            yield rule, self._responses[rule_id]
+
+        if cache_key is not None and cached_rule_id is _MISSING:
+            self._cache_miss(
+                version=version,
+                cache_key=cache_key,
+                match_cache=match_cache,
+                negative_cache=negative_cache,
+                )
+
+    def _acquire_use(self, rule_id):
+        """Acquire a use of the rule.
+
+        :param rule_id: ID of the rule.
+        :returns: boolean if the rule can be used.
+        """
+        use_counter = self._use_counters.get(rule_id)
+        if use_counter is None:
+            return True
+
+        try:
+            return use_counter.acquire()
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception(
+                "Failed to acquire a use of the rule with ID %s",
+                rule_id,
+                )
+            return False
+
+    def _set_combined_patterns(self, request_view):
+        """Set combined patterns of the regular expressions to the request view if ready.
+
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        """
+        if not self._regexes:
+            return
+
+        patterns = self._pattern_compiler.get_patterns(
+            key=self._regexes_token,
+            regexes=self._regexes,
+            )
+        if patterns:
+            request_view.set_combined_patterns(patterns)
+
+    def _lookup_caches(self, request_view, match_cache, negative_cache):
+        """Find the cached matching rule for the request.
+
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :param match_cache: :class:`LRUCache <looseserver.server.cache.LRUCache>` for matches
+            or None.
+        :param negative_cache: :class:`LRUCache <looseserver.server.cache.LRUCache>`
+            for misses or None.
+        :returns: pair (key of the request in the caches, cached rule ID). Key is None if
+            caches can't be used. Rule ID is None if no rule matches or _MISSING if nothing
+            is cached.
+        """
+        if match_cache is None and negative_cache is None:
+            return None, _MISSING
+
+        cache_key = self._build_cache_key(request_view)
+        if cache_key is None:
+            return None, _MISSING
+
+        if negative_cache is not None and negative_cache.get(self._version, cache_key, False):
+            return cache_key, None
+
+        if match_cache is not None:
+            return cache_key, match_cache.get(self._version, cache_key, default=_MISSING)
+
+        return cache_key, _MISSING
+
+    @staticmethod
+    def _cache_miss(version, cache_key, match_cache, negative_cache):
+        """Cache the request without matches.
+
+        Misses are cached in the negative cache if it is enabled, otherwise in the match cache.
+
+        :param version: version of the snapshot.
+        :param cache_key: key of the request in the caches.
+        :param match_cache: :class:`LRUCache <looseserver.server.cache.LRUCache>` for matches
+            or None.
+        :param negative_cache: :class:`LRUCache <looseserver.server.cache.LRUCache>`
+            for misses or None.
+        """
+        if negative_cache is not None:
+            negative_cache.set(version, cache_key, True)
+        else:
+            match_cache.set(version, cache_key, None)
+
+    def _is_match_found(self, rule_id, rule, request_view, predicate_results):
+        """Check if a match for the rule is found in the request.
+
+        Exceptions, raised by the rule, are logged and considered as no match.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :param predicate_results: dictionary with results of the compiled predicates.
+        :returns: boolean if match is found.
+        """
+        try:
+            if self._predicates is None:
+                return rule.is_match_found(request_view.select_for(rule))
+
+            return self._predicates.is_match_found(
+                rule_id=rule_id,
+                request_view=request_view,
+                results=predicate_results,
+                )
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception(
+                "Error occured on attempt to find a match by %s",
+                rule,
+                )
+            return False
+
+    def _build_cache_key(self, request_view):
+        """Build a key for the match cache from the features of the request.
+
+        :param request_view: :class:`RequestView <looseserver.server.request.RequestView>`
+            of the request.
+        :returns: tuple with values of the features or None if the cache can't be used.
+        """
+        try:
+            cache_key = tuple(
+                request_view.get_feature(feature)
+                for feature in self._cache_features
+                )
+            hash(cache_key)
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("Failed to build a key for the match cache")
+            return None
+
+        return cache_key
+
+    def _register_features(self, rule_id, rule):
+        """Register request features, the rule depends on.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        """
+        try:
+            features = rule.features
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("Failed to obtain features of %s", rule)
+            features = None
+
+        if features is None:
+            self._uncacheable_rules += 1
+        else:
+            features = frozenset(features)
+            self._feature_references.update(features)
+            if not features.issubset(self._cache_features):
+                self._cache_features = tuple(sorted(self._feature_references))
+
+        self._rule_features[rule_id] = features
+
+    def _unregister_features(self, rule_id):
+        """Unregister request features of the rule.
+
+        :param rule_id: ID of the rule.
+        """
+        if rule_id not in self._rule_features:
+            return
+
+        features = self._rule_features.pop(rule_id)
+        if features is None:
+            self._uncacheable_rules -= 1
+            return
+
+        self._feature_references.subtract(features)
+        unused_features = [
+            feature for feature in features
+            if self._feature_references[feature] <= 0
+            ]
+        if unused_features:
+            for feature in unused_features:
+                del self._feature_references[feature]
+            self._cache_features = tuple(sorted(self._feature_references))
+
+    def _register_regexes(self, rule_id, rule):
+        """Register regular expressions checked by the rule.
+
+        :param rule_id: ID of the rule.
+        :param rule: instance of :class:`ServerRule <looseserver.server.rule.ServerRule>`.
+        """
+        try:
+            regexes = tuple(rule.regex_keys)
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger(__name__).exception("Failed to obtain regex keys of %s", rule)
+            return
+
+        if not regexes:
+            return
+
+        self._rule_regexes[rule_id] = regexes
+        new_regexes = []
+        for feature, regex in regexes:
+            key = (feature, get_regex_key(regex))
+            references = self._regex_references.get(key, 0)
+            if not references:
+                new_regexes.append((feature, regex))
+            self._regex_references[key] = references + 1
+
+        if new_regexes:
+            self._regexes += tuple(new_regexes)
+            self._regexes_token = object()
+
+    def _unregister_regexes(self, rule_id):
+        """Unregister regular expressions of the rule.
+
+        :param rule_id: ID of the rule.
+        """
+        regexes = self._rule_regexes.pop(rule_id, None)
+        if not regexes:
+            return
+
+        unused_keys = set()
+        for feature, regex in regexes:
+            key = (feature, get_regex_key(regex))
+            self._regex_references[key] -= 1
+            if self._regex_references[key] <= 0:
+                del self._regex_references[key]
+                unused_keys.add(key)
+
+        if unused_keys:
+            self._regexes = tuple(
+                (feature, regex) for feature, regex in self._regexes
+                if (feature, get_regex_key(regex)) not in unused_keys
+                )
+            self._regexes_token = object()
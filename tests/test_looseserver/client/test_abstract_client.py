@@ -37,6 +37,58 @@ def test_create_rule(client_rule_factory, client_response_factory, registered_ru
     assert created_rule.rule_id == rule_id, "Rule ID has not been set"
 
 
+def test_create_rule_with_ttl(client_rule_factory, client_response_factory, registered_rule):
+    """Check that client sends TTL of the rule.
+
+    1. Create a subclass of the abstract client.
+    2. Implement send request so that it checks the request data.
+    3. Invoke the create_rule method with TTL.
+    """
+    class _Client(AbstractClient):
+        def _send_request(self, url, method="GET", json=None):
+            expected_json = self._rule_factory.serialize_rule(rule=registered_rule)
+            expected_json["ttl"] = 10
+            assert json == expected_json, "Wrong rule data"
+
+            response_json = {"rule_id": str(uuid.uuid4())}
+            response_json.update(json)
+            return response_json
+
+    client = _Client(
+        configuration_url="/",
+        rule_factory=client_rule_factory,
+        response_factory=client_response_factory,
+        )
+    client.create_rule(rule=registered_rule, ttl=10)
+
+
+def test_create_limited_rule(client_rule_factory, client_response_factory, registered_rule):
+    """Check that client sends and obtains remaining uses of the rule.
+
+    1. Create a subclass of the abstract client.
+    2. Implement send request so that it checks the request data.
+    3. Invoke the create_rule method with remaining uses.
+    4. Check remaining uses of the created rule.
+    """
+    class _Client(AbstractClient):
+        def _send_request(self, url, method="GET", json=None):
+            expected_json = self._rule_factory.serialize_rule(rule=registered_rule)
+            expected_json["remaining_uses"] = 2
+            assert json == expected_json, "Wrong rule data"
+
+            response_json = {"rule_id": str(uuid.uuid4())}
+            response_json.update(json)
+            return response_json
+
+    client = _Client(
+        configuration_url="/",
+        rule_factory=client_rule_factory,
+        response_factory=client_response_factory,
+        )
+    created_rule = client.create_rule(rule=registered_rule, remaining_uses=2)
+    assert created_rule.remaining_uses == 2, "Wrong remaining uses"
+
+
 def test_get_rule(client_rule_factory, client_response_factory, registered_rule):
     """Check request data that client uses to get a rule.
 
@@ -89,6 +141,36 @@ def test_delete_rule(client_rule_factory, client_response_factory):
     client.remove_rule(rule_id=rule_id)
 
 
+def test_get_shadowed_rules(client_rule_factory, client_response_factory):
+    """Check request data that client uses to get shadowed rules.
+
+    1. Create a subclass of the abstract client.
+    2. Implement send request so that it checks the request parameters.
+    3. Invoke the get_shadowed_rules method.
+    4. Check the shadowed rules, returned by the method call.
+    """
+    class _Client(AbstractClient):
+        def _send_request(self, url, method="GET", json=None):
+            assert url == "shadowed_rules", "Wrong url"
+            assert method == "GET", "Wrong method"
+            assert json is None, "Data has been specified"
+
+            return [
+                {"rule_id": "second", "shadowing_rule_id": "first"},
+                {"rule_id": "third", "shadowing_rule_id": "first"},
+                ]
+
+    client = _Client(
+        configuration_url="/",
+        rule_factory=client_rule_factory,
+        response_factory=client_response_factory,
+        )
+    shadowed_rules = client.get_shadowed_rules()
+    assert list(shadowed_rules.items()) == [("second", "first"), ("third", "first")], (
+        "Wrong shadowed rules"
+        )
+
+
 def test_set_response(client_rule_factory, client_response_factory, registered_response):
     """Check request data that client uses to set a response.
 
@@ -8,11 +8,12 @@ from looseserver.client.flask import FlaskClient
 
 # pylint: disable=redefined-outer-name
 @pytest.fixture
-def default_factories_application(base_endpoint, configuration_endpoint):
-    """Configured application with default factories."""
+def default_factories_application(base_endpoint, configuration_endpoint, tmpdir):
+    """Configured application with default factories and files in the temporary directory."""
     return configure_application(
         base_endpoint=base_endpoint,
         configuration_endpoint=configuration_endpoint,
+        file_root=str(tmpdir),
         )
 
 
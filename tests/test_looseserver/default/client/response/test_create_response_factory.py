@@ -1,7 +1,13 @@
 """Test cases for creation of the default response factory."""
 
 from looseserver.default.client.rule import create_rule_factory, MethodRule
-from looseserver.default.client.response import create_response_factory, FixedResponse
+from looseserver.default.client.response import (
+    create_response_factory,
+    FixedResponse,
+    FileResponse,
+    StreamResponse,
+    TemplateResponse,
+    )
 from looseserver.client.flask import FlaskClient
 
 
@@ -9,6 +15,7 @@ def test_create_response_factory(
         base_endpoint,
         configuration_endpoint,
         default_factories_application,
+        tmpdir,
     ):
     """Check that default responses are registered in the default response factory.
 
@@ -16,7 +23,13 @@ def test_create_response_factory(
     2. Create default response factory for client.
     3. Create a method rule with the client.
     4. Set a fixed response with the client.
-    4. Check that response is successful.
+    5. Check that response is successful.
+    6. Set a file response with the client.
+    7. Check that response is successful.
+    8. Set a stream response with the client.
+    9. Check that response is successful.
+    10. Set a template response with the client.
+    11. Check that response is successful.
     """
     application_client = default_factories_application.test_client()
 
@@ -35,3 +48,24 @@ def test_create_response_factory(
     assert application_client.get(base_endpoint).status_code == fixed_response.status, (
         "Response was not set"
         )
+
+    body_file = tmpdir.join("body.txt")
+    body_file.write_binary(b"body")
+
+    file_response = FileResponse(path=str(body_file), status=201)
+    client.set_response(rule_id=rule.rule_id, response=file_response)
+
+    http_response = application_client.get(base_endpoint, buffered=True)
+    assert http_response.status_code == file_response.status, "Response was not set"
+
+    stream_response = StreamResponse(chunks=[b"body"], status=202)
+    client.set_response(rule_id=rule.rule_id, response=stream_response)
+
+    http_response = application_client.get(base_endpoint)
+    assert http_response.status_code == stream_response.status, "Response was not set"
+
+    template_response = TemplateResponse(template="{path[0]}", status=203)
+    client.set_response(rule_id=rule.rule_id, response=template_response)
+
+    http_response = application_client.get(base_endpoint)
+    assert http_response.status_code == template_response.status, "Response was not set"
@@ -0,0 +1,67 @@
+"""Test cases for FileResponse."""
+
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+from looseserver.default.client.response import FileResponse
+
+
+def test_response_representation():
+    """Check the representation of the file response.
+
+    1. Create a file response.
+    2. Check result of the repr function.
+    """
+    response = FileResponse(path="/srv/body.json")
+    assert repr(response) == "FileResponse(path='/srv/body.json')", "Wrong representation"
+
+
+def test_default_parameters():
+    """Check the default values of the response.
+
+    1. Create a file response without specifying its type, status and headers.
+    2. Check response type.
+    3. Check status.
+    4. Check headers.
+    """
+    response = FileResponse(path="/srv/body.json")
+    assert response.response_type == ResponseType.FILE.name, "Wrong response type"
+    assert response.status == 200, "Wrong status"
+    assert response.headers == {}, "Wrong headers"
+
+
+def test_file_body(
+        base_endpoint,
+        default_factories_application,
+        client_response_factory,
+        configured_flask_client,
+        existing_get_rule,
+        tmpdir,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that response body can be read from a file on the server.
+
+    1. Prepare a file response in the response factory.
+    2. Set a file response for an existing rule.
+    3. Check the set response.
+    4. Check the body of the response.
+    """
+    preparator = ResponseFactoryPreparator(client_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse)
+
+    body_file = tmpdir.join("body.txt")
+    body_file.write_binary(b"body")
+
+    file_response = FileResponse(path=str(body_file), status=201)
+    response = configured_flask_client.set_response(
+        rule_id=existing_get_rule.rule_id,
+        response=file_response,
+        )
+    assert response.path == file_response.path, "Wrong path"
+    assert response.status == file_response.status, "Wrong status"
+
+    http_response = default_factories_application.test_client().get(
+        base_endpoint,
+        buffered=True,
+        )
+    assert http_response.status_code == 201, "Wrong status code"
+    assert http_response.data == b"body", "Wrong body"
@@ -1,5 +1,7 @@
 """Test cases for FixedResponse."""
 
+import gzip
+
 import pytest
 
 from looseserver.default.common.constants import ResponseType
@@ -47,6 +49,7 @@ def test_default_parameters():
     assert response.status == 200, "Wrong status"
     assert response.headers == {}, "Wrong headers"
     assert response.body == "", "Wrong body"
+    assert not response.compress, "Compression is enabled"
 
 
 @pytest.mark.parametrize(argnames="status", argvalues=[200, 400], ids=["Success", "Failure"])
@@ -173,3 +176,33 @@ def test_bytes_body(
 
     http_response = default_factories_application.test_client().get(base_endpoint)
     assert http_response.data.decode(encoding) == unicode_body, "Wrong body"
+
+
+def test_compressed_body(
+        base_endpoint,
+        default_factories_application,
+        client_response_factory,
+        configured_flask_client,
+        existing_get_rule,
+    ):
+    """Check that compression can be enabled for the response.
+
+    1. Prepare a fixed response in the response factory.
+    2. Set a fixed response with enabled compression for an existing rule.
+    3. Make a request, that accepts gzip encoding.
+    4. Check the body of the response.
+    """
+    preparator = ResponseFactoryPreparator(client_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    body = b"body" * 100
+
+    fixed_response = FixedResponse(body=body, compress=True)
+    configured_flask_client.set_response(rule_id=existing_get_rule.rule_id, response=fixed_response)
+
+    http_response = default_factories_application.test_client().get(
+        base_endpoint,
+        headers={"Accept-Encoding": "gzip"},
+        )
+    assert http_response.headers["Content-Encoding"] == "gzip", "Body is not compressed"
+    assert gzip.decompress(http_response.data) == body, "Wrong body"
@@ -0,0 +1,84 @@
+"""Test cases for StreamResponse."""
+
+import pytest
+
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+from looseserver.default.client.response import StreamResponse
+
+
+def test_response_representation():
+    """Check the representation of the stream response.
+
+    1. Create a stream response.
+    2. Check result of the repr function.
+    """
+    response = StreamResponse(chunks=[])
+    assert repr(response) == "StreamResponse()", "Wrong representation"
+
+
+def test_default_parameters():
+    """Check the default values of the response.
+
+    1. Create a stream response with a pattern without specifying other parameters.
+    2. Check response type.
+    3. Check status.
+    4. Check headers.
+    5. Check chunks.
+    6. Check chunk size.
+    7. Check total size.
+    """
+    response = StreamResponse(pattern=b"pattern")
+    assert response.response_type == ResponseType.STREAM.name, "Wrong response type"
+    assert response.status == 200, "Wrong status"
+    assert response.headers == {}, "Wrong headers"
+    assert response.chunks is None, "Wrong chunks"
+    assert response.chunk_size == 64 * 1024, "Wrong chunk size"
+    assert response.total_size == 0, "Wrong total size"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters",
+    argvalues=[{}, {"chunks": [], "pattern": b"pattern"}],
+    ids=["No body", "Both bodies"],
+    )
+def test_wrong_body(parameters):
+    """Check that exactly one of chunks and pattern must be specified.
+
+    1. Try to create a stream response with wrong body parameters.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        StreamResponse(**parameters)
+
+
+def test_stream_body(
+        base_endpoint,
+        default_factories_application,
+        client_response_factory,
+        configured_flask_client,
+        existing_get_rule,
+    ):
+    """Check that response body can be streamed by the server.
+
+    1. Prepare a stream response in the response factory.
+    2. Set a stream response for an existing rule.
+    3. Check the set response.
+    4. Check the body of the response.
+    """
+    preparator = ResponseFactoryPreparator(client_response_factory)
+    preparator.prepare_stream_response(stream_response_class=StreamResponse)
+
+    stream_response = StreamResponse(pattern=b"ab", chunk_size=3, total_size=7, status=201)
+    response = configured_flask_client.set_response(
+        rule_id=existing_get_rule.rule_id,
+        response=stream_response,
+        )
+    assert response.pattern == stream_response.pattern, "Wrong pattern"
+    assert response.chunk_size == stream_response.chunk_size, "Wrong chunk size"
+    assert response.total_size == stream_response.total_size, "Wrong total size"
+    assert response.status == stream_response.status, "Wrong status"
+
+    http_response = default_factories_application.test_client().get(base_endpoint)
+    assert http_response.status_code == 201, "Wrong status code"
+    assert http_response.data == b"abababa", "Wrong body"
@@ -0,0 +1,63 @@
+"""Test cases for TemplateResponse."""
+
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+from looseserver.default.client.response import TemplateResponse
+
+
+def test_response_representation():
+    """Check the representation of the template response.
+
+    1. Create a template response.
+    2. Check result of the repr function.
+    """
+    response = TemplateResponse(template="")
+    assert repr(response) == "TemplateResponse()", "Wrong representation"
+
+
+def test_default_parameters():
+    """Check the default values of the response.
+
+    1. Create a template response without specifying its type, status and headers.
+    2. Check response type.
+    3. Check status.
+    4. Check headers.
+    """
+    response = TemplateResponse(template="")
+    assert response.response_type == ResponseType.TEMPLATE.name, "Wrong response type"
+    assert response.status == 200, "Wrong status"
+    assert response.headers == {}, "Wrong headers"
+
+
+def test_template_body(
+        base_endpoint,
+        default_factories_application,
+        client_response_factory,
+        configured_flask_client,
+        existing_get_rule,
+    ):
+    """Check that response body is rendered from the template on the server.
+
+    1. Prepare a template response in the response factory.
+    2. Set a template response for an existing rule.
+    3. Check the set response.
+    4. Make a request to a path after the base endpoint.
+    5. Check the body of the response.
+    """
+    preparator = ResponseFactoryPreparator(client_response_factory)
+    preparator.prepare_template_response(template_response_class=TemplateResponse)
+
+    template_response = TemplateResponse(template="{path[1]}: {query[name]}", status=201)
+    response = configured_flask_client.set_response(
+        rule_id=existing_get_rule.rule_id,
+        response=template_response,
+        )
+    assert response.template == template_response.template, "Wrong template"
+    assert response.status == template_response.status, "Wrong status"
+
+    http_response = default_factories_application.test_client().get(
+        base_endpoint + "users/42",
+        query_string="name=value",
+        )
+    assert http_response.status_code == 201, "Wrong status code"
+    assert http_response.data == b"42: value", "Wrong body"
@@ -0,0 +1,55 @@
+"""Test cases for BodyDigestRule."""
+
+import hashlib
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.client.rule import BodyDigestRule
+
+
+def test_default_rule_type():
+    """Check the default rule type of the body digest rule.
+
+    1. Create a body digest rule without specifying its type.
+    2. Check the rule type.
+    """
+    rule = BodyDigestRule(digest="0" * 64)
+    assert rule.rule_type == RuleType.BODY_DIGEST.name, "Wrong rule type"
+
+
+def test_digest_of_body():
+    """Check that digest is computed from the body.
+
+    1. Create body digest rules from bytes and from a string.
+    2. Check the digests.
+    """
+    expected_digest = hashlib.sha256(b"body").hexdigest()
+    assert BodyDigestRule(body=b"body").digest == expected_digest, "Wrong digest"
+    assert BodyDigestRule(body="body").digest == expected_digest, "Wrong digest"
+
+
+def test_rule_representation():
+    """Check the representation of the body digest rule.
+
+    1. Create a body digest rule.
+    2. Check result of the repr function.
+    """
+    rule = BodyDigestRule(digest="0" * 64)
+    assert repr(rule) == "BodyDigestRule(digest='{0}')".format("0" * 64), "Wrong representation"
+
+
+def test_creation(client_rule_factory, configured_flask_client):
+    """Check that BodyDigestRule can be created.
+
+    1. Prepare body digest rule in the rule factory of the flask client.
+    2. Create a body digest rule with the client.
+    3. Check the created rule.
+    """
+    preparator = RuleFactoryPreparator(client_rule_factory)
+    preparator.prepare_body_digest_rule(body_digest_rule_class=BodyDigestRule)
+
+    rule_spec = BodyDigestRule(body=b"body")
+    rule = configured_flask_client.create_rule(rule=rule_spec)
+
+    assert rule.rule_id is not None, "Rule was not created"
+    assert rule.digest == rule_spec.digest, "Wrong digest"
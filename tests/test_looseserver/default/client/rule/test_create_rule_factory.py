@@ -1,7 +1,19 @@
 """Test cases for creation of the default rule factory."""
 
 from looseserver.client.flask import FlaskClient
-from looseserver.default.client.rule import create_rule_factory, PathRule, MethodRule, CompositeRule
+from looseserver.default.client.rule import (
+    create_rule_factory,
+    PathRule,
+    PathPrefixRule,
+    PathRegexRule,
+    MethodRule,
+    HostRule,
+    HeaderRule,
+    QueryRule,
+    JsonBodyRule,
+    BodyDigestRule,
+    CompositeRule,
+    )
 
 
 def test_create_rule_factory(
@@ -9,11 +21,13 @@ def test_create_rule_factory(
         client_response_factory,
         default_factories_application,
     ):
+    # pylint: disable=too-many-locals
     """Check that default rules are registered in the default rule factory.
 
     1. Configure application with default rule factory.
     2. Create default rule factory for client.
-    3. Create a path, method and composite rules with the client.
+    3. Create a path, path prefix, path regex, method, host, header, query, JSON body,
+       body digest and composite rules with the client.
     4. Check that responses are successful.
     """
     rule_factory = create_rule_factory()
@@ -29,10 +43,38 @@ def test_create_rule_factory(
     path_rule = client.create_rule(rule=path_rule_spec)
     assert path_rule.rule_id is not None, "Rule was not created"
 
+    prefix_rule_spec = PathPrefixRule(prefix="prefix/")
+    prefix_rule = client.create_rule(rule=prefix_rule_spec)
+    assert prefix_rule.rule_id is not None, "Rule was not created"
+
+    regex_rule_spec = PathRegexRule(pattern="regex/.*")
+    regex_rule = client.create_rule(rule=regex_rule_spec)
+    assert regex_rule.rule_id is not None, "Rule was not created"
+
     method_rule_spec = MethodRule(method="DELETE")
     method_rule = client.create_rule(rule=method_rule_spec)
     assert method_rule.rule_id is not None, "Rule was not created"
 
+    host_rule_spec = HostRule(host="example.com")
+    host_rule = client.create_rule(rule=host_rule_spec)
+    assert host_rule.rule_id is not None, "Rule was not created"
+
+    header_rule_spec = HeaderRule(name="X-Tenant", value="tenant")
+    header_rule = client.create_rule(rule=header_rule_spec)
+    assert header_rule.rule_id is not None, "Rule was not created"
+
+    query_rule_spec = QueryRule(name="key", value="value")
+    query_rule = client.create_rule(rule=query_rule_spec)
+    assert query_rule.rule_id is not None, "Rule was not created"
+
+    json_rule_spec = JsonBodyRule(value={"op": "charge"})
+    json_rule = client.create_rule(rule=json_rule_spec)
+    assert json_rule.rule_id is not None, "Rule was not created"
+
+    digest_rule_spec = BodyDigestRule(body=b"body")
+    digest_rule = client.create_rule(rule=digest_rule_spec)
+    assert digest_rule.rule_id is not None, "Rule was not created"
+
     composite_rule_spec = CompositeRule(children=[path_rule_spec, method_rule_spec])
     composite_rule = client.create_rule(rule=composite_rule_spec)
     assert composite_rule.rule_id is not None, "Rule was not created"
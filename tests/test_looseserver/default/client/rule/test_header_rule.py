@@ -0,0 +1,47 @@
+"""Test cases for HeaderRule."""
+
+from looseserver.default.common.constants import RuleType, HeaderMatchMode
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.client.rule import HeaderRule
+
+
+def test_default_rule_type():
+    """Check the default rule type and mode of the header rule.
+
+    1. Create a header rule without specifying its type and mode.
+    2. Check the rule type and the mode.
+    """
+    rule = HeaderRule(name="X-Tenant", value="tenant")
+    assert rule.rule_type == RuleType.HEADER.name, "Wrong rule type"
+    assert rule.mode == HeaderMatchMode.EXACT.name, "Wrong mode"
+
+
+def test_rule_representation():
+    """Check the representation of the header rule.
+
+    1. Create a header rule.
+    2. Check result of the repr function.
+    """
+    rule = HeaderRule(name="X-Tenant", mode=HeaderMatchMode.PRESENT.name)
+    assert repr(rule) == "HeaderRule(name='X-Tenant', value=None, mode='PRESENT')", (
+        "Wrong representation"
+        )
+
+
+def test_creation(client_rule_factory, configured_flask_client):
+    """Check that HeaderRule can be created.
+
+    1. Prepare header rule in the rule factory of the flask client.
+    2. Create a header rule with the client.
+    3. Check the created rule.
+    """
+    preparator = RuleFactoryPreparator(client_rule_factory)
+    preparator.prepare_header_rule(header_rule_class=HeaderRule)
+
+    rule_spec = HeaderRule(name="X-Tenant", value="tenant", mode=HeaderMatchMode.PREFIX.name)
+    rule = configured_flask_client.create_rule(rule=rule_spec)
+
+    assert rule.rule_id is not None, "Rule was not created"
+    assert rule.name == "x-tenant", "Wrong name"
+    assert rule.value == rule_spec.value, "Wrong value"
+    assert rule.mode == rule_spec.mode, "Wrong mode"
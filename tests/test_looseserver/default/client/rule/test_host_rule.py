@@ -0,0 +1,42 @@
+"""Test cases for HostRule."""
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.client.rule import HostRule
+
+
+def test_default_rule_type():
+    """Check the default rule type of the host rule.
+
+    1. Create a host rule without specifying its type.
+    2. Check the rule type.
+    """
+    rule = HostRule(host="api.example.com")
+    assert rule.rule_type == RuleType.HOST.name, "Wrong rule type"
+
+
+def test_rule_representation():
+    """Check the representation of the host rule.
+
+    1. Create a host rule.
+    2. Check result of the repr function.
+    """
+    rule = HostRule(host="API.example.com")
+    assert repr(rule) == "HostRule(host='api.example.com')", "Wrong representation"
+
+
+def test_creation(client_rule_factory, configured_flask_client):
+    """Check that HostRule can be created.
+
+    1. Prepare host rule in the rule factory of the flask client.
+    2. Create a host rule with the client.
+    3. Check the created rule.
+    """
+    preparator = RuleFactoryPreparator(client_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=HostRule)
+
+    rule_spec = HostRule(host="api.example.com")
+    rule = configured_flask_client.create_rule(rule=rule_spec)
+
+    assert rule.rule_id is not None, "Rule was not created"
+    assert rule.host == rule_spec.host, "Wrong host"
@@ -0,0 +1,44 @@
+"""Test cases for JsonBodyRule."""
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.client.rule import JsonBodyRule
+
+
+def test_default_rule_type():
+    """Check the default rule type and path of the JSON body rule.
+
+    1. Create a JSON body rule without specifying its type and path.
+    2. Check the rule type and the path.
+    """
+    rule = JsonBodyRule(value={"op": "charge"})
+    assert rule.rule_type == RuleType.JSON_BODY.name, "Wrong rule type"
+    assert rule.path == "$", "Wrong path"
+
+
+def test_rule_representation():
+    """Check the representation of the JSON body rule.
+
+    1. Create a JSON body rule.
+    2. Check result of the repr function.
+    """
+    rule = JsonBodyRule(value=[1], path="$.items")
+    assert repr(rule) == "JsonBodyRule(value=[1], path='$.items')", "Wrong representation"
+
+
+def test_creation(client_rule_factory, configured_flask_client):
+    """Check that JsonBodyRule can be created.
+
+    1. Prepare JSON body rule in the rule factory of the flask client.
+    2. Create a JSON body rule with the client.
+    3. Check the created rule.
+    """
+    preparator = RuleFactoryPreparator(client_rule_factory)
+    preparator.prepare_json_body_rule(json_body_rule_class=JsonBodyRule)
+
+    rule_spec = JsonBodyRule(value={"op": "charge"}, path="$.request")
+    rule = configured_flask_client.create_rule(rule=rule_spec)
+
+    assert rule.rule_id is not None, "Rule was not created"
+    assert rule.value == rule_spec.value, "Wrong value"
+    assert rule.path == rule_spec.path, "Wrong path"
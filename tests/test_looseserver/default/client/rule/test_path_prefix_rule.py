@@ -0,0 +1,47 @@
+"""Test cases for PathPrefixRule."""
+
+from urllib.parse import urljoin
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.client.rule import PathPrefixRule
+
+
+def test_default_rule_type():
+    """Check the default rule type of the path prefix rule.
+
+    1. Create a path prefix rule without specifying its type.
+    2. Check the rule type.
+    """
+    rule = PathPrefixRule(prefix="prefix/")
+    assert rule.rule_type == RuleType.PATH_PREFIX.name, "Wrong rule type"
+
+
+def test_rule_representation():
+    """Check the representation of the path prefix rule.
+
+    1. Create a path prefix rule.
+    2. Check result of the repr function.
+    """
+    rule = PathPrefixRule(prefix="test/")
+    assert repr(rule) == "PathPrefixRule(prefix='test/')", "Wrong representation"
+
+
+def test_creation(base_endpoint, client_rule_factory, configured_flask_client):
+    """Check that PathPrefixRule can be created.
+
+    1. Prepare path prefix rule in the rule factory of the flask client.
+    2. Create a path prefix rule with the client.
+    3. Check the created rule.
+    """
+    preparator = RuleFactoryPreparator(client_rule_factory)
+    preparator.prepare_path_prefix_rule(
+        path_prefix_rule_class=PathPrefixRule,
+        base_url=base_endpoint,
+        )
+
+    rule_spec = PathPrefixRule(prefix="prefix/")
+    rule = configured_flask_client.create_rule(rule=rule_spec)
+
+    assert rule.rule_id is not None, "Rule was not created"
+    assert rule.prefix == urljoin(base_endpoint, rule_spec.prefix), "Wrong prefix"
@@ -0,0 +1,45 @@
+"""Test cases for PathRegexRule."""
+
+import re
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.client.rule import PathRegexRule
+
+
+def test_default_rule_type():
+    """Check the default rule type of the path regex rule.
+
+    1. Create a path regex rule without specifying its type.
+    2. Check the rule type.
+    """
+    rule = PathRegexRule(pattern="/.*")
+    assert rule.rule_type == RuleType.PATH_REGEX.name, "Wrong rule type"
+
+
+def test_rule_representation():
+    """Check the representation of the path regex rule.
+
+    1. Create a path regex rule.
+    2. Check result of the repr function.
+    """
+    rule = PathRegexRule(pattern="test/.*")
+    assert repr(rule) == "PathRegexRule(pattern='test/.*')", "Wrong representation"
+
+
+def test_creation(base_endpoint, client_rule_factory, configured_flask_client):
+    """Check that PathRegexRule can be created.
+
+    1. Prepare path regex rule in the rule factory of the flask client.
+    2. Create a path regex rule with the client.
+    3. Check the created rule.
+    """
+    preparator = RuleFactoryPreparator(client_rule_factory)
+    preparator.prepare_path_regex_rule(path_regex_rule_class=PathRegexRule)
+
+    rule_spec = PathRegexRule(pattern=r"users/\d+")
+    rule = configured_flask_client.create_rule(rule=rule_spec)
+
+    assert rule.rule_id is not None, "Rule was not created"
+    expected_pattern = re.escape(base_endpoint) + "(?:" + rule_spec.pattern + ")"
+    assert rule.pattern == expected_pattern, "Wrong pattern"
@@ -0,0 +1,43 @@
+"""Test cases for QueryRule."""
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.client.rule import QueryRule
+
+
+def test_default_rule_type():
+    """Check the default rule type of the query rule.
+
+    1. Create a query rule without specifying its type.
+    2. Check the rule type.
+    """
+    rule = QueryRule(name="key", value="value")
+    assert rule.rule_type == RuleType.QUERY.name, "Wrong rule type"
+
+
+def test_rule_representation():
+    """Check the representation of the query rule.
+
+    1. Create a query rule.
+    2. Check result of the repr function.
+    """
+    rule = QueryRule(name="key")
+    assert repr(rule) == "QueryRule(name='key', value=None)", "Wrong representation"
+
+
+def test_creation(client_rule_factory, configured_flask_client):
+    """Check that QueryRule can be created.
+
+    1. Prepare query rule in the rule factory of the flask client.
+    2. Create a query rule with the client.
+    3. Check the created rule.
+    """
+    preparator = RuleFactoryPreparator(client_rule_factory)
+    preparator.prepare_query_rule(query_rule_class=QueryRule)
+
+    rule_spec = QueryRule(name="key", value="value")
+    rule = configured_flask_client.create_rule(rule=rule_spec)
+
+    assert rule.rule_id is not None, "Rule was not created"
+    assert rule.name == rule_spec.name, "Wrong name"
+    assert rule.value == rule_spec.value, "Wrong value"
@@ -0,0 +1,130 @@
+"""Test cases to check the configuration for body digest rules."""
+
+import base64
+import hashlib
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.rule import RuleParseError, RuleSerializeError
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+
+
+_BodyDigestRule = namedtuple("_BodyDigestRule", "digest rule_type")
+
+
+def test_prepare_body_digest_rule(server_rule_factory):
+    """Check that body digest rule can be serialized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare body digest rule.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_body_digest_rule(body_digest_rule_class=_BodyDigestRule)
+
+    digest = hashlib.sha256(b"body").hexdigest()
+    rule = _BodyDigestRule(digest=digest, rule_type=RuleType.BODY_DIGEST.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+
+    assert serialized_rule["parameters"] == {"digest": digest}, "Incorrect serialization"
+
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    assert isinstance(parsed_rule, _BodyDigestRule), "Wrong type of the rule"
+    assert parsed_rule == rule, "Wrong rule"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters",
+    argvalues=[
+        {"body": base64.b64encode(b"body").decode("utf8")},
+        {"digest": hashlib.sha256(b"body").hexdigest().upper()},
+        ],
+    ids=["Body", "Uppercase digest"],
+    )
+def test_parse_digest(server_rule_factory, parameters):
+    """Check that digest is computed from the body and normalized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare body digest rule.
+    3. Parse data with the body or the digest.
+    4. Check the digest of the parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_body_digest_rule(body_digest_rule_class=_BodyDigestRule)
+
+    parsed_rule = server_rule_factory.parse_rule(data={
+        "rule_type": RuleType.BODY_DIGEST.name,
+        "parameters": parameters,
+        })
+    assert parsed_rule.digest == hashlib.sha256(b"body").hexdigest(), "Wrong digest"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters,expected_message",
+    argvalues=[
+        ({}, "Rule parameters must be a dictionary with 'digest' or 'body' key"),
+        ("", "Rule parameters must be a dictionary with 'digest' or 'body' key"),
+        ({"body": 1}, "Body can't be decoded with base64 encoding"),
+        ({"body": "a"}, "Body can't be decoded with base64 encoding"),
+        ({"digest": 1}, "Digest must be a hexadecimal SHA-256 digest"),
+        ({"digest": "abc"}, "Digest must be a hexadecimal SHA-256 digest"),
+        ],
+    ids=[
+        "Missing digest",
+        "Wrong parameters type",
+        "Wrong body type",
+        "Invalid body",
+        "Wrong digest type",
+        "Invalid digest",
+        ],
+    )
+def test_parse_wrong_parameters(server_rule_factory, parameters, expected_message):
+    """Check that RuleParseError is raised if parameters are wrong.
+
+    1. Create preparator for a rule factory.
+    2. Prepare body digest rule.
+    3. Try to parse data with wrong parameters.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_body_digest_rule(body_digest_rule_class=_BodyDigestRule)
+
+    serialized_rule = {"rule_type": RuleType.BODY_DIGEST.name, "parameters": parameters}
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_missing_digest(server_rule_factory):
+    """Check that RuleSerializeError is raised if rule class does not have digest attribute.
+
+    1. Create preparator for a rule factory.
+    2. Prepare body digest rule.
+    3. Try to serialize rule without digest attribute.
+    4. Check that RuleSerializeError is raised.
+    5. Check the error.
+    """
+    class _WrongRule:
+        # pylint: disable=too-few-public-methods
+        def __init__(self, rule_type):
+            self.rule_type = rule_type
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_body_digest_rule(body_digest_rule_class=_WrongRule)
+
+    rule = _WrongRule(rule_type=RuleType.BODY_DIGEST.name)
+
+    with pytest.raises(RuleSerializeError) as exception_info:
+        server_rule_factory.serialize_rule(rule=rule)
+
+    assert exception_info.value.args[0] == "Body digest rule must have digest attribute", (
+        "Wrong error message"
+        )
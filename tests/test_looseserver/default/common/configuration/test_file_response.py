@@ -0,0 +1,243 @@
+"""Test cases to check the configuration for file responses."""
+
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.response import ResponseParseError, ResponseSerializeError
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+
+
+_RESPONSE_FIELDS = ("path", "status", "headers")
+_FileResponse = namedtuple("FileResponse", ["response_type"] + list(_RESPONSE_FIELDS))
+
+
+def test_prepare_file_response(server_response_factory):
+    """Check that file response can be serialized.
+
+    1. Create preparator for a response factory.
+    2. Prepare file response.
+    3. Serialize new response.
+    4. Parse serialized data.
+    5. Check parsed response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=_FileResponse)
+
+    response = _FileResponse(
+        path="/srv/fixtures/body.json",
+        status=200,
+        headers={"key": "value"},
+        response_type=ResponseType.FILE.name,
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    expected_data = {
+        "path": "/srv/fixtures/body.json",
+        "status": 200,
+        "headers": {"key": "value"},
+        }
+    assert serialized_response["parameters"] == expected_data, "Incorrect serialization"
+
+    parsed_response = server_response_factory.parse_response(data=serialized_response)
+
+    assert isinstance(parsed_response, _FileResponse), "Wrong type of the response"
+    assert parsed_response.response_type == ResponseType.FILE.name, "Wrong response type"
+    assert parsed_response.path == response.path, "Wrong path"
+    assert parsed_response.status == response.status, "Wrong status"
+    assert parsed_response.headers == response.headers, "Wrong headers"
+
+
+@pytest.mark.parametrize(
+    argnames="attribute",
+    argvalues=_RESPONSE_FIELDS,
+    )
+def test_parse_missing_attribute(server_response_factory, attribute):
+    """Check that ResponseParseError is raised if one of the attributes is missing.
+
+    1. Create preparator for a response factory.
+    2. Prepare file response.
+    3. Try to parse data without one of the attributes.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=_FileResponse)
+
+    response = _FileResponse(
+        response_type=ResponseType.FILE.name,
+        path="body.json",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    serialized_response["parameters"].pop(attribute)
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    expected_message = (
+        "Response parameters must be a dictionary with keys 'path', 'status', 'headers'"
+        )
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_parse_wrong_path(server_response_factory):
+    """Check that ResponseParseError is raised if path is not a string.
+
+    1. Create preparator for a response factory.
+    2. Prepare file response.
+    3. Try to parse data with a number as the path.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=_FileResponse)
+
+    response = _FileResponse(
+        response_type=ResponseType.FILE.name,
+        path="body.json",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    serialized_response["parameters"]["path"] = 1
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    assert exception_info.value.args[0] == "Path must be a string", "Wrong error message"
+
+
+def test_parse_inaccessible_file(server_response_factory):
+    """Check that ResponseParseError is raised if the file can't be accessed.
+
+    1. Create preparator for a response factory.
+    2. Prepare file response with a class, that raises OSError.
+    3. Try to parse data of the response.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    def _create_response(**kwargs):
+        raise FileNotFoundError(kwargs["path"])
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=_create_response)
+
+    response = _FileResponse(
+        response_type=ResponseType.FILE.name,
+        path="missing.json",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    assert exception_info.value.args[0] == "File can't be accessed", "Wrong error message"
+
+
+@pytest.mark.parametrize(
+    argnames="attribute",
+    argvalues=_RESPONSE_FIELDS,
+    )
+def test_serialize_missing_attribute(server_response_factory, attribute):
+    """Check that ResponseSerializeError is raised if response class does not have an attribute.
+
+    1. Create preparator for a response factory.
+    2. Prepare file response.
+    3. Try to serialize response without one of the attributes.
+    4. Check that ResponseSerializeError is raised.
+    5. Check the error.
+    """
+    fields = list(_RESPONSE_FIELDS)
+    fields.remove(attribute)
+
+    _WrongResponse = namedtuple("_WrongResponse", ["response_type"] + list(fields))
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=_WrongResponse)
+
+    field_values = {field: "" for field in fields}
+    response = _WrongResponse(response_type=ResponseType.FILE.name, **field_values)
+
+    with pytest.raises(ResponseSerializeError) as exception_info:
+        server_response_factory.serialize_response(response=response)
+
+    expected_message = "Response must have attributes 'path', 'status' and 'headers'"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_parse_with_root(server_response_factory):
+    """Check that root directory and unchanged path are passed to the file response class.
+
+    1. Create preparator for a response factory.
+    2. Prepare file response with a root directory.
+    3. Parse data with a relative path.
+    4. Check that the response class gets the root directory and the path.
+    5. Check that the response is serialized with the same path.
+    """
+    created_responses = []
+
+    def _create_response(root, **kwargs):
+        created_responses.append((root, _FileResponse(**kwargs)))
+        return created_responses[-1][1]
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=_create_response, root="/srv/files")
+
+    response = _FileResponse(
+        response_type=ResponseType.FILE.name,
+        path="fixtures/body.json",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    parsed_response = server_response_factory.parse_response(serialized_response)
+
+    assert created_responses == [("/srv/files", response)], "Wrong parameters of the response"
+    assert server_response_factory.serialize_response(response=parsed_response) == (
+        serialized_response
+        ), "Wrong serialization"
+
+
+@pytest.mark.parametrize(
+    argnames="root,expected_message",
+    argvalues=[
+        ("/srv/files", "File must be inside the root directory"),
+        (None, "File can't be accessed"),
+        ],
+    ids=[
+        "With root",
+        "Without root",
+        ],
+    )
+def test_parse_rejected_path(server_response_factory, root, expected_message):
+    """Check that ResponseParseError is raised if the file response class rejects the path.
+
+    1. Create preparator for a response factory.
+    2. Prepare file response with a class, that raises ValueError.
+    3. Try to parse data of the response.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    def _create_response(**kwargs):
+        raise ValueError(kwargs["path"])
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=_create_response, root=root)
+
+    response = _FileResponse(
+        response_type=ResponseType.FILE.name,
+        path="../body.json",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
@@ -50,6 +50,65 @@ def test_prepare_fixed_response(server_response_factory):
     assert parsed_response.body == response.body.encode("utf8"), "Wrong body"
 
 
+def test_prepare_compressed_response(server_response_factory):
+    """Check that compression flag is serialized and parsed.
+
+    1. Create preparator for a response factory.
+    2. Prepare fixed response with a class, that supports compression.
+    3. Serialize a response with enabled compression.
+    4. Parse serialized data.
+    5. Check that compression is enabled for the parsed response.
+    """
+    _CompressedResponse = namedtuple(
+        "_CompressedResponse",
+        ["response_type", "compress"] + list(_RESPONSE_FIELDS),
+        )
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=_CompressedResponse)
+
+    response = _CompressedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={},
+        body="body",
+        compress=True,
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    assert serialized_response["parameters"]["compress"] is True, "Incorrect serialization"
+
+    parsed_response = server_response_factory.parse_response(data=serialized_response)
+    assert parsed_response.compress is True, "Compression is not enabled"
+
+
+def test_parse_wrong_compress(server_response_factory):
+    """Check that ResponseParseError is raised if compression flag is not a boolean.
+
+    1. Create preparator for a response factory.
+    2. Prepare fixed response.
+    3. Try to parse data with a string compression flag.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=_FixedResponse)
+
+    response = _FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={},
+        body="body",
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    serialized_response["parameters"]["compress"] = "yes"
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    expected_message = "Compress flag must be a boolean"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
 @pytest.mark.parametrize(
     argnames="attribute",
     argvalues=_RESPONSE_FIELDS,
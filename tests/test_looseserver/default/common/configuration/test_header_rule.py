@@ -0,0 +1,141 @@
+"""Test cases to check the configuration for header rules."""
+
+import re
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.rule import RuleParseError, RuleSerializeError
+from looseserver.default.common.constants import RuleType, HeaderMatchMode
+from looseserver.default.common.configuration import RuleFactoryPreparator
+
+
+_HeaderRule = namedtuple("_HeaderRule", "name value mode rule_type")
+
+
+class _CompiledHeaderRule(_HeaderRule):
+    """Header rule, that compiles its pattern."""
+
+    def __new__(cls, name, value, mode, rule_type):
+        if mode == HeaderMatchMode.REGEX.name:
+            re.compile(value)
+        return super(_CompiledHeaderRule, cls).__new__(cls, name, value, mode, rule_type)
+
+
+@pytest.mark.parametrize(
+    argnames="mode,value",
+    argvalues=[
+        (HeaderMatchMode.EXACT.name, "tenant"),
+        (HeaderMatchMode.PREFIX.name, "ten"),
+        (HeaderMatchMode.REGEX.name, "t.*"),
+        (HeaderMatchMode.PRESENT.name, None),
+        ],
+    ids=["Exact", "Prefix", "Regex", "Present"],
+    )
+def test_prepare_header_rule(server_rule_factory, mode, value):
+    """Check that header rule can be serialized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare header rule.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_header_rule(header_rule_class=_HeaderRule)
+
+    rule = _HeaderRule(name="X-Tenant", value=value, mode=mode, rule_type=RuleType.HEADER.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+
+    assert serialized_rule["parameters"] == {"name": "X-Tenant", "value": value, "mode": mode}, (
+        "Incorrect serialization"
+        )
+
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    assert isinstance(parsed_rule, _HeaderRule), "Wrong type of the rule"
+    assert parsed_rule == rule, "Wrong rule"
+
+
+def test_default_mode(server_rule_factory):
+    """Check that value of the header is matched exactly by default.
+
+    1. Create preparator for a rule factory.
+    2. Prepare header rule.
+    3. Parse data without the mode.
+    4. Check the mode of the parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_header_rule(header_rule_class=_HeaderRule)
+
+    parsed_rule = server_rule_factory.parse_rule(data={
+        "rule_type": RuleType.HEADER.name,
+        "parameters": {"name": "X-Tenant", "value": "tenant"},
+        })
+    assert parsed_rule.mode == HeaderMatchMode.EXACT.name, "Wrong mode"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters,expected_message",
+    argvalues=[
+        ({}, "Rule parameters must be a dictionary with 'name' key"),
+        ("", "Rule parameters must be a dictionary with 'name' key"),
+        ({"name": 1, "value": "tenant"}, "Name must be a string"),
+        ({"name": "X-Tenant", "value": "t", "mode": "UNKNOWN"}, "Unknown match mode 'UNKNOWN'"),
+        ({"name": "X-Tenant"}, "Value must be a string"),
+        ({"name": "X-Tenant", "value": "(", "mode": "REGEX"}, "Pattern can't be compiled"),
+        ],
+    ids=[
+        "Missing name",
+        "Wrong parameters type",
+        "Wrong name type",
+        "Unknown mode",
+        "Missing value",
+        "Invalid pattern",
+        ],
+    )
+def test_parse_wrong_parameters(server_rule_factory, parameters, expected_message):
+    """Check that RuleParseError is raised if parameters are wrong.
+
+    1. Create preparator for a rule factory.
+    2. Prepare header rule.
+    3. Try to parse data with wrong parameters.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_header_rule(header_rule_class=_CompiledHeaderRule)
+
+    serialized_rule = {"rule_type": RuleType.HEADER.name, "parameters": parameters}
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_missing_attributes(server_rule_factory):
+    """Check that RuleSerializeError is raised if rule class does not have required attributes.
+
+    1. Create preparator for a rule factory.
+    2. Prepare header rule.
+    3. Try to serialize rule without the value attribute.
+    4. Check that RuleSerializeError is raised.
+    5. Check the error.
+    """
+    class _WrongRule:
+        # pylint: disable=too-few-public-methods
+        def __init__(self, name, rule_type):
+            self.name = name
+            self.rule_type = rule_type
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_header_rule(header_rule_class=_WrongRule)
+
+    rule = _WrongRule(name="X-Tenant", rule_type=RuleType.HEADER.name)
+
+    with pytest.raises(RuleSerializeError) as exception_info:
+        server_rule_factory.serialize_rule(rule=rule)
+
+    expected_message = "Header rule must have attributes 'name', 'value' and 'mode'"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
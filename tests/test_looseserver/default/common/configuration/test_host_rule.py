@@ -0,0 +1,132 @@
+"""Test cases to check the configuration for host rules."""
+
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.rule import RuleParseError, RuleSerializeError
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+
+
+_HostRule = namedtuple("HostRule", "host rule_type")
+
+
+def test_prepare_host_rule(server_rule_factory):
+    """Check that host rule can be serialized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare host rule.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=_HostRule)
+
+    rule = _HostRule(host="api.example.com", rule_type=RuleType.HOST.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+
+    assert serialized_rule["parameters"] == {"host": rule.host}, "Incorrect serialization"
+
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    assert isinstance(parsed_rule, _HostRule), "Wrong type of the rule"
+    assert parsed_rule.rule_type == RuleType.HOST.name, "Wrong rule type"
+    assert parsed_rule.host == rule.host, "Wrong host"
+
+
+def test_parse_missing_host(server_rule_factory):
+    """Check that RuleParseError is raised if host is missing.
+
+    1. Create preparator for a rule factory.
+    2. Prepare host rule.
+    3. Try to parse data without "host" key.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=_HostRule)
+
+    rule = _HostRule(rule_type=RuleType.HOST.name, host="api.example.com")
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    serialized_rule["parameters"].pop("host")
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    expected_message = "Rule parameters must be a dictionary with 'host' key"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_parse_wrong_parameters_type(server_rule_factory):
+    """Check that RuleParseError is raised if parameters are of a wrong type.
+
+    1. Create preparator for a rule factory.
+    2. Prepare host rule.
+    3. Try to parse data with string parameters.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=_HostRule)
+
+    rule = _HostRule(rule_type=RuleType.HOST.name, host="api.example.com")
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    serialized_rule["parameters"] = ""
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    expected_message = "Rule parameters must be a dictionary with 'host' key"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_parse_non_string_host(server_rule_factory):
+    """Check that RuleParseError is raised if host is not a string.
+
+    1. Create preparator for a rule factory.
+    2. Prepare host rule.
+    3. Try to parse data with a number as the host.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=_HostRule)
+
+    rule = _HostRule(rule_type=RuleType.HOST.name, host="api.example.com")
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    serialized_rule["parameters"]["host"] = 1
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    assert exception_info.value.args[0] == "Host must be a string", "Wrong error message"
+
+
+def test_serialize_missing_host(server_rule_factory):
+    """Check that RuleSerializeError is raised if rule class does not have host attribute.
+
+    1. Create preparator for a rule factory.
+    2. Prepare host rule.
+    3. Try to serialize rule without host attribute.
+    4. Check that RuleSerializeError is raised.
+    5. Check the error.
+    """
+    class _WrongRule:
+        # pylint: disable=too-few-public-hosts
+        def __init__(self, host, rule_type):
+            # pylint: disable=unused-argument
+            self.rule_type = rule_type
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=_WrongRule)
+
+    rule = _WrongRule(host="api.example.com", rule_type=RuleType.HOST.name)
+
+    with pytest.raises(RuleSerializeError) as exception_info:
+        server_rule_factory.serialize_rule(rule=rule)
+
+    assert exception_info.value.args[0] == "Host rule must have host attribute", (
+        "Wrong error message"
+        )
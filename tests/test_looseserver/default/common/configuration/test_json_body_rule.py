@@ -0,0 +1,126 @@
+"""Test cases to check the configuration for JSON body rules."""
+
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.rule import RuleParseError, RuleSerializeError
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+
+
+_JsonBodyRule = namedtuple("_JsonBodyRule", "value path rule_type")
+
+
+class _ValidatedJsonBodyRule(_JsonBodyRule):
+    """JSON body rule, that validates its path."""
+
+    def __new__(cls, value, path, rule_type):
+        if not path.startswith("$"):
+            raise ValueError("Path must start with '$'")
+        return super(_ValidatedJsonBodyRule, cls).__new__(cls, value, path, rule_type)
+
+
+def test_prepare_json_body_rule(server_rule_factory):
+    """Check that JSON body rule can be serialized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare JSON body rule.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_json_body_rule(json_body_rule_class=_JsonBodyRule)
+
+    rule = _JsonBodyRule(value={"op": "charge"}, path="$.order", rule_type=RuleType.JSON_BODY.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+
+    assert serialized_rule["parameters"] == {"value": {"op": "charge"}, "path": "$.order"}, (
+        "Incorrect serialization"
+        )
+
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    assert isinstance(parsed_rule, _JsonBodyRule), "Wrong type of the rule"
+    assert parsed_rule == rule, "Wrong rule"
+
+
+def test_default_path(server_rule_factory):
+    """Check that the whole body is selected by default.
+
+    1. Create preparator for a rule factory.
+    2. Prepare JSON body rule.
+    3. Parse data without the path.
+    4. Check the path of the parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_json_body_rule(json_body_rule_class=_JsonBodyRule)
+
+    parsed_rule = server_rule_factory.parse_rule(data={
+        "rule_type": RuleType.JSON_BODY.name,
+        "parameters": {"value": None},
+        })
+    assert parsed_rule.path == "$", "Wrong path"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters,expected_message",
+    argvalues=[
+        ({}, "Rule parameters must be a dictionary with 'value' key"),
+        ("", "Rule parameters must be a dictionary with 'value' key"),
+        ({"value": 1, "path": 1}, "Path must be a string"),
+        ({"value": 1, "path": "order"}, "Path can't be parsed"),
+        ],
+    ids=[
+        "Missing value",
+        "Wrong parameters type",
+        "Wrong path type",
+        "Invalid path",
+        ],
+    )
+def test_parse_wrong_parameters(server_rule_factory, parameters, expected_message):
+    """Check that RuleParseError is raised if parameters are wrong.
+
+    1. Create preparator for a rule factory.
+    2. Prepare JSON body rule.
+    3. Try to parse data with wrong parameters.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_json_body_rule(json_body_rule_class=_ValidatedJsonBodyRule)
+
+    serialized_rule = {"rule_type": RuleType.JSON_BODY.name, "parameters": parameters}
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_missing_attributes(server_rule_factory):
+    """Check that RuleSerializeError is raised if rule class does not have required attributes.
+
+    1. Create preparator for a rule factory.
+    2. Prepare JSON body rule.
+    3. Try to serialize rule without the path attribute.
+    4. Check that RuleSerializeError is raised.
+    5. Check the error.
+    """
+    class _WrongRule:
+        # pylint: disable=too-few-public-methods
+        def __init__(self, value, rule_type):
+            self.value = value
+            self.rule_type = rule_type
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_json_body_rule(json_body_rule_class=_WrongRule)
+
+    rule = _WrongRule(value=1, rule_type=RuleType.JSON_BODY.name)
+
+    with pytest.raises(RuleSerializeError) as exception_info:
+        server_rule_factory.serialize_rule(rule=rule)
+
+    expected_message = "JSON body rule must have attributes 'value' and 'path'"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
@@ -0,0 +1,113 @@
+"""Test cases to check the configuration for path prefix rules."""
+
+from collections import namedtuple
+from urllib.parse import urljoin
+
+import pytest
+
+from looseserver.common.rule import RuleParseError, RuleSerializeError
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+
+
+_PathPrefixRule = namedtuple("_PathPrefixRule", "prefix rule_type")
+
+
+def test_prepare_path_prefix_rule(server_rule_factory):
+    """Check that path prefix rule can be serialized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path prefix rule.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    base_url = "/base/"
+    preparator.prepare_path_prefix_rule(path_prefix_rule_class=_PathPrefixRule, base_url=base_url)
+
+    prefix = "test-prefix/"
+    rule = _PathPrefixRule(prefix=prefix, rule_type=RuleType.PATH_PREFIX.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+
+    assert serialized_rule["parameters"] == {"prefix": rule.prefix}, "Incorrect serialization"
+
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    assert isinstance(parsed_rule, _PathPrefixRule), "Wrong type of the rule"
+    assert parsed_rule.rule_type == RuleType.PATH_PREFIX.name, "Wrong rule type"
+    assert parsed_rule.prefix == urljoin(base_url, prefix), "Wrong prefix"
+
+
+def test_prefix_without_base_url(server_rule_factory):
+    """Check that parser does not add base url if it was not specified.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path prefix rule without specifying base url.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule prefix.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_prefix_rule(path_prefix_rule_class=_PathPrefixRule)
+
+    rule = _PathPrefixRule(prefix="prefix/", rule_type=RuleType.PATH_PREFIX.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+    assert parsed_rule.prefix == rule.prefix, "Wrong prefix"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters",
+    argvalues=[{}, ""],
+    ids=["Missing prefix", "Wrong type"],
+    )
+def test_parse_wrong_parameters(server_rule_factory, parameters):
+    """Check that RuleParseError is raised if parameters are wrong.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path prefix rule.
+    3. Try to parse data with wrong parameters.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_prefix_rule(path_prefix_rule_class=_PathPrefixRule, base_url="/")
+
+    rule = _PathPrefixRule(rule_type=RuleType.PATH_PREFIX.name, prefix="test")
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    serialized_rule["parameters"] = parameters
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    expected_message = "Rule parameters must be a dictionary with 'prefix' key"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_missing_prefix(server_rule_factory):
+    """Check that RuleSerializeError is raised if rule class does not have prefix attribute.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path prefix rule.
+    3. Try to serialize rule without prefix attribute.
+    4. Check that RuleSerializeError is raised.
+    5. Check the error.
+    """
+    class _WrongRule:
+        # pylint: disable=too-few-public-methods
+        def __init__(self, prefix, rule_type):
+            # pylint: disable=unused-argument
+            self.rule_type = rule_type
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_prefix_rule(path_prefix_rule_class=_WrongRule, base_url="/")
+
+    rule = _WrongRule(prefix="/", rule_type=RuleType.PATH_PREFIX.name)
+
+    with pytest.raises(RuleSerializeError) as exception_info:
+        server_rule_factory.serialize_rule(rule=rule)
+
+    assert exception_info.value.args[0] == "Path prefix rule must have prefix attribute", (
+        "Wrong error message"
+        )
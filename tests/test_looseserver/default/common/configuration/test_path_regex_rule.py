@@ -0,0 +1,183 @@
+"""Test cases to check the configuration for path regex rules."""
+
+import re
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.rule import RuleParseError, RuleSerializeError
+from looseserver.server.pattern import is_combinable
+from looseserver.default.common.constants import RuleType
+import looseserver.default.common.configuration as configuration
+from looseserver.default.common.configuration import RuleFactoryPreparator
+
+
+_PathRegexRule = namedtuple("_PathRegexRule", "pattern rule_type")
+
+
+class _CompiledPathRegexRule(_PathRegexRule):
+    """Path regex rule, that compiles its pattern."""
+
+    def __new__(cls, pattern, rule_type):
+        re.compile(pattern)
+        return super(_CompiledPathRegexRule, cls).__new__(cls, pattern, rule_type)
+
+
+def test_prepare_path_regex_rule(server_rule_factory):
+    """Check that path regex rule can be serialized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path regex rule.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    base_url = "/base.url/"
+    preparator.prepare_path_regex_rule(path_regex_rule_class=_PathRegexRule, base_url=base_url)
+
+    pattern = r"users/\d+"
+    rule = _PathRegexRule(pattern=pattern, rule_type=RuleType.PATH_REGEX.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+
+    assert serialized_rule["parameters"] == {"pattern": rule.pattern}, "Incorrect serialization"
+
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    assert isinstance(parsed_rule, _PathRegexRule), "Wrong type of the rule"
+    assert parsed_rule.rule_type == RuleType.PATH_REGEX.name, "Wrong rule type"
+    assert parsed_rule.pattern == re.escape(base_url) + "(?:" + pattern + ")", "Wrong pattern"
+
+
+def test_pattern_without_base_url(server_rule_factory):
+    """Check that parser does not add base url if it was not specified.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path regex rule without specifying base url.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule pattern.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_regex_rule(path_regex_rule_class=_PathRegexRule)
+
+    rule = _PathRegexRule(pattern="/.*", rule_type=RuleType.PATH_REGEX.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+    assert parsed_rule.pattern == rule.pattern, "Wrong pattern"
+
+
+@pytest.mark.parametrize(
+    argnames="scoped_flags_supported,expected_pattern,combinable",
+    argvalues=[
+        pytest.param(
+            True,
+            r"{base_url}(?ix:users / \d+)",
+            True,
+            marks=pytest.mark.skipif(
+                not configuration._SCOPED_FLAGS_SUPPORTED,   # pylint: disable=protected-access
+                reason="Scoped flags are not supported",
+                ),
+            ),
+        (False, r"(?ix){base_url}(?:users / \d+)", False),
+        ],
+    ids=[
+        "Scoped flags",
+        "Global flags",
+        ],
+    )
+def test_leading_flags(
+        monkeypatch,
+        server_rule_factory,
+        scoped_flags_supported,
+        expected_pattern,
+        combinable,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that leading flags are scoped to the pattern if scoped flags are supported.
+
+    1. Prepare path regex rule with a base url.
+    2. Parse a pattern with leading flags.
+    3. Check the parsed pattern.
+    4. Check if the compiled pattern can be combined with other patterns.
+    """
+    monkeypatch.setattr(configuration, "_SCOPED_FLAGS_SUPPORTED", scoped_flags_supported)
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_regex_rule(
+        path_regex_rule_class=_CompiledPathRegexRule,
+        base_url="/base/",
+        )
+
+    rule = _PathRegexRule(pattern=r"(?i)(?x)users / \d+", rule_type=RuleType.PATH_REGEX.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    expected_pattern = expected_pattern.format(base_url=re.escape("/base/"))
+    assert parsed_rule.pattern == expected_pattern, "Wrong pattern"
+    assert is_combinable(re.compile(parsed_rule.pattern)) == combinable, "Wrong combinability"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters,expected_message",
+    argvalues=[
+        ({}, "Rule parameters must be a dictionary with 'pattern' key"),
+        ("", "Rule parameters must be a dictionary with 'pattern' key"),
+        ({"pattern": 1}, "Pattern must be a string"),
+        ({"pattern": "("}, "Pattern can't be compiled"),
+        ],
+    ids=[
+        "Missing pattern",
+        "Wrong parameters type",
+        "Wrong pattern type",
+        "Invalid pattern",
+        ],
+    )
+def test_parse_wrong_parameters(server_rule_factory, parameters, expected_message):
+    """Check that RuleParseError is raised if parameters are wrong.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path regex rule.
+    3. Try to parse data with wrong parameters.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_regex_rule(path_regex_rule_class=_CompiledPathRegexRule)
+
+    rule = _CompiledPathRegexRule(rule_type=RuleType.PATH_REGEX.name, pattern="test")
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+    serialized_rule["parameters"] = parameters
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_missing_pattern(server_rule_factory):
+    """Check that RuleSerializeError is raised if rule class does not have pattern attribute.
+
+    1. Create preparator for a rule factory.
+    2. Prepare path regex rule.
+    3. Try to serialize rule without pattern attribute.
+    4. Check that RuleSerializeError is raised.
+    5. Check the error.
+    """
+    class _WrongRule:
+        # pylint: disable=too-few-public-methods
+        def __init__(self, pattern, rule_type):
+            # pylint: disable=unused-argument
+            self.rule_type = rule_type
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_regex_rule(path_regex_rule_class=_WrongRule, base_url="/")
+
+    rule = _WrongRule(pattern="/", rule_type=RuleType.PATH_REGEX.name)
+
+    with pytest.raises(RuleSerializeError) as exception_info:
+        server_rule_factory.serialize_rule(rule=rule)
+
+    assert exception_info.value.args[0] == "Path regex rule must have pattern attribute", (
+        "Wrong error message"
+        )
@@ -0,0 +1,104 @@
+"""Test cases to check the configuration for query rules."""
+
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.rule import RuleParseError, RuleSerializeError
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+
+
+_QueryRule = namedtuple("_QueryRule", "name value rule_type")
+
+
+@pytest.mark.parametrize(
+    argnames="value",
+    argvalues=["value", None],
+    ids=["Value", "Presence"],
+    )
+def test_prepare_query_rule(server_rule_factory, value):
+    """Check that query rule can be serialized.
+
+    1. Create preparator for a rule factory.
+    2. Prepare query rule.
+    3. Serialize new rule.
+    4. Parse serialized data.
+    5. Check parsed rule.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_query_rule(query_rule_class=_QueryRule)
+
+    rule = _QueryRule(name="key", value=value, rule_type=RuleType.QUERY.name)
+    serialized_rule = server_rule_factory.serialize_rule(rule=rule)
+
+    assert serialized_rule["parameters"] == {"name": "key", "value": value}, (
+        "Incorrect serialization"
+        )
+
+    parsed_rule = server_rule_factory.parse_rule(data=serialized_rule)
+
+    assert isinstance(parsed_rule, _QueryRule), "Wrong type of the rule"
+    assert parsed_rule == rule, "Wrong rule"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters,expected_message",
+    argvalues=[
+        ({}, "Rule parameters must be a dictionary with 'name' key"),
+        ("", "Rule parameters must be a dictionary with 'name' key"),
+        ({"name": 1}, "Name must be a string"),
+        ({"name": "key", "value": 1}, "Value must be a string"),
+        ],
+    ids=[
+        "Missing name",
+        "Wrong parameters type",
+        "Wrong name type",
+        "Wrong value type",
+        ],
+    )
+def test_parse_wrong_parameters(server_rule_factory, parameters, expected_message):
+    """Check that RuleParseError is raised if parameters are wrong.
+
+    1. Create preparator for a rule factory.
+    2. Prepare query rule.
+    3. Try to parse data with wrong parameters.
+    4. Check that RuleParseError is raised.
+    5. Check the error.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_query_rule(query_rule_class=_QueryRule)
+
+    serialized_rule = {"rule_type": RuleType.QUERY.name, "parameters": parameters}
+
+    with pytest.raises(RuleParseError) as exception_info:
+        server_rule_factory.parse_rule(serialized_rule)
+
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_missing_attributes(server_rule_factory):
+    """Check that RuleSerializeError is raised if rule class does not have required attributes.
+
+    1. Create preparator for a rule factory.
+    2. Prepare query rule.
+    3. Try to serialize rule without the value attribute.
+    4. Check that RuleSerializeError is raised.
+    5. Check the error.
+    """
+    class _WrongRule:
+        # pylint: disable=too-few-public-methods
+        def __init__(self, name, rule_type):
+            self.name = name
+            self.rule_type = rule_type
+
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_query_rule(query_rule_class=_WrongRule)
+
+    rule = _WrongRule(name="key", rule_type=RuleType.QUERY.name)
+
+    with pytest.raises(RuleSerializeError) as exception_info:
+        server_rule_factory.serialize_rule(rule=rule)
+
+    expected_message = "Query rule must have attributes 'name' and 'value'"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
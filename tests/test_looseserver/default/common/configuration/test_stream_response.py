@@ -0,0 +1,260 @@
+"""Test cases to check the configuration for stream responses."""
+
+from collections import namedtuple
+import base64
+
+import pytest
+
+from looseserver.common.response import ResponseParseError, ResponseSerializeError
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator, MAX_CHUNK_SIZE
+
+
+_RESPONSE_FIELDS = ("status", "headers", "chunks", "pattern", "chunk_size", "total_size")
+_StreamResponse = namedtuple("StreamResponse", ["response_type"] + list(_RESPONSE_FIELDS))
+_StreamResponse.__new__.__defaults__ = (None, None, None, None)
+
+
+def test_prepare_chunks_response(server_response_factory):
+    """Check that stream response with chunks can be serialized.
+
+    1. Create preparator for a response factory.
+    2. Prepare stream response.
+    3. Serialize new response with chunks.
+    4. Parse serialized data.
+    5. Check parsed response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=_StreamResponse)
+
+    response = _StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={"key": "value"},
+        chunks=["first", b"second"],
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    expected_data = {
+        "status": 200,
+        "headers": {"key": "value"},
+        "chunks": [
+            base64.b64encode(b"first").decode("utf8"),
+            base64.b64encode(b"second").decode("utf8"),
+            ],
+        }
+    assert serialized_response["parameters"] == expected_data, "Incorrect serialization"
+
+    parsed_response = server_response_factory.parse_response(data=serialized_response)
+
+    assert isinstance(parsed_response, _StreamResponse), "Wrong type of the response"
+    assert parsed_response.response_type == ResponseType.STREAM.name, "Wrong response type"
+    assert parsed_response.status == response.status, "Wrong status"
+    assert parsed_response.headers == response.headers, "Wrong headers"
+    assert parsed_response.chunks == [b"first", b"second"], "Wrong chunks"
+    assert parsed_response.pattern is None, "Wrong pattern"
+
+
+def test_prepare_pattern_response(server_response_factory):
+    """Check that stream response with a pattern can be serialized.
+
+    1. Create preparator for a response factory.
+    2. Prepare stream response.
+    3. Serialize new response with a pattern.
+    4. Parse serialized data.
+    5. Check parsed response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=_StreamResponse)
+
+    response = _StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        pattern=b"pattern",
+        chunk_size=1024,
+        total_size=10 * 1024 ** 3,
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    expected_data = {
+        "status": 200,
+        "headers": {},
+        "pattern": base64.b64encode(b"pattern").decode("utf8"),
+        "chunk_size": 1024,
+        "total_size": 10 * 1024 ** 3,
+        }
+    assert serialized_response["parameters"] == expected_data, "Incorrect serialization"
+
+    parsed_response = server_response_factory.parse_response(data=serialized_response)
+
+    assert parsed_response.chunks is None, "Wrong chunks"
+    assert parsed_response.pattern == response.pattern, "Wrong pattern"
+    assert parsed_response.chunk_size == response.chunk_size, "Wrong chunk size"
+    assert parsed_response.total_size == response.total_size, "Wrong total size"
+
+
+@pytest.mark.parametrize(
+    argnames="parameters",
+    argvalues=[
+        "",
+        {"headers": {}, "chunks": []},
+        {"status": 200, "chunks": []},
+        {"status": 200, "headers": {}},
+        {"status": 200, "headers": {}, "chunks": [], "pattern": ""},
+        ],
+    ids=["Wrong type", "Missing status", "Missing headers", "Missing body", "Both bodies"],
+    )
+def test_parse_wrong_parameters(server_response_factory, parameters):
+    """Check that ResponseParseError is raised if parameters are wrong.
+
+    1. Create preparator for a response factory.
+    2. Prepare stream response.
+    3. Try to parse data with wrong parameters.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=_StreamResponse)
+
+    data = {"response_type": ResponseType.STREAM.name, "parameters": parameters}
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(data)
+
+    expected_message = (
+        "Response parameters must be a dictionary with keys 'status', 'headers' "
+        "and either 'chunks' or 'pattern'"
+        )
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+@pytest.mark.parametrize(
+    argnames="body_parameters,expected_message",
+    argvalues=[
+        (
+            {"chunks": "Y2h1bms="},
+            "Chunks must be a list of strings encoded with base64 encoding",
+            ),
+        (
+            {"chunks": ["Invalid base64"]},
+            "Chunks must be a list of strings encoded with base64 encoding",
+            ),
+        (
+            {"pattern": "Invalid base64", "chunk_size": 1, "total_size": 1},
+            "Pattern can't be decoded with base64 encoding",
+            ),
+        (
+            {"pattern": "", "chunk_size": 1, "total_size": 1},
+            "Pattern must not be empty",
+            ),
+        (
+            {"pattern": "YQ==", "chunk_size": 0, "total_size": 1},
+            "Chunk size must be a positive integer",
+            ),
+        (
+            {"pattern": "YQ==", "total_size": 1},
+            "Chunk size must be a positive integer",
+            ),
+        (
+            {"pattern": "YQ==", "chunk_size": MAX_CHUNK_SIZE + 1, "total_size": 1},
+            "Chunk size must not be greater than {0}".format(MAX_CHUNK_SIZE),
+            ),
+        (
+            {"pattern": "YQ==", "chunk_size": 1, "total_size": -1},
+            "Total size must be a non-negative integer",
+            ),
+        (
+            {"pattern": "YQ==", "chunk_size": 1, "total_size": True},
+            "Total size must be a non-negative integer",
+            ),
+        ],
+    ids=[
+        "Chunks string",
+        "Invalid chunk",
+        "Invalid pattern",
+        "Empty pattern",
+        "Zero chunk size",
+        "Missing chunk size",
+        "Too large chunk size",
+        "Negative total size",
+        "Boolean total size",
+        ],
+    )
+def test_parse_wrong_body(server_response_factory, body_parameters, expected_message):
+    """Check that ResponseParseError is raised if the body is specified incorrectly.
+
+    1. Create preparator for a response factory.
+    2. Prepare stream response.
+    3. Try to parse data with wrong body parameters.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=_StreamResponse)
+
+    parameters = {"status": 200, "headers": {}}
+    parameters.update(body_parameters)
+    data = {"response_type": ResponseType.STREAM.name, "parameters": parameters}
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(data)
+
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_missing_attribute(server_response_factory):
+    """Check that ResponseSerializeError is raised if response class does not have an attribute.
+
+    1. Create preparator for a response factory.
+    2. Prepare stream response.
+    3. Try to serialize response without pattern attribute.
+    4. Check that ResponseSerializeError is raised.
+    5. Check the error.
+    """
+    _WrongResponse = namedtuple("_WrongResponse", "response_type status headers chunks")
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=_WrongResponse)
+
+    response = _WrongResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        chunks=[],
+        )
+
+    with pytest.raises(ResponseSerializeError) as exception_info:
+        server_response_factory.serialize_response(response=response)
+
+    expected_message = (
+        "Response must have attributes 'status', 'headers', 'chunks', 'pattern', "
+        "'chunk_size' and 'total_size'"
+        )
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_serialize_wrong_chunks(server_response_factory):
+    """Check that ResponseSerializeError is raised if chunks can't be encoded with base64.
+
+    1. Create preparator for a response factory.
+    2. Prepare stream response.
+    3. Try to serialize response with a list specified for a chunk.
+    4. Check that ResponseSerializeError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=_StreamResponse)
+
+    response = _StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        chunks=[[]],
+        )
+
+    with pytest.raises(ResponseSerializeError) as exception_info:
+        server_response_factory.serialize_response(response=response)
+
+    expected_message = "Body can't be encoded with base64 encoding"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
@@ -0,0 +1,202 @@
+"""Test cases to check the configuration for template responses."""
+
+from collections import namedtuple
+
+import pytest
+
+from looseserver.common.response import ResponseParseError, ResponseSerializeError
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+
+
+_RESPONSE_FIELDS = ("template", "status", "headers")
+_TemplateResponse = namedtuple("TemplateResponse", ["response_type"] + list(_RESPONSE_FIELDS))
+
+
+def test_prepare_template_response(server_response_factory):
+    """Check that template response can be serialized.
+
+    1. Create preparator for a response factory.
+    2. Prepare template response.
+    3. Serialize new response.
+    4. Parse serialized data.
+    5. Check parsed response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(template_response_class=_TemplateResponse)
+
+    response = _TemplateResponse(
+        template="{path[0]}",
+        status=200,
+        headers={"key": "value"},
+        response_type=ResponseType.TEMPLATE.name,
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    expected_data = {
+        "template": "{path[0]}",
+        "status": 200,
+        "headers": {"key": "value"},
+        }
+    assert serialized_response["parameters"] == expected_data, "Incorrect serialization"
+
+    parsed_response = server_response_factory.parse_response(data=serialized_response)
+
+    assert isinstance(parsed_response, _TemplateResponse), "Wrong type of the response"
+    assert parsed_response.response_type == ResponseType.TEMPLATE.name, "Wrong response type"
+    assert parsed_response.template == response.template, "Wrong template"
+    assert parsed_response.status == response.status, "Wrong status"
+    assert parsed_response.headers == response.headers, "Wrong headers"
+
+
+@pytest.mark.parametrize(
+    argnames="attribute",
+    argvalues=_RESPONSE_FIELDS,
+    )
+def test_parse_missing_attribute(server_response_factory, attribute):
+    """Check that ResponseParseError is raised if one of the attributes is missing.
+
+    1. Create preparator for a response factory.
+    2. Prepare template response.
+    3. Try to parse data without one of the attributes.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(template_response_class=_TemplateResponse)
+
+    response = _TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    serialized_response["parameters"].pop(attribute)
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    expected_message = (
+        "Response parameters must be a dictionary with keys 'template', 'status' and 'headers'"
+        )
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
+
+
+def test_parse_wrong_template(server_response_factory):
+    """Check that ResponseParseError is raised if template is not a string.
+
+    1. Create preparator for a response factory.
+    2. Prepare template response.
+    3. Try to parse data with a number as the template.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(template_response_class=_TemplateResponse)
+
+    response = _TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    serialized_response["parameters"]["template"] = 1
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    assert exception_info.value.args[0] == "Template must be a string", "Wrong error message"
+
+
+def test_parse_invalid_template(server_response_factory):
+    """Check that ResponseParseError is raised if the template can't be compiled.
+
+    1. Create preparator for a response factory.
+    2. Prepare template response with a class, that raises ValueError.
+    3. Try to parse data of the response.
+    4. Check that ResponseParseError is raised.
+    5. Check the error.
+    """
+    def _create_response(**kwargs):
+        raise ValueError(kwargs["template"])
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(template_response_class=_create_response)
+
+    response = _TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="{",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    with pytest.raises(ResponseParseError) as exception_info:
+        server_response_factory.parse_response(serialized_response)
+
+    assert exception_info.value.args[0] == "Template can't be compiled", "Wrong error message"
+
+
+def test_parse_with_base_url(server_response_factory):
+    """Check that base url is passed to the template response class.
+
+    1. Create preparator for a response factory.
+    2. Prepare template response with a base url.
+    3. Parse data of the response.
+    4. Check that the response class gets the base url.
+    """
+    created_responses = []
+
+    def _create_response(base_url, **kwargs):
+        created_responses.append((base_url, _TemplateResponse(**kwargs)))
+        return created_responses[-1][1]
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(
+        template_response_class=_create_response,
+        base_url="/api/mocks/",
+        )
+
+    response = _TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="{path[0]}",
+        status=200,
+        headers={},
+        )
+    serialized_response = server_response_factory.serialize_response(response=response)
+    server_response_factory.parse_response(serialized_response)
+
+    assert created_responses == [("/api/mocks/", response)], "Wrong parameters of the response"
+
+
+@pytest.mark.parametrize(
+    argnames="attribute",
+    argvalues=_RESPONSE_FIELDS,
+    )
+def test_serialize_missing_attribute(server_response_factory, attribute):
+    """Check that ResponseSerializeError is raised if response class does not have an attribute.
+
+    1. Create preparator for a response factory.
+    2. Prepare template response.
+    3. Try to serialize response without one of the attributes.
+    4. Check that ResponseSerializeError is raised.
+    5. Check the error.
+    """
+    fields = list(_RESPONSE_FIELDS)
+    fields.remove(attribute)
+
+    _WrongResponse = namedtuple("_WrongResponse", ["response_type"] + list(fields))
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(template_response_class=_WrongResponse)
+
+    field_values = {field: "" for field in fields}
+    response = _WrongResponse(response_type=ResponseType.TEMPLATE.name, **field_values)
+
+    with pytest.raises(ResponseSerializeError) as exception_info:
+        server_response_factory.serialize_response(response=response)
+
+    expected_message = "Response must have attributes 'template', 'status' and 'headers'"
+    assert exception_info.value.args[0] == expected_message, "Wrong error message"
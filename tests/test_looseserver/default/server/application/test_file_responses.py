@@ -0,0 +1,90 @@
+"""Test cases for access of the default application to the files."""
+
+import pytest
+
+from looseserver.common.api import APIError
+from looseserver.server.application import DEFAULT_BASE_ENDPOINT, DEFAULT_CONFIGURATION_ENDPOINT
+from looseserver.client.flask import FlaskClient
+from looseserver.default.client.rule import create_rule_factory, MethodRule
+from looseserver.default.client.response import create_response_factory, FileResponse
+from looseserver.default.server.application import configure_application
+
+
+def _create_client(application):
+    """Create a flask client for the application with default factories.
+
+    :param application: configured application.
+    :returns: instance of :class:`FlaskClient <looseserver.client.flask.FlaskClient>`.
+    """
+    return FlaskClient(
+        configuration_url=DEFAULT_CONFIGURATION_ENDPOINT,
+        rule_factory=create_rule_factory(),
+        response_factory=create_response_factory(),
+        application_client=application.test_client(),
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="path",
+    argvalues=["/etc/passwd", "../../../../etc/passwd"],
+    ids=["Absolute path", "Parent directory"],
+    )
+def test_default_application(path):
+    """Check that file responses are rejected by the default application.
+
+    1. Configure application without a root directory for files.
+    2. Create a GET-rule.
+    3. Try to set a file response for the rule.
+    4. Check that the response is rejected.
+    """
+    client = _create_client(configure_application())
+    rule = client.create_rule(rule=MethodRule(method="GET"))
+
+    with pytest.raises(APIError):
+        client.set_response(rule_id=rule.rule_id, response=FileResponse(path=path))
+
+
+@pytest.mark.parametrize(
+    argnames="path",
+    argvalues=["/etc/passwd", "../secret.txt"],
+    ids=["Absolute path", "Parent directory"],
+    )
+def test_file_outside_root(tmpdir, path):
+    """Check that files outside of the root directory are rejected.
+
+    1. Configure application with a root directory for files.
+    2. Create a GET-rule.
+    3. Try to set a file response with a file outside of the root directory.
+    4. Check that the response is rejected.
+    """
+    tmpdir.join("secret.txt").write_binary(b"secret")
+    root = tmpdir.mkdir("root")
+
+    client = _create_client(configure_application(file_root=str(root)))
+    rule = client.create_rule(rule=MethodRule(method="GET"))
+
+    with pytest.raises(APIError):
+        client.set_response(rule_id=rule.rule_id, response=FileResponse(path=path))
+
+
+def test_file_inside_root(tmpdir):
+    """Check that file inside the root directory is served and its path is kept.
+
+    1. Configure application with a root directory for files.
+    2. Create a GET-rule.
+    3. Set a file response with a path relative to the root directory.
+    4. Check the path of the set response.
+    5. Make a GET-request to the base endpoint.
+    6. Check the body of the response.
+    """
+    tmpdir.join("body.txt").write_binary(b"body")
+
+    application = configure_application(file_root=str(tmpdir))
+    client = _create_client(application)
+    rule = client.create_rule(rule=MethodRule(method="GET"))
+
+    response = client.set_response(rule_id=rule.rule_id, response=FileResponse(path="body.txt"))
+    assert response.path == "body.txt", "Wrong path"
+
+    http_response = application.test_client().get(DEFAULT_BASE_ENDPOINT, buffered=True)
+    assert http_response.data == b"body", "Wrong body"
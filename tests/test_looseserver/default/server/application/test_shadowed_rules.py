@@ -0,0 +1,55 @@
+"""Test cases for the analysis of shadowed default rules."""
+
+from looseserver.client.flask import FlaskClient
+from looseserver.default.server.application import configure_application
+from looseserver.default.client.rule import (
+    create_rule_factory,
+    PathRule,
+    MethodRule,
+    CompositeRule,
+    )
+from looseserver.default.client.response import (
+    create_response_factory,
+    FixedResponse,
+    )
+
+
+def test_shadowed_rules(base_endpoint, configuration_endpoint):
+    """Check that default rules, shadowed by the preceding rules, are found.
+
+    1. Configure application with default factories.
+    2. Create a path rule, a duplicate of it, a composite rule with the same path,
+       a method rule and a composite rule with a different path.
+    3. Set responses for the rules.
+    4. Get shadowed rules.
+    5. Check that the duplicate and the composite rules are shadowed.
+    """
+    application = configure_application(
+        base_endpoint=base_endpoint,
+        configuration_endpoint=configuration_endpoint,
+        )
+    client = FlaskClient(
+        configuration_url=configuration_endpoint,
+        rule_factory=create_rule_factory(),
+        response_factory=create_response_factory(),
+        application_client=application.test_client(),
+        )
+
+    rule_specs = [
+        PathRule(path="path"),
+        PathRule(path="path"),
+        CompositeRule(children=[MethodRule(method="GET"), PathRule(path="path")]),
+        MethodRule(method="POST"),
+        CompositeRule(children=[MethodRule(method="POST"), PathRule(path="other")]),
+        CompositeRule(children=[MethodRule(method="GET"), PathRule(path="other")]),
+        ]
+    rule_ids = [client.create_rule(rule=rule_spec).rule_id for rule_spec in rule_specs]
+
+    for rule_id in rule_ids:
+        client.set_response(rule_id=rule_id, response=FixedResponse(status=200))
+
+    assert client.get_shadowed_rules() == {
+        rule_ids[1]: rule_ids[0],
+        rule_ids[2]: rule_ids[0],
+        rule_ids[4]: rule_ids[3],
+        }, "Wrong shadowed rules"
@@ -2,8 +2,17 @@
 
 from urllib.parse import urljoin
 
+import pytest
+
+from looseserver.common.response import ResponseParseError
 from looseserver.default.common.constants import ResponseType
-from looseserver.default.server.response import create_response_factory, FixedResponse
+from looseserver.default.server.response import (
+    create_response_factory,
+    FixedResponse,
+    FileResponse,
+    StreamResponse,
+    TemplateResponse,
+    )
 
 
 def test_create_response_factory(
@@ -11,16 +20,18 @@ def test_create_response_factory(
         server_rule_factory,
         application_factory,
         rule_match_all,
+        tmpdir,
     ):
+    # pylint: disable=too-many-locals
     """Check that default responses are registered in the default response factory.
 
-    1. Create default response factory.
+    1. Create default response factory with a root directory for files.
     2. Configure application with the response factory.
     3. Create a rule.
-    4. Make a POST-request to set a fixed response for the rule.
+    4. Make POST-requests to set fixed, file, stream and template responses for the rule.
     5. Check that responses are successful.
     """
-    response_factory = create_response_factory()
+    response_factory = create_response_factory(file_root=str(tmpdir))
 
     application = application_factory(response_factory=response_factory)
     client = application.test_client()
@@ -45,3 +56,87 @@ def test_create_response_factory(
         json=serialized_fixed_response,
         )
     assert fixed_response_response.status_code == 200, "Can't set a response"
+
+    body_file = tmpdir.join("body.txt")
+    body_file.write_binary(b"body")
+
+    file_response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=str(body_file),
+        status=200,
+        headers={},
+        )
+    serialized_file_response = response_factory.serialize_response(response=file_response)
+
+    file_response_response = client.post(
+        urljoin(configuration_endpoint, "response/{0}".format(rule_id)),
+        json=serialized_file_response,
+        )
+    assert file_response_response.status_code == 200, "Can't set a response"
+
+    stream_response = StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        chunks=["body"],
+        )
+    serialized_stream_response = response_factory.serialize_response(response=stream_response)
+
+    stream_response_response = client.post(
+        urljoin(configuration_endpoint, "response/{0}".format(rule_id)),
+        json=serialized_stream_response,
+        )
+    assert stream_response_response.status_code == 200, "Can't set a response"
+
+    template_response = TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="{path[0]}",
+        status=200,
+        headers={},
+        )
+    serialized_template_response = response_factory.serialize_response(
+        response=template_response,
+        )
+
+    template_response_response = client.post(
+        urljoin(configuration_endpoint, "response/{0}".format(rule_id)),
+        json=serialized_template_response,
+        )
+    assert template_response_response.status_code == 200, "Can't set a response"
+
+
+def test_file_response_access(tmpdir):
+    """Check that file responses are registered only if access to the files is configured.
+
+    1. Create default response factories without a root directory, with a root directory
+       and with unrestricted access to the files.
+    2. Parse a file response with a file in the root directory.
+    3. Check that the response is parsed only by the configured factories.
+    """
+    body_file = tmpdir.join("body.txt")
+    body_file.write_binary(b"body")
+
+    file_response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path="body.txt",
+        status=200,
+        headers={},
+        root=str(tmpdir),
+        )
+    serialized_response = create_response_factory(
+        file_root=str(tmpdir),
+        ).serialize_response(response=file_response)
+
+    with pytest.raises(ResponseParseError):
+        create_response_factory().parse_response(data=serialized_response)
+
+    parsed_response = create_response_factory(
+        file_root=str(tmpdir),
+        ).parse_response(data=serialized_response)
+    assert parsed_response.path == "body.txt", "Wrong path"
+
+    serialized_response["parameters"]["path"] = str(body_file)
+    parsed_response = create_response_factory(
+        unrestricted_files=True,
+        ).parse_response(data=serialized_response)
+    assert parsed_response.path == str(body_file), "Wrong path"
@@ -0,0 +1,387 @@
+"""Test cases for FileResponse."""
+
+import os
+from urllib.parse import urljoin
+
+import pytest
+from werkzeug.http import http_date
+
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+from looseserver.default.server.response import FileResponse
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def body_path(tmpdir):
+    """Path to the file with the body."""
+    body_file = tmpdir.join("body.json")
+    body_file.write_binary(b'{"key": "value"}')
+    return str(body_file)
+
+
+def test_response_representation(body_path):
+    """Check the representation of the file response.
+
+    1. Create a file response.
+    2. Check result of the repr function.
+    """
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=body_path,
+        status=200,
+        headers={},
+        )
+    assert repr(response) == "FileResponse(path='{0}')".format(body_path), (
+        "Wrong representation"
+        )
+
+
+def test_missing_file():
+    """Check that file response can't be created for a missing file.
+
+    1. Try to create a file response for a missing file.
+    2. Check that OSError is raised.
+    """
+    with pytest.raises(OSError):
+        FileResponse(
+            response_type=ResponseType.FILE.name,
+            path=os.path.join(os.path.dirname(__file__), "missing.json"),
+            status=200,
+            headers={},
+            )
+
+
+
+@pytest.mark.parametrize(
+    argnames="path",
+    argvalues=["../secret.json", "/etc/passwd", "link/passwd"],
+    ids=["Parent directory", "Absolute path", "Symbolic link"],
+    )
+def test_file_outside_root(tmpdir, path):
+    """Check that file response can't be created for a file outside of the root directory.
+
+    1. Create a root directory with a symbolic link to another directory.
+    2. Try to create a file response for a file outside of the root directory.
+    3. Check that ValueError is raised.
+    """
+    tmpdir.join("secret.json").write_binary(b"{}")
+    root = tmpdir.mkdir("root")
+    root.join("link").mksymlinkto("/etc")
+
+    with pytest.raises(ValueError):
+        FileResponse(
+            response_type=ResponseType.FILE.name,
+            path=path,
+            status=200,
+            headers={},
+            root=str(root),
+            )
+
+
+def test_root_directory(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        tmpdir,
+    ):
+    """Check that path is resolved relative to the root directory when the file is opened.
+
+    1. Prepare file response with a root directory in the response factory.
+    2. Create a file response with a relative path and set it for an universal rule.
+    3. Check that the path of the response is not changed.
+    4. Make a request to the base endpoint.
+    5. Check the body of the response.
+    6. Replace the file with a link to a file outside of the root directory.
+    7. Make a request to the base endpoint.
+    8. Check that response is not found.
+    """
+    root = tmpdir.mkdir("root")
+    body_file = root.join("body.json")
+    body_file.write_binary(b'{"key": "value"}')
+    tmpdir.join("secret.json").write_binary(b"{}")
+
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse, root=str(root))
+
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path="body.json",
+        status=200,
+        headers={},
+        root=str(root),
+        )
+    assert response.path == "body.json", "Wrong path"
+    apply_response(response)
+
+    http_response = configured_application_client.get(base_endpoint, buffered=True)
+    assert http_response.data == b'{"key": "value"}', "Wrong body"
+
+    body_file.remove()
+    body_file.mksymlinkto(tmpdir.join("secret.json"))
+
+    http_response = configured_application_client.get(base_endpoint)
+    assert http_response.status_code == 404, "Wrong status code"
+
+
+def test_file_body(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        body_path,
+    ):
+    """Check that body is read from the file.
+
+    1. Prepare file response in the response factory.
+    2. Create a file response and set it for an universal rule.
+    3. Make GET and HEAD requests to the base endpoint.
+    4. Check status, headers and body of the responses.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse)
+
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=body_path,
+        status=200,
+        headers={"key": "value"},
+        )
+    apply_response(response)
+
+    for method, body in (("GET", b'{"key": "value"}'), ("HEAD", b"")):
+        http_response = configured_application_client.open(
+            base_endpoint,
+            method=method,
+            buffered=True,
+            )
+        assert http_response.status_code == 200, "Wrong status code"
+        assert http_response.data == body, "Wrong body"
+        assert http_response.headers["key"] == "value", "Wrong header"
+        assert http_response.headers["Content-Type"] == "application/json", "Wrong type"
+        assert http_response.headers["Content-Length"] == "16", "Wrong content length"
+        assert http_response.headers["Last-Modified"] == http_date(os.stat(body_path).st_mtime), (
+            "Wrong modification time"
+            )
+
+
+def test_content_type(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        body_path,
+    ):
+    """Check that specified content type is not replaced.
+
+    1. Prepare file response in the response factory.
+    2. Create a file response with Content-Type header and set it for an universal rule.
+    3. Make a request to the base endpoint.
+    4. Check content type of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse)
+
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=body_path,
+        status=200,
+        headers={"content-type": "text/plain"},
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(base_endpoint, buffered=True)
+    assert http_response.headers["Content-Type"] == "text/plain", "Wrong content type"
+
+
+def test_changed_file(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        body_path,
+    ):
+    """Check that changes of the file are served.
+
+    1. Prepare file response in the response factory.
+    2. Create a file response and set it for an universal rule.
+    3. Make a request to get the ETag of the response.
+    4. Change the file.
+    5. Make a conditional request with the ETag.
+    6. Check the status and the body of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse)
+
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=body_path,
+        status=200,
+        headers={},
+        )
+    apply_response(response)
+
+    etag = configured_application_client.get(base_endpoint, buffered=True).headers["ETag"]
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"If-None-Match": etag},
+        )
+    assert http_response.status_code == 304, "Wrong status code of the conditional request"
+
+    with open(body_path, "wb") as body_file:
+        body_file.write(b"[]")
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"If-None-Match": etag},
+        buffered=True,
+        )
+    assert http_response.status_code == 200, "Wrong status code"
+    assert http_response.data == b"[]", "Wrong body"
+    assert http_response.headers["Content-Length"] == "2", "Wrong content length"
+    assert http_response.headers["ETag"] != etag, "ETag has not been changed"
+
+
+def test_removed_file(
+        base_endpoint,
+        configuration_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        body_path,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that no response is built if the file is removed.
+
+    1. Prepare file response in the response factory.
+    2. Create a file response and set it for an universal rule.
+    3. Remove the file.
+    4. Make a request to the base endpoint.
+    5. Check that response is not found.
+    6. Try to set a response for the removed file.
+    7. Check that response is not set.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse)
+
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=body_path,
+        status=200,
+        headers={},
+        )
+    apply_response(response)
+    serialized_response = server_response_factory.serialize_response(response=response)
+
+    os.remove(body_path)
+
+    http_response = configured_application_client.get(base_endpoint)
+    assert http_response.status_code == 404, "Wrong status code"
+
+    http_response = configured_application_client.post(
+        urljoin(configuration_endpoint, "response/rule"),
+        json=serialized_response,
+        )
+    assert http_response.status_code == 400, "Response has been set"
+    assert "File can't be accessed" in http_response.json["error"]["description"], (
+        "Wrong error"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="byte_range,status_code,body",
+    argvalues=[
+        ("bytes=1-4", 206, b'"key'),
+        ("bytes=-2", 206, b'"}'),
+        ("bytes=16-", 416, b""),
+        ],
+    ids=["Single range", "Suffix range", "Unsatisfiable range"],
+    )
+def test_range_request(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        body_path,
+        byte_range,
+        status_code,
+        body,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that a byte range of the file is sent for range requests.
+
+    1. Prepare file response in the response factory.
+    2. Create a file response and set it for an universal rule.
+    3. Make a request with Range header.
+    4. Check status, content length and body of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse)
+
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=body_path,
+        status=200,
+        headers={},
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"Range": byte_range},
+        buffered=True,
+        )
+    assert http_response.status_code == status_code, "Wrong status code"
+    assert http_response.data == body, "Wrong body"
+    assert http_response.headers["Content-Length"] == str(len(body)), "Wrong content length"
+
+
+def test_multiple_ranges(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        body_path,
+    ):
+    """Check that several byte ranges of the file are sent as a multipart body.
+
+    1. Prepare file response in the response factory.
+    2. Create a file response and set it for an universal rule.
+    3. Make a request with several ranges in Range header.
+    4. Check status and headers of the response.
+    5. Check parts of the body.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_file_response(file_response_class=FileResponse)
+
+    response = FileResponse(
+        response_type=ResponseType.FILE.name,
+        path=body_path,
+        status=200,
+        headers={},
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"Range": "bytes=0-0,8-13"},
+        buffered=True,
+        )
+    assert http_response.status_code == 206, "Wrong status code"
+    assert http_response.mimetype == "multipart/byteranges", "Wrong content type"
+    assert http_response.headers["Content-Length"] == str(len(http_response.data)), (
+        "Wrong content length"
+        )
+
+    boundary = http_response.mimetype_params["boundary"]
+    expected_body = b"".join(
+        (
+            "\r\n--{boundary}\r\n"
+            "Content-Type: application/json\r\n"
+            "Content-Range: bytes {range}/16\r\n\r\n"
+            ).format(boundary=boundary, range=content_range).encode("latin-1") + part
+        for content_range, part in (("0-0", b"{"), ("8-13", b'"value'))
+        ) + "\r\n--{boundary}--\r\n".format(boundary=boundary).encode("latin-1")
+    assert http_response.data == expected_body, "Wrong body"
+# pylint: enable=redefined-outer-name
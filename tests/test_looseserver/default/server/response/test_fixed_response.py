@@ -1,6 +1,11 @@
 """Test cases for FixedResponse."""
 
+import gzip
+import hashlib
+
+import flask
 import pytest
+from werkzeug.test import EnvironBuilder, run_wsgi_app
 
 from looseserver.default.common.constants import ResponseType
 from looseserver.default.common.configuration import ResponseFactoryPreparator
@@ -174,3 +179,565 @@ def test_bytes_body(
 
     http_response = configured_application_client.get(base_endpoint)
     assert http_response.data == body, "Wrong body"
+
+
+@pytest.mark.parametrize(
+    argnames="status,headers,body",
+    argvalues=[
+        (200, {}, b"body"),
+        (200, {"Content-Type": "application/json"}, '{"key": "value"}'),
+        (204, {"key": "value"}, b"body"),
+        (304, {"Content-Type": "text/plain", "ETag": '"tag"'}, b"body"),
+        (302, {"Location": "/other"}, b""),
+        ("418 I'm a teapot", {"key": 1}, "body"),
+        ],
+    ids=["Bytes body", "String body", "No content", "Not modified", "Redirect", "String status"],
+    )
+@pytest.mark.parametrize(argnames="method", argvalues=["GET", "HEAD"])
+def test_prebuilt_response(status, headers, body, method):
+    """Check that prebuilt response is identical to the response built by flask.
+
+    1. Create a fixed response.
+    2. Build a response and run it as WSGI application.
+    3. Run a flask response with the same parameters, ETag and Accept-Ranges header
+       of successful response.
+    4. Check that status, headers and body are the same.
+    """
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=status,
+        headers=headers,
+        body=body,
+        )
+    environ = EnvironBuilder(method=method).get_environ()
+
+    built_response = response.build_response(request=flask.Request(environ), rule=None)
+    flask_response = flask.Response(response=body, status=status, headers=headers)
+    if flask_response.status_code == 200:
+        flask_response.set_etag(hashlib.sha256(flask_response.get_data()).hexdigest())
+        flask_response.accept_ranges = "bytes"
+
+    app_iter, actual_status, actual_headers = run_wsgi_app(built_response, environ)
+    expected_iter, expected_status, expected_headers = run_wsgi_app(flask_response, environ)
+
+    assert actual_status == expected_status, "Wrong status"
+    assert actual_headers.to_wsgi_list() == expected_headers.to_wsgi_list(), "Wrong headers"
+    assert b"".join(app_iter) == b"".join(expected_iter), "Wrong body"
+
+
+def test_changed_prebuilt_response():
+    """Check that changes of the built response are applied.
+
+    1. Create a fixed response.
+    2. Build 2 responses and change headers, status and body of the first one.
+    3. Run both responses as WSGI applications.
+    4. Check that changes are applied to the first response only.
+    """
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={"key": "value"},
+        body=b"body",
+        )
+    environ = EnvironBuilder().get_environ()
+    request = flask.Request(environ)
+
+    changed_response = response.build_response(request=request, rule=None)
+    changed_response.headers["key"] = "new value"
+    changed_response.status = 201
+    changed_response.set_data(b"new body")
+
+    app_iter, status, headers = run_wsgi_app(changed_response, environ)
+    assert status == "201 CREATED", "Wrong status"
+    assert headers["key"] == "new value", "Wrong header"
+    assert headers["Content-Length"] == "8", "Wrong content length"
+    assert b"".join(app_iter) == b"new body", "Wrong body"
+
+    app_iter, status, headers = run_wsgi_app(response.build_response(request, None), environ)
+    assert status == "200 OK", "Wrong status of the next response"
+    assert headers["key"] == "value", "Wrong header of the next response"
+    assert b"".join(app_iter) == b"body", "Wrong body of the next response"
+
+
+@pytest.mark.parametrize(
+    argnames="method,if_none_match,status_code,body",
+    argvalues=[
+        ("GET", None, 200, b"body"),
+        ("GET", "{etag}", 304, b""),
+        ("GET", "W/{etag}", 304, b""),
+        ("GET", '"other", {etag}', 304, b""),
+        ("GET", "*", 304, b""),
+        ("GET", '"other"', 200, b"body"),
+        ("HEAD", "{etag}", 304, b""),
+        ("POST", "{etag}", 200, b"body"),
+        ],
+    ids=[
+        "Unconditional",
+        "Matching ETag",
+        "Weak ETag",
+        "Several ETags",
+        "Any ETag",
+        "Other ETag",
+        "HEAD request",
+        "POST request",
+        ],
+    )
+def test_conditional_request(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        method,
+        if_none_match,
+        status_code,
+        body,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that conditional requests are answered with 304 if ETag matches.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response and set it for an universal rule.
+    3. Make a request to get the ETag of the response.
+    4. Make a request with If-None-Match header.
+    5. Check status, body and ETag of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={"Content-Type": "text/plain"},
+        body=b"body",
+        )
+    apply_response(response)
+
+    etag = configured_application_client.get(base_endpoint).headers["ETag"]
+    assert etag == '"{0}"'.format(hashlib.sha256(b"body").hexdigest()), "Wrong ETag"
+
+    headers = {}
+    if if_none_match is not None:
+        headers["If-None-Match"] = if_none_match.format(etag=etag)
+
+    http_response = configured_application_client.open(
+        base_endpoint,
+        method=method,
+        headers=headers,
+        )
+    assert http_response.status_code == status_code, "Wrong status code"
+    assert http_response.headers["ETag"] == etag, "Wrong ETag of the response"
+    if method != "HEAD":
+        assert http_response.data == body, "Wrong body"
+
+    if status_code == 304:
+        assert "Content-Type" not in http_response.headers, "Entity header was sent"
+
+
+def test_specified_etag(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that ETag specified in the headers is used for conditional requests.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response with ETag header and set it for an universal rule.
+    3. Make a request with the specified ETag.
+    4. Check that response is not modified.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={"ETag": '"version-1"'},
+        body=b"body",
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"If-None-Match": '"version-1"'},
+        )
+    assert http_response.status_code == 304, "Wrong status code"
+    assert http_response.headers["ETag"] == '"version-1"', "Wrong ETag"
+
+
+def test_unsuccessful_response_etag(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that ETag is not added to unsuccessful responses.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response with 404 status and set it for an universal rule.
+    3. Make a conditional request.
+    4. Check that response has neither ETag nor 304 status.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=404,
+        headers={},
+        body=b"body",
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(base_endpoint, headers={"If-None-Match": "*"})
+    assert http_response.status_code == 404, "Wrong status code"
+    assert "ETag" not in http_response.headers, "ETag was added"
+
+
+@pytest.mark.parametrize(
+    argnames="accept_encoding,is_compressed",
+    argvalues=[
+        (None, False),
+        ("gzip", True),
+        ("deflate, gzip;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("deflate", False),
+        ],
+    ids=["No header", "Gzip", "Several encodings", "Any encoding", "Rejected gzip", "Other"],
+    )
+def test_compressed_response(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        accept_encoding,
+        is_compressed,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that compressed body is served only if gzip encoding is accepted.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response with enabled compression and set it for an universal rule.
+    3. Make a request with Accept-Encoding header.
+    4. Check encoding, Vary header and body of the response.
+    5. Make a conditional request with ETag of the response.
+    6. Check that response is not modified.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    body = b'{"key": "value"}' * 100
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={"Content-Type": "application/json"},
+        body=body,
+        compress=True,
+        )
+    apply_response(response)
+
+    headers = {}
+    if accept_encoding is not None:
+        headers["Accept-Encoding"] = accept_encoding
+
+    http_response = configured_application_client.get(base_endpoint, headers=headers)
+    assert http_response.status_code == 200, "Wrong status code"
+    assert http_response.headers["Vary"] == "Accept-Encoding", "Wrong Vary header"
+    assert http_response.headers["Content-Type"] == "application/json", "Wrong content type"
+
+    if is_compressed:
+        assert http_response.headers["Content-Encoding"] == "gzip", "Body is not compressed"
+        assert gzip.decompress(http_response.data) == body, "Wrong compressed body"
+    else:
+        assert "Content-Encoding" not in http_response.headers, "Body is compressed"
+        assert http_response.data == body, "Wrong body"
+
+    headers["If-None-Match"] = http_response.headers["ETag"]
+    http_response = configured_application_client.get(base_endpoint, headers=headers)
+    assert http_response.status_code == 304, "Wrong status code of the conditional request"
+
+
+@pytest.mark.parametrize(
+    argnames="status,headers,body",
+    argvalues=[
+        (200, {}, b"a"),
+        (200, {"Content-Encoding": "br"}, b"body" * 100),
+        (204, {}, b"body" * 100),
+        ],
+    ids=["Short body", "Encoded body", "No content"],
+    )
+def test_not_compressed_response(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        status,
+        headers,
+        body,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that the body is not compressed if compression is useless.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response with enabled compression and set it for an universal rule.
+    3. Make a request, that accepts gzip encoding.
+    4. Check that response is not compressed.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=status,
+        headers=headers,
+        body=body,
+        compress=True,
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"Accept-Encoding": "gzip"},
+        )
+    assert http_response.status_code == status, "Wrong status code"
+    assert http_response.headers.get("Content-Encoding") == headers.get("Content-Encoding"), (
+        "Wrong encoding"
+        )
+    assert "Vary" not in http_response.headers, "Vary header was added"
+
+
+@pytest.mark.parametrize(
+    argnames="method,byte_range,status_code,content_range,body",
+    argvalues=[
+        ("GET", "bytes=2-4", 206, "bytes 2-4/10", b"234"),
+        ("GET", "bytes=7-", 206, "bytes 7-9/10", b"789"),
+        ("GET", "bytes=-3", 206, "bytes 7-9/10", b"789"),
+        ("GET", "bytes=-30", 206, "bytes 0-9/10", b"0123456789"),
+        ("GET", "bytes=5-100", 206, "bytes 5-9/10", b"56789"),
+        ("GET", "bytes=2-3,10-", 206, "bytes 2-3/10", b"23"),
+        ("GET", "bytes=4-2", 200, None, b"0123456789"),
+        ("GET", "items=2-4", 200, None, b"0123456789"),
+        ("HEAD", "bytes=2-4", 200, None, b""),
+        ("POST", "bytes=2-4", 200, None, b"0123456789"),
+        ],
+    ids=[
+        "Closed range",
+        "Open range",
+        "Suffix range",
+        "Long suffix range",
+        "Long range",
+        "One satisfiable range",
+        "Invalid range",
+        "Unknown unit",
+        "HEAD request",
+        "POST request",
+        ],
+    )
+def test_range_request(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        method,
+        byte_range,
+        status_code,
+        content_range,
+        body,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that a single byte range of the body is sent for range requests.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response and set it for an universal rule.
+    3. Make a request with Range header.
+    4. Check status, Content-Range header and body of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={},
+        body=b"0123456789",
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.open(
+        base_endpoint,
+        method=method,
+        headers={"Range": byte_range},
+        )
+    assert http_response.status_code == status_code, "Wrong status code"
+    assert http_response.headers.get("Content-Range") == content_range, "Wrong content range"
+    assert http_response.data == body, "Wrong body"
+    assert http_response.headers["Accept-Ranges"] == "bytes", "Ranges are not accepted"
+    if method == "GET":
+        assert http_response.headers["Content-Length"] == str(len(body)), (
+            "Wrong content length"
+            )
+
+
+def test_multiple_ranges(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that several byte ranges of the body are sent as a multipart body.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response and set it for an universal rule.
+    3. Make a request with several ranges in Range header.
+    4. Check status and headers of the response.
+    5. Check parts of the body.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={"Content-Type": "text/plain"},
+        body=b"0123456789",
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"Range": "bytes=0-1,5-6,-1"},
+        )
+    assert http_response.status_code == 206, "Wrong status code"
+    assert http_response.mimetype == "multipart/byteranges", "Wrong content type"
+    assert http_response.headers["Content-Length"] == str(len(http_response.data)), (
+        "Wrong content length"
+        )
+
+    boundary = http_response.mimetype_params["boundary"]
+    expected_body = b"".join(
+        (
+            "\r\n--{boundary}\r\n"
+            "Content-Type: text/plain\r\n"
+            "Content-Range: bytes {range}/10\r\n\r\n"
+            ).format(boundary=boundary, range=content_range).encode("latin-1") + part
+        for content_range, part in (("0-1", b"01"), ("5-6", b"56"), ("9-9", b"9"))
+        ) + "\r\n--{boundary}--\r\n".format(boundary=boundary).encode("latin-1")
+    assert http_response.data == expected_body, "Wrong body"
+
+
+def test_unsatisfiable_range(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that 416 response is sent if none of the ranges can be satisfied.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response and set it for an universal rule.
+    3. Make a request with a range after the end of the body.
+    4. Check status, headers and body of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={"key": "value"},
+        body=b"0123456789",
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"Range": "bytes=10-20"},
+        )
+    assert http_response.status_code == 416, "Wrong status code"
+    assert http_response.headers["Content-Range"] == "bytes */10", "Wrong content range"
+    assert http_response.headers["key"] == "value", "Wrong header"
+    assert http_response.data == b"", "Wrong body"
+
+
+@pytest.mark.parametrize(
+    argnames="if_range,status_code",
+    argvalues=[
+        ("{etag}", 206),
+        ("W/{etag}", 200),
+        ('"other"', 200),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 200),
+        ],
+    ids=["Matching ETag", "Weak ETag", "Other ETag", "Date"],
+    )
+def test_if_range(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        if_range,
+        status_code,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that ranges are sent only if If-Range header contains the ETag of the body.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response and set it for an universal rule.
+    3. Make a request to get the ETag of the response.
+    4. Make a request with Range and If-Range headers.
+    5. Check status of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={},
+        body=b"0123456789",
+        )
+    apply_response(response)
+
+    etag = configured_application_client.get(base_endpoint).headers["ETag"]
+
+    http_response = configured_application_client.get(
+        base_endpoint,
+        headers={"Range": "bytes=2-4", "If-Range": if_range.format(etag=etag)},
+        )
+    assert http_response.status_code == status_code, "Wrong status code"
+
+
+def test_compressed_range(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that ranges of the compressed body are sent to the clients accepting gzip.
+
+    1. Prepare fixed response in the response factory.
+    2. Create a fixed response with enabled compression and set it for an universal rule.
+    3. Make a request with Accept-Encoding header to get the compressed body.
+    4. Make a range request with Accept-Encoding header.
+    5. Check that the range of the compressed body is sent.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_fixed_response(fixed_response_class=FixedResponse)
+
+    response = FixedResponse(
+        response_type=ResponseType.FIXED.name,
+        status=200,
+        headers={},
+        body=b"body" * 100,
+        compress=True,
+        )
+    apply_response(response)
+
+    headers = {"Accept-Encoding": "gzip"}
+    compressed_body = configured_application_client.get(base_endpoint, headers=headers).data
+
+    headers["Range"] = "bytes=0-9"
+    http_response = configured_application_client.get(base_endpoint, headers=headers)
+    assert http_response.status_code == 206, "Wrong status code"
+    assert http_response.headers["Content-Encoding"] == "gzip", "Wrong encoding"
+    assert http_response.data == compressed_body[:10], "Wrong body"
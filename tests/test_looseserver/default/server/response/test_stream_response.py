@@ -0,0 +1,136 @@
+"""Test cases for StreamResponse."""
+
+import pytest
+
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+from looseserver.default.server.response import StreamResponse
+
+
+def test_response_representation():
+    """Check the representation of the stream response.
+
+    1. Create a stream response.
+    2. Check result of the repr function.
+    """
+    response = StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        chunks=[],
+        )
+    assert repr(response) == "StreamResponse()", "Wrong representation"
+
+
+def test_chunks_body(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that body is streamed in the specified chunks.
+
+    1. Prepare stream response in the response factory.
+    2. Create a stream response with chunks and set it for an universal rule.
+    3. Make GET and HEAD requests to the base endpoint.
+    4. Check status, headers and body of the responses.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=StreamResponse)
+
+    response = StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=201,
+        headers={"key": "value"},
+        chunks=[b"first", b"", "second"],
+        )
+    apply_response(response)
+
+    for method, body in (("GET", b"firstsecond"), ("HEAD", b"")):
+        http_response = configured_application_client.open(base_endpoint, method=method)
+        assert http_response.status_code == 201, "Wrong status code"
+        assert http_response.data == body, "Wrong body"
+        assert http_response.headers["key"] == "value", "Wrong header"
+        assert "Content-Length" not in http_response.headers, "Content length is sent"
+
+
+@pytest.mark.parametrize(
+    argnames="chunk_size,total_size,expected_chunks",
+    argvalues=[
+        (4, 10, [b"abca", b"bcab", b"ca"]),
+        (2, 6, [b"ab", b"ca", b"bc"]),
+        (5, 3, [b"abc"]),
+        (1, 0, []),
+        ],
+    ids=["Shifted phase", "Aligned cycle", "Short body", "Empty body"],
+    )
+def test_pattern_chunks(chunk_size, total_size, expected_chunks):
+    """Check the chunks of the repeated pattern.
+
+    1. Create a stream response with a pattern.
+    2. Build a response.
+    3. Check the chunks of the response.
+    """
+    response = StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        pattern=b"abc",
+        chunk_size=chunk_size,
+        total_size=total_size,
+        )
+
+    chunks = list(response.build_response(request=None, rule=None).response)
+    assert chunks == expected_chunks, "Wrong chunks"
+
+
+def test_lazy_pattern():
+    """Check that chunks of the pattern are produced lazily.
+
+    1. Create a stream response with a pattern and a huge total size.
+    2. Build a response.
+    3. Take first chunks of the response.
+    4. Check the chunks.
+    """
+    response = StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        pattern=b"0123456789",
+        chunk_size=4,
+        total_size=1024 ** 5,
+        )
+
+    chunks = iter(response.build_response(request=None, rule=None).response)
+    assert [next(chunks) for _ in range(3)] == [b"0123", b"4567", b"8901"], "Wrong chunks"
+
+
+def test_pattern_body(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that body with a pattern is streamed.
+
+    1. Prepare stream response in the response factory.
+    2. Create a stream response with a pattern and set it for an universal rule.
+    3. Make a request to the base endpoint.
+    4. Check the body of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_stream_response(stream_response_class=StreamResponse)
+
+    response = StreamResponse(
+        response_type=ResponseType.STREAM.name,
+        status=200,
+        headers={},
+        pattern="pattern",
+        chunk_size=3,
+        total_size=100,
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(base_endpoint)
+    assert http_response.status_code == 200, "Wrong status code"
+    assert http_response.data == (b"pattern" * 15)[:100], "Wrong body"
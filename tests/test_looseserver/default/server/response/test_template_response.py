@@ -0,0 +1,206 @@
+"""Test cases for TemplateResponse."""
+
+import pytest
+
+from looseserver.default.common.constants import ResponseType
+from looseserver.default.common.configuration import ResponseFactoryPreparator
+from looseserver.default.server.response import TemplateResponse
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def base_endpoint():
+    """Base endpoint with several segments, that are not counted in the templates."""
+    return "/api/mocks/"
+# pylint: enable=redefined-outer-name
+
+
+def test_response_representation():
+    """Check the representation of the template response.
+
+    1. Create a template response.
+    2. Check result of the repr function.
+    """
+    response = TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="",
+        status=200,
+        headers={},
+        )
+    assert repr(response) == "TemplateResponse()", "Wrong representation"
+
+
+@pytest.mark.parametrize(
+    argnames="template",
+    argvalues=[
+        "{",
+        "}",
+        "{}",
+        "{body}",
+        "{path}",
+        "{path[first]}",
+        "{query[name]!r}",
+        "{header[Name]:>10}",
+        ],
+    ids=[
+        "Unclosed brace",
+        "Single closing brace",
+        "Empty placeholder",
+        "Unknown field",
+        "Missing key",
+        "Non-integer segment",
+        "Conversion",
+        "Format specification",
+        ],
+    )
+def test_invalid_template(template):
+    """Check that invalid template can't be compiled.
+
+    1. Try to create a template response with an invalid template.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        TemplateResponse(
+            response_type=ResponseType.TEMPLATE.name,
+            template=template,
+            status=200,
+            headers={},
+            )
+
+
+@pytest.mark.parametrize(
+    argnames="template,path,query_string,headers,body",
+    argvalues=[
+        ("literal", "users/42", "", {}, "literal"),
+        ("{path[0]}", "users/42", "", {}, "users"),
+        ("user {path[1]}", "users/42", "", {}, "user 42"),
+        ("{path[-1]}", "users/42", "", {}, "42"),
+        ("[{path[5]}]", "users/42", "", {}, "[]"),
+        ("{query[name]}", "", "name=first&name=second", {}, "first"),
+        ("[{query[name]}]", "", "", {}, "[]"),
+        ("{header[x-key]}", "", "", {"X-Key": "value"}, "value"),
+        ("[{header[X-Key]}]", "", "", {}, "[]"),
+        (
+            '{{"id": "{path[-1]}", "name": "{query[name]}"}}',
+            "users/42",
+            "name=user",
+            {},
+            '{"id": "42", "name": "user"}',
+            ),
+        ],
+    ids=[
+        "Literal",
+        "First path segment",
+        "Path segment",
+        "Last path segment",
+        "Missing path segment",
+        "Query value",
+        "Missing query value",
+        "Header",
+        "Missing header",
+        "Escaped braces",
+        ],
+    )
+def test_rendered_body(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+        template,
+        path,
+        query_string,
+        headers,
+        body,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that body is rendered from the template and the fields of the request.
+
+    1. Prepare template response with the base endpoint in the response factory.
+    2. Create a template response and set it for an universal rule.
+    3. Make a request to a path after the base endpoint.
+    4. Check status, headers and body of the response.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(
+        template_response_class=TemplateResponse,
+        base_url=base_endpoint,
+        )
+
+    response = TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template=template,
+        status=201,
+        headers={"key": "value"},
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(
+        base_endpoint + path,
+        query_string=query_string,
+        headers=headers,
+        )
+    assert http_response.status_code == 201, "Wrong status code"
+    assert http_response.headers["key"] == "value", "Wrong header"
+    assert http_response.data.decode("utf8") == body, "Wrong body"
+    assert http_response.headers["Content-Length"] == str(len(http_response.data)), (
+        "Wrong content length"
+        )
+
+
+def test_specified_content_length(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that specified content length is replaced with the length of the rendered body.
+
+    1. Prepare template response in the response factory.
+    2. Create a template response with Content-Length header and set it for an universal rule.
+    3. Make a request to the base endpoint.
+    4. Check that the response has a single content length of the rendered body.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(template_response_class=TemplateResponse)
+
+    response = TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="{query[name]}",
+        status=200,
+        headers={"content-length": "1"},
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(base_endpoint, query_string="name=value")
+    assert http_response.data == b"value", "Wrong body"
+    assert http_response.headers.getlist("Content-Length") == ["5"], "Wrong content length"
+
+
+def test_empty_status(
+        base_endpoint,
+        server_response_factory,
+        configured_application_client,
+        apply_response,
+    ):
+    """Check that body is not sent for the status, that forbids the body.
+
+    1. Prepare template response in the response factory.
+    2. Create a template response with 204 status and set it for an universal rule.
+    3. Make a request to the base endpoint.
+    4. Check that body is not sent.
+    """
+    preparator = ResponseFactoryPreparator(server_response_factory)
+    preparator.prepare_template_response(template_response_class=TemplateResponse)
+
+    response = TemplateResponse(
+        response_type=ResponseType.TEMPLATE.name,
+        template="{query[name]}",
+        status=204,
+        headers={},
+        )
+    apply_response(response)
+
+    http_response = configured_application_client.get(base_endpoint, query_string="name=value")
+    assert http_response.status_code == 204, "Wrong status code"
+    assert http_response.data == b"", "Body is sent"
+    assert "Content-Length" not in http_response.headers, "Content length is sent"
@@ -0,0 +1,56 @@
+"""Test cases for BodyDigestRule."""
+
+import hashlib
+
+import pytest
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.server.rule import BodyDigestRule
+
+
+def test_rule_representation():
+    """Check the representation of the body digest rule.
+
+    1. Create a body digest rule.
+    2. Check result of the repr function.
+    """
+    rule = BodyDigestRule(digest="0" * 64, rule_type=RuleType.BODY_DIGEST.name)
+    assert repr(rule) == "BodyDigestRule(digest='{0}')".format("0" * 64), "Wrong representation"
+
+
+@pytest.mark.parametrize(
+    argnames="expected_body,body,status_code",
+    argvalues=[
+        (b"body", b"body", 200),
+        (b"body", b"other", 404),
+        (b"", b"", 200),
+        (b"x" * (3 << 20), b"x" * (3 << 20), 200),
+        ],
+    ids=["Match", "Wrong body", "Empty body", "Large body"],
+    )
+def test_match(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        expected_body,
+        body,
+        status_code,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that BodyDigestRule is triggered only if digests of the bodies are equal.
+
+    1. Prepare body digest rule in the rule factory.
+    2. Create a body digest rule and set successful response for it.
+    3. Make a request with the body.
+    4. Check the status of the response.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_body_digest_rule(body_digest_rule_class=BodyDigestRule)
+
+    digest = hashlib.sha256(expected_body).hexdigest()
+    apply_rule(BodyDigestRule(rule_type=RuleType.BODY_DIGEST.name, digest=digest))
+
+    http_response = configured_application_client.post(base_endpoint, data=body)
+    assert http_response.status_code == status_code, "Wrong status code"
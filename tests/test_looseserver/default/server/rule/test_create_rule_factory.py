@@ -3,15 +3,29 @@
 from urllib.parse import urljoin
 
 from looseserver.default.common.constants import RuleType
-from looseserver.default.server.rule import create_rule_factory, PathRule, MethodRule, CompositeRule
+from looseserver.default.server.rule import (
+    create_rule_factory,
+    PathRule,
+    PathPrefixRule,
+    PathRegexRule,
+    MethodRule,
+    HostRule,
+    HeaderRule,
+    QueryRule,
+    JsonBodyRule,
+    BodyDigestRule,
+    CompositeRule,
+    )
 
 
 def test_create_rule_factory(base_endpoint, configuration_endpoint, application_factory):
+    # pylint: disable=too-many-locals,too-many-statements
     """Check that default rules are registered in the default rule factory.
 
     1. Create default rule factory.
     2. Configure application with the rule factory.
-    3. Make a 3 POST-request to create a path, method and composite rules.
+    3. Make 10 POST-requests to create a path, path prefix, path regex, method, host,
+       header, query, JSON body, body digest and composite rules.
     4. Check that responses are successful.
     """
     rule_factory = create_rule_factory(base_url=base_endpoint)
@@ -27,6 +41,20 @@ def test_create_rule_factory(base_endpoint, configuration_endpoint, application_
     assert path_rule_response.status_code == 200, "Can't create a rule"
     assert path_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
 
+    prefix_rule = PathPrefixRule(rule_type=RuleType.PATH_PREFIX.name, prefix="prefix/")
+    serialized_prefix_rule = rule_factory.serialize_rule(rule=prefix_rule)
+
+    prefix_rule_response = client.post(new_rule_endpoint, json=serialized_prefix_rule)
+    assert prefix_rule_response.status_code == 200, "Can't create a rule"
+    assert prefix_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
+
+    regex_rule = PathRegexRule(rule_type=RuleType.PATH_REGEX.name, pattern="regex/.*")
+    serialized_regex_rule = rule_factory.serialize_rule(rule=regex_rule)
+
+    regex_rule_response = client.post(new_rule_endpoint, json=serialized_regex_rule)
+    assert regex_rule_response.status_code == 200, "Can't create a rule"
+    assert regex_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
+
     method_rule = MethodRule(rule_type=RuleType.METHOD.name, method="DELETE")
     serialized_method_rule = rule_factory.serialize_rule(rule=method_rule)
 
@@ -34,6 +62,41 @@ def test_create_rule_factory(base_endpoint, configuration_endpoint, application_
     assert method_rule_response.status_code == 200, "Can't create a rule"
     assert method_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
 
+    host_rule = HostRule(rule_type=RuleType.HOST.name, host="example.com")
+    serialized_host_rule = rule_factory.serialize_rule(rule=host_rule)
+
+    host_rule_response = client.post(new_rule_endpoint, json=serialized_host_rule)
+    assert host_rule_response.status_code == 200, "Can't create a rule"
+    assert host_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
+
+    header_rule = HeaderRule(rule_type=RuleType.HEADER.name, name="X-Tenant", value="tenant")
+    serialized_header_rule = rule_factory.serialize_rule(rule=header_rule)
+
+    header_rule_response = client.post(new_rule_endpoint, json=serialized_header_rule)
+    assert header_rule_response.status_code == 200, "Can't create a rule"
+    assert header_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
+
+    query_rule = QueryRule(rule_type=RuleType.QUERY.name, name="key", value="value")
+    serialized_query_rule = rule_factory.serialize_rule(rule=query_rule)
+
+    query_rule_response = client.post(new_rule_endpoint, json=serialized_query_rule)
+    assert query_rule_response.status_code == 200, "Can't create a rule"
+    assert query_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
+
+    json_rule = JsonBodyRule(rule_type=RuleType.JSON_BODY.name, value={"op": "charge"})
+    serialized_json_rule = rule_factory.serialize_rule(rule=json_rule)
+
+    json_rule_response = client.post(new_rule_endpoint, json=serialized_json_rule)
+    assert json_rule_response.status_code == 200, "Can't create a rule"
+    assert json_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
+
+    digest_rule = BodyDigestRule(rule_type=RuleType.BODY_DIGEST.name, digest="0" * 64)
+    serialized_digest_rule = rule_factory.serialize_rule(rule=digest_rule)
+
+    digest_rule_response = client.post(new_rule_endpoint, json=serialized_digest_rule)
+    assert digest_rule_response.status_code == 200, "Can't create a rule"
+    assert digest_rule_response.json["data"]["rule_id"] is not None, "No rule ID in the response"
+
     composite_rule = CompositeRule(
         rule_type=RuleType.COMPOSITE.name,
         children=[path_rule, method_rule],
@@ -0,0 +1,136 @@
+"""Test cases for HeaderRule."""
+
+import pytest
+
+from looseserver.default.common.constants import RuleType, HeaderMatchMode
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.server.rule import HeaderRule
+
+
+def test_rule_representation():
+    """Check the representation of the header rule.
+
+    1. Create a header rule.
+    2. Check result of the repr function.
+    """
+    rule = HeaderRule(name="X-Tenant", value="tenant", rule_type=RuleType.HEADER.name)
+    assert repr(rule) == "HeaderRule(name='x-tenant', value='tenant', mode='EXACT')", (
+        "Wrong representation"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="mode,value,headers,status_code",
+    argvalues=[
+        (HeaderMatchMode.EXACT.name, "tenant", {"X-Tenant": "tenant"}, 200),
+        (HeaderMatchMode.EXACT.name, "tenant", {"x-tenant": "tenant"}, 200),
+        (HeaderMatchMode.EXACT.name, "tenant", {"X-Tenant": "Tenant"}, 404),
+        (HeaderMatchMode.EXACT.name, "tenant", {}, 404),
+        (HeaderMatchMode.PREFIX.name, "ten", {"X-Tenant": "tenant"}, 200),
+        (HeaderMatchMode.PREFIX.name, "ten", {"X-Tenant": "other"}, 404),
+        (HeaderMatchMode.REGEX.name, r"t\w+", {"X-Tenant": "tenant"}, 200),
+        (HeaderMatchMode.REGEX.name, r"t\w+", {"X-Tenant": "tenant-1"}, 404),
+        (HeaderMatchMode.REGEX.name, r".*", {}, 404),
+        (HeaderMatchMode.PRESENT.name, None, {"X-Tenant": ""}, 200),
+        (HeaderMatchMode.PRESENT.name, None, {}, 404),
+        ],
+    ids=[
+        "Exact",
+        "Case-insensitive name",
+        "Case-sensitive value",
+        "Missing header",
+        "Prefix",
+        "Wrong prefix",
+        "Regex",
+        "Partial regex match",
+        "Regex of missing header",
+        "Present",
+        "Not present",
+        ],
+    )
+def test_match(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        mode,
+        value,
+        headers,
+        status_code,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that HeaderRule is triggered only if the header matches the rule.
+
+    1. Prepare header rule in the rule factory.
+    2. Create a header rule and set successful response for it.
+    3. Make a request with the headers.
+    4. Check the status of the response.
+    5. Repeat the request several times.
+    6. Check that the status has not been changed.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_header_rule(header_rule_class=HeaderRule)
+
+    rule = HeaderRule(rule_type=RuleType.HEADER.name, name="X-Tenant", value=value, mode=mode)
+    apply_rule(rule)
+
+    for _ in range(3):
+        http_response = configured_application_client.get(base_endpoint, headers=headers)
+        assert http_response.status_code == status_code, "Wrong status code"
+
+
+def test_tenant_routing(
+        base_endpoint,
+        server_rule_factory,
+        server_response_factory,
+        configured_application_client,
+        configuration_endpoint,
+    ):
+    """Check that requests are routed to the rules by the exact values of the header.
+
+    1. Prepare header rule in the rule factory.
+    2. Create header rules for several tenants with different responses.
+    3. Make requests for every tenant.
+    4. Check the responses.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_header_rule(header_rule_class=HeaderRule)
+
+    server_response_factory.register_response(
+        response_type="TENANT",
+        parser=lambda response_type, parameters: _TenantResponse(parameters["tenant"]),
+        serializer=lambda response_type, response: {"tenant": response.tenant},
+        )
+
+    tenants = ["tenant-{0}".format(number) for number in range(20)]
+    for tenant in tenants:
+        rule = HeaderRule(rule_type=RuleType.HEADER.name, name="X-Tenant", value=tenant)
+        http_response = configured_application_client.post(
+            configuration_endpoint + "rules",
+            json=server_rule_factory.serialize_rule(rule=rule),
+            )
+        rule_id = http_response.json["data"]["rule_id"]
+        configured_application_client.post(
+            configuration_endpoint + "response/{0}".format(rule_id),
+            json={"response_type": "TENANT", "parameters": {"tenant": tenant}},
+            )
+
+    for tenant in reversed(tenants):
+        http_response = configured_application_client.get(
+            base_endpoint,
+            headers={"X-Tenant": tenant},
+            )
+        assert http_response.data == tenant.encode(), "Wrong response"
+
+
+class _TenantResponse:
+    """Response with the name of the tenant."""
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+        self.response_type = "TENANT"
+
+    def build_response(self, request, rule):
+        # pylint: disable=unused-argument
+        """Build response with the name of the tenant."""
+        return self.tenant
@@ -0,0 +1,99 @@
+"""Test cases for HostRule."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.server.rule import HostRule, PathRule, CompositeRule
+
+
+def test_rule_representation():
+    """Check the representation of the host rule.
+
+    1. Create a host rule.
+    2. Check result of the repr function.
+    """
+    rule = HostRule(host="API.example.com", rule_type=RuleType.HOST.name)
+    assert repr(rule) == "HostRule(host='api.example.com')", "Wrong representation"
+
+
+@pytest.mark.parametrize(
+    argnames="host,status_code",
+    argvalues=[
+        ("api.example.com", 200),
+        ("API.Example.COM", 200),
+        ("api.example.com:8080", 200),
+        ("other.example.com", 404),
+        ],
+    ids=[
+        "Exact",
+        "Case-insensitive",
+        "With port",
+        "Other host",
+        ],
+    )
+def test_match(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        host,
+        status_code,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that HostRule is triggered only for the host of the rule.
+
+    1. Prepare host rule in the rule factory.
+    2. Create a host rule and set successful response for it.
+    3. Make a request with the Host header.
+    4. Check the status of the response.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=HostRule)
+
+    rule = HostRule(rule_type=RuleType.HOST.name, host="api.example.com")
+    apply_rule(rule)
+
+    http_response = configured_application_client.get(base_endpoint, headers={"Host": host})
+    assert http_response.status_code == status_code, "Wrong status code"
+
+
+def test_host_qualifier(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+    ):
+    """Check that host rule qualifies other rules in a composite rule.
+
+    1. Prepare host, path and composite rules in the rule factory.
+    2. Create composite rules for the same path on 2 hosts and set successful
+       responses for them.
+    3. Make requests to the path on both hosts and on a third host.
+    4. Check the statuses of the responses.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_host_rule(host_rule_class=HostRule)
+    preparator.prepare_path_rule(path_rule_class=PathRule, base_url=base_endpoint)
+    preparator.prepare_composite_rule(composite_rule_class=CompositeRule)
+
+    for host in ("first.example.com", "second.example.com"):
+        rule = CompositeRule(
+            rule_type=RuleType.COMPOSITE.name,
+            children=[
+                HostRule(rule_type=RuleType.HOST.name, host=host),
+                PathRule(rule_type=RuleType.PATH.name, path="path"),
+                ],
+            )
+        apply_rule(rule)
+
+    path_url = urljoin(base_endpoint, "path")
+    for host, status_code in (
+            ("first.example.com", 200),
+            ("second.example.com", 200),
+            ("third.example.com", 404),
+    ):
+        http_response = configured_application_client.get(path_url, headers={"Host": host})
+        assert http_response.status_code == status_code, "Wrong status code"
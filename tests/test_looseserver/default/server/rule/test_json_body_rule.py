@@ -0,0 +1,119 @@
+"""Test cases for JsonBodyRule."""
+
+import json
+
+import pytest
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.server.rule import JsonBodyRule
+
+
+def test_rule_representation():
+    """Check the representation of the JSON body rule.
+
+    1. Create a JSON body rule.
+    2. Check result of the repr function.
+    """
+    rule = JsonBodyRule(value={"op": "charge"}, path="$.order", rule_type=RuleType.JSON_BODY.name)
+    assert repr(rule) == "JsonBodyRule(value={'op': 'charge'}, path='$.order')", (
+        "Wrong representation"
+        )
+
+
+@pytest.mark.parametrize(
+    argnames="path",
+    argvalues=["order", "$.", "$..order", "$[a]", "$[-1]", '$["order]'],
+    )
+def test_invalid_path(path):
+    """Check that ValueError is raised for invalid paths.
+
+    1. Try to create a JSON body rule with invalid path.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        JsonBodyRule(value=1, path=path, rule_type=RuleType.JSON_BODY.name)
+
+
+@pytest.mark.parametrize(
+    argnames="value,path,body,status_code",
+    argvalues=[
+        ({"op": "charge"}, "$", {"op": "charge", "amount": 10}, 200),
+        ({"op": "charge"}, "$", {"op": "refund"}, 404),
+        ({"op": "charge"}, "$", ["op"], 404),
+        ({"order": {"id": 1}}, "$", {"order": {"id": 1, "items": []}}, 200),
+        ([{"id": 1}, {}], "$.items", {"items": [{"id": 1, "x": 2}, {"id": 2}]}, 200),
+        ([{"id": 1}], "$.items", {"items": [{"id": 1}, {"id": 2}]}, 404),
+        ("book", "$.items[1].kind", {"items": [{}, {"kind": "book"}]}, 200),
+        ("book", "$.items[2].kind", {"items": [{}, {"kind": "book"}]}, 404),
+        (1, '$["a key"]', {"a key": 1}, 200),
+        (1, "$.flag", {"flag": True}, 404),
+        (None, "$.missing", {}, 404),
+        (None, "$.empty", {"empty": None}, 200),
+        ],
+    ids=[
+        "Subset",
+        "Wrong value",
+        "Wrong type",
+        "Nested subset",
+        "Array",
+        "Array of different length",
+        "Index",
+        "Index out of range",
+        "Quoted key",
+        "Boolean is not a number",
+        "Missing key",
+        "Null",
+        ],
+    )
+def test_match(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        value,
+        path,
+        body,
+        status_code,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that JsonBodyRule is triggered only if the selected part contains the value.
+
+    1. Prepare JSON body rule in the rule factory.
+    2. Create a JSON body rule and set successful response for it.
+    3. Make a request with JSON body.
+    4. Check the status of the response.
+    5. Repeat the request several times.
+    6. Check that the status has not been changed.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_json_body_rule(json_body_rule_class=JsonBodyRule)
+
+    rule = JsonBodyRule(rule_type=RuleType.JSON_BODY.name, value=value, path=path)
+    apply_rule(rule)
+
+    for _ in range(3):
+        http_response = configured_application_client.post(base_endpoint, data=json.dumps(body))
+        assert http_response.status_code == status_code, "Wrong status code"
+
+
+def test_invalid_body(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+    ):
+    """Check that JsonBodyRule does not find a match in a body, that is not a JSON.
+
+    1. Prepare JSON body rule in the rule factory.
+    2. Create a JSON body rule for any body and set successful response for it.
+    3. Make a request with invalid JSON body.
+    4. Check the status of the response.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_json_body_rule(json_body_rule_class=JsonBodyRule)
+
+    apply_rule(JsonBodyRule(rule_type=RuleType.JSON_BODY.name, value={}))
+
+    http_response = configured_application_client.post(base_endpoint, data=b"{not json")
+    assert http_response.status_code == 404, "Wrong status code"
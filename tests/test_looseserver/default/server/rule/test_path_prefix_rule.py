@@ -0,0 +1,105 @@
+"""Test cases for PathPrefixRule."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.server.rule import PathPrefixRule
+
+
+def test_rule_representation():
+    """Check the representation of the path prefix rule.
+
+    1. Create a path prefix rule.
+    2. Check result of the repr function.
+    """
+    rule = PathPrefixRule(prefix="test/", rule_type=RuleType.PATH_PREFIX.name)
+    assert repr(rule) == "PathPrefixRule(prefix='test/')", "Wrong representation"
+
+
+@pytest.mark.parametrize(
+    argnames="prefix,path",
+    argvalues=[
+        ("", ""),
+        ("users/", "users/"),
+        ("users/", "users/1"),
+        ("users/", "users/1/orders"),
+        ],
+    ids=[
+        "Base",
+        "Same path",
+        "Child",
+        "Grandchild",
+        ]
+    )
+def test_match_found(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        prefix,
+        path,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that PathPrefixRule is triggered for paths with the specified prefix.
+
+    1. Prepare path prefix rule in the rule factory.
+    2. Create a path prefix rule and set successful response for it.
+    3. Make a request to the path with the prefix.
+    4. Check that the rule finds a match.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_prefix_rule(
+        path_prefix_rule_class=PathPrefixRule,
+        base_url=base_endpoint,
+        )
+
+    rule = PathPrefixRule(rule_type=RuleType.PATH_PREFIX.name, prefix=prefix)
+    apply_rule(rule)
+
+    http_response = configured_application_client.get(urljoin(base_endpoint, path))
+    assert http_response.status_code == 200, "Wrong status code"
+
+
+@pytest.mark.parametrize(
+    argnames="prefix,unmanaged_path",
+    argvalues=[
+        ("users/", "users"),
+        ("users/", "orders/users/"),
+        ("users/1", "users/2"),
+        ],
+    ids=[
+        "Shorter path",
+        "Infix",
+        "Different path",
+        ],
+    )
+def test_no_match(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        prefix,
+        unmanaged_path,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that PathPrefixRule is not triggered for paths without the prefix.
+
+    1. Prepare path prefix rule in the rule factory.
+    2. Create a path prefix rule and set successful response for it.
+    3. Make a request to a path without the prefix.
+    4. Check that the rule does not find a match.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_prefix_rule(
+        path_prefix_rule_class=PathPrefixRule,
+        base_url=base_endpoint,
+        )
+
+    rule = PathPrefixRule(rule_type=RuleType.PATH_PREFIX.name, prefix=prefix)
+    apply_rule(rule)
+
+    http_response = configured_application_client.get(urljoin(base_endpoint, unmanaged_path))
+    assert http_response.status_code == 404, "Wrong status code"
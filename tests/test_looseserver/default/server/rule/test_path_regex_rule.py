@@ -0,0 +1,74 @@
+"""Test cases for PathRegexRule."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.server.rule import PathRegexRule
+
+
+def test_rule_representation():
+    """Check the representation of the path regex rule.
+
+    1. Create a path regex rule.
+    2. Check result of the repr function.
+    """
+    rule = PathRegexRule(pattern="test/.*", rule_type=RuleType.PATH_REGEX.name)
+    assert repr(rule) == "PathRegexRule(pattern='test/.*')", "Wrong representation"
+
+
+@pytest.mark.parametrize(
+    argnames="pattern,path,status_code",
+    argvalues=[
+        (r"users/\d+", "users/12", 200),
+        (r"users/\d+", "users/12/orders", 404),
+        (r"users/\d+", "users/", 404),
+        (r"(users|orders)/\1", "users/users", 200),
+        (r"(?i:USERS)", "users", 200),
+        (r"users|orders", "orders", 200),
+        (r"users|orders", "users", 200),
+        (r"(?i)USERS", "users", 200),
+        (r"(?i)(?x) USERS / \d+", "users/12", 200),
+        ],
+    ids=[
+        "Match",
+        "Longer path",
+        "Shorter path",
+        "Backreference",
+        "Scoped flags",
+        "Last alternative",
+        "First alternative",
+        "Leading flags",
+        "Several leading flags",
+        ],
+    )
+def test_match(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        pattern,
+        path,
+        status_code,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that PathRegexRule is triggered only if the pattern matches the whole path.
+
+    1. Prepare path regex rule in the rule factory.
+    2. Create a path regex rule and set successful response for it.
+    3. Make a request to the path.
+    4. Check the status of the response.
+    5. Repeat the request several times.
+    6. Check that the status has not been changed.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_path_regex_rule(path_regex_rule_class=PathRegexRule, base_url=base_endpoint)
+
+    rule = PathRegexRule(rule_type=RuleType.PATH_REGEX.name, pattern=pattern)
+    apply_rule(rule)
+
+    for _ in range(3):
+        http_response = configured_application_client.get(urljoin(base_endpoint, path))
+        assert http_response.status_code == status_code, "Wrong status code"
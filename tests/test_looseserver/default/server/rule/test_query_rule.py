@@ -0,0 +1,79 @@
+"""Test cases for QueryRule."""
+
+from urllib.parse import urljoin
+
+import pytest
+
+from looseserver.default.common.constants import RuleType
+from looseserver.default.common.configuration import RuleFactoryPreparator
+from looseserver.default.server.rule import QueryRule
+
+
+def test_rule_representation():
+    """Check the representation of the query rule.
+
+    1. Create a query rule.
+    2. Check result of the repr function.
+    """
+    rule = QueryRule(name="key", value="value", rule_type=RuleType.QUERY.name)
+    assert repr(rule) == "QueryRule(name='key', value='value')", "Wrong representation"
+
+
+@pytest.mark.parametrize(
+    argnames="value,query,status_code",
+    argvalues=[
+        ("value", "key=value", 200),
+        ("value", "other=1&key=value", 200),
+        ("value", "key=other", 404),
+        ("value", "Key=value", 404),
+        ("value", "key=value&key=other", 200),
+        ("value", "key=other&key=value", 404),
+        ("", "key=", 200),
+        ("value", "", 404),
+        (None, "key=", 200),
+        (None, "other=value", 404),
+        ],
+    ids=[
+        "Match",
+        "Several parameters",
+        "Wrong value",
+        "Case-sensitive name",
+        "First of repeated values",
+        "Second of repeated values",
+        "Empty value",
+        "Missing parameter",
+        "Present",
+        "Not present",
+        ],
+    )
+def test_match(
+        base_endpoint,
+        server_rule_factory,
+        configured_application_client,
+        apply_rule,
+        value,
+        query,
+        status_code,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that QueryRule is triggered only if the query parameter matches the rule.
+
+    1. Prepare query rule in the rule factory.
+    2. Create a query rule and set successful response for it.
+    3. Make a request with the query string.
+    4. Check the status of the response.
+    5. Repeat the request several times.
+    6. Check that the status has not been changed.
+    """
+    preparator = RuleFactoryPreparator(server_rule_factory)
+    preparator.prepare_query_rule(query_rule_class=QueryRule)
+
+    rule = QueryRule(rule_type=RuleType.QUERY.name, name="key", value=value)
+    apply_rule(rule)
+
+    for _ in range(3):
+        http_response = configured_application_client.get(
+            urljoin(base_endpoint, "path"),
+            query_string=query,
+            )
+        assert http_response.status_code == status_code, "Wrong status code"
@@ -1,5 +1,7 @@
 """Test cases for commandline parser."""
 
+import pytest
+
 from looseserver.server.application import DEFAULT_BASE_ENDPOINT, DEFAULT_CONFIGURATION_ENDPOINT
 from looseserver.default.server.run import create_parser
 
@@ -100,3 +102,82 @@ def test_default_configuration_endpoint():
     assert parsed_arguments.configuration_endpoint == DEFAULT_CONFIGURATION_ENDPOINT, (
         "Wrong endpoint"
         )
+
+
+def test_compile_predicates():
+    """Test flag to compile predicates.
+
+    1. Create the parser.
+    2. Parse arguments with and without the flag.
+    3. Check the parsed values.
+    """
+    parser = create_parser()
+    assert parser.parse_args(["--compile-predicates"]).compile_predicates, "Flag is not set"
+    assert not parser.parse_args([]).compile_predicates, "Flag is set by default"
+
+
+def test_match_cache_size():
+    """Test size of the match cache.
+
+    1. Create the parser.
+    2. Parse arguments with and without the size of the cache.
+    3. Check the parsed values.
+    """
+    parser = create_parser()
+    assert parser.parse_args(["--match-cache-size", "10"]).match_cache_size == 10, "Wrong size"
+    assert parser.parse_args([]).match_cache_size is None, "Cache is enabled by default"
+
+
+def test_negative_cache_size():
+    """Test size of the negative cache.
+
+    1. Create the parser.
+    2. Parse arguments with and without the size of the cache.
+    3. Check the parsed values.
+    """
+    parser = create_parser()
+    parsed_size = parser.parse_args(["--negative-cache-size", "10"]).negative_cache_size
+    assert parsed_size == 10, "Wrong size"
+    assert parser.parse_args([]).negative_cache_size is None, "Cache is enabled by default"
+
+
+def test_adaptive_dispatch():
+    """Test flag to disable adaptive dispatch.
+
+    1. Create the parser.
+    2. Parse arguments with and without the flag.
+    3. Check the parsed values.
+    """
+    parser = create_parser()
+    assert parser.parse_args([]).adaptive_dispatch, "Adaptive dispatch is disabled by default"
+    disabled = parser.parse_args(["--no-adaptive-dispatch"]).adaptive_dispatch
+    assert not disabled, "Adaptive dispatch is not disabled"
+
+
+def test_file_root():
+    """Test root directory for file responses.
+
+    1. Create the parser.
+    2. Parse arguments with and without the root directory.
+    3. Check the parsed values.
+    """
+    parser = create_parser()
+    assert parser.parse_args(["--file-root", "/srv"]).file_root == "/srv", "Wrong root"
+    assert parser.parse_args([]).file_root is None, "Files are restricted by default"
+
+
+def test_unrestricted_files():
+    """Test flag to allow file responses with any file.
+
+    1. Create the parser.
+    2. Parse arguments with and without the flag.
+    3. Check the parsed values.
+    4. Try to parse the flag together with the root directory.
+    5. Check that arguments are rejected.
+    """
+    parser = create_parser()
+    assert parser.parse_args(["--unrestricted-files"]).unrestricted_files, "Flag is not parsed"
+    assert not parser.parse_args([]).unrestricted_files, "Files are unrestricted by default"
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(["--unrestricted-files", "--file-root", "/srv"])
@@ -3,11 +3,12 @@
 import pytest
 from flask import Flask
 
+from looseserver.common.api import APIError
 from looseserver.server.application import DEFAULT_BASE_ENDPOINT, DEFAULT_CONFIGURATION_ENDPOINT
 import looseserver.default.server.run as run_module
 from looseserver.default.client.flask import FlaskClient
 from looseserver.default.client.rule import MethodRule
-from looseserver.default.client.response import FixedResponse
+from looseserver.default.client.response import FixedResponse, FileResponse
 
 
 @pytest.fixture(autouse=True)
@@ -96,3 +97,42 @@ def test_application(flask_run_parameters, base_endpoint, configuration_endpoint
     client.set_response(rule_id=rule.rule_id, response=FixedResponse(status=200))
 
     assert application_client.get(base_endpoint).status_code == 200, "Wrong status"
+
+
+def test_file_root(flask_run_parameters, tmpdir):
+    """Check that file responses are restricted to the specified root directory.
+
+    1. Run application with a root directory for file responses.
+    2. Create a flask client.
+    3. Create a method rule and set a file response with a path relative to the root.
+    4. Make a GET-request for the base endpoint.
+    5. Check the response.
+    6. Try to set a file response with a file outside of the root directory.
+    7. Check that the response is rejected.
+    """
+    root = tmpdir.mkdir("root")
+    root.join("body.txt").write_binary(b"body")
+    tmpdir.join("secret.txt").write_binary(b"secret")
+
+    run_module._run(["--file-root", str(root)])  # pylint: disable=protected-access
+
+    application = flask_run_parameters["self"]
+    application_client = application.test_client()
+
+    client = FlaskClient(
+        configuration_url=DEFAULT_CONFIGURATION_ENDPOINT,
+        application_client=application_client,
+        )
+
+    rule = client.create_rule(rule=MethodRule(method="GET"))
+    client.set_response(rule_id=rule.rule_id, response=FileResponse(path="body.txt"))
+
+    http_response = application_client.get(DEFAULT_BASE_ENDPOINT)
+    assert http_response.data == b"body", "Wrong body"
+    http_response.close()
+
+    with pytest.raises(APIError):
+        client.set_response(
+            rule_id=rule.rule_id,
+            response=FileResponse(path=str(tmpdir.join("secret.txt"))),
+            )
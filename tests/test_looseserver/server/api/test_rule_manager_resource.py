@@ -177,3 +177,111 @@ def test_serialization_failed_unknown_error(
     expected_error = APIError("Rule may be created, but can't be serialized")
     assert http_response.json == build_response(error=expected_error), "Wrong response"
     assert not core_manager.get_rules_order(), "Rule has been created"
+
+
+def test_create_rule_with_ttl(
+        core_manager,
+        rules_manager_endpoint,
+        server_rule_factory,
+        registered_rule_prototype,
+        application_client,
+        monkeypatch,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that rule can be created with TTL.
+
+    1. Make a POST request to create a rule with TTL.
+    2. Check the response.
+    3. Check that TTL has been passed to the manager.
+    """
+    added_rules = []
+    add_rule = core_manager.add_rule
+
+    def _add_rule(rule, ttl=None, **kwargs):
+        added_rules.append((rule, ttl))
+        return add_rule(rule, ttl=ttl, **kwargs)
+
+    monkeypatch.setattr(core_manager, "add_rule", _add_rule)
+
+    serialized_rule = server_rule_factory.serialize_rule(registered_rule_prototype)
+    serialized_rule["ttl"] = 1.5
+    http_response = application_client.post(rules_manager_endpoint, json=serialized_rule)
+
+    assert http_response.status_code == 200, "Wrong status code"
+
+    json_response = http_response.json
+    expected_data = {"rule_id": json_response["data"].get("rule_id")}
+    expected_data.update(serialized_rule)
+    assert json_response == build_response(data=expected_data), "Wrong response"
+
+    assert [ttl for _, ttl in added_rules] == [1.5], "Wrong TTL"
+
+
+@pytest.mark.parametrize(
+    argnames="ttl",
+    argvalues=[0, -1, "10", True, float("nan"), float("inf")],
+    ids=["Zero", "Negative", "String", "Boolean", "NaN", "Infinity"],
+    )
+def test_invalid_ttl(
+        core_manager,
+        rules_manager_endpoint,
+        server_rule_factory,
+        registered_rule_prototype,
+        application_client,
+        ttl,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that error is returned if TTL is invalid.
+
+    1. Make a POST request to create a rule with invalid TTL.
+    2. Check that response contains an error.
+    3. Check that rule has not been created.
+    """
+    serialized_rule = server_rule_factory.serialize_rule(registered_rule_prototype)
+    serialized_rule["ttl"] = ttl
+    http_response = application_client.post(rules_manager_endpoint, json=serialized_rule)
+
+    assert http_response.status_code == 400, "Wrong status code"
+
+    expected_message = (
+        "Failed to create a rule for specified parameters. "
+        "Error: 'TTL must be a positive finite number'"
+        )
+    expected_error = APIError(expected_message)
+    assert http_response.json == build_response(error=expected_error), "Wrong response"
+    assert not core_manager.get_rules_order(), "Rule has been created"
+
+
+@pytest.mark.parametrize(
+    argnames="remaining_uses",
+    argvalues=[0, 1.5, "1", False],
+    ids=["Zero", "Float", "String", "Boolean"],
+    )
+def test_invalid_remaining_uses(
+        core_manager,
+        rules_manager_endpoint,
+        server_rule_factory,
+        registered_rule_prototype,
+        application_client,
+        remaining_uses,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that error is returned if number of uses is invalid.
+
+    1. Make a POST request to create a rule with invalid number of uses.
+    2. Check that response contains an error.
+    3. Check that rule has not been created.
+    """
+    serialized_rule = server_rule_factory.serialize_rule(registered_rule_prototype)
+    serialized_rule["remaining_uses"] = remaining_uses
+    http_response = application_client.post(rules_manager_endpoint, json=serialized_rule)
+
+    assert http_response.status_code == 400, "Wrong status code"
+
+    expected_message = (
+        "Failed to create a rule for specified parameters. "
+        "Error: 'Remaining uses must be a positive integer'"
+        )
+    expected_error = APIError(expected_message)
+    assert http_response.json == build_response(error=expected_error), "Wrong response"
+    assert not core_manager.get_rules_order(), "Rule has not been created"
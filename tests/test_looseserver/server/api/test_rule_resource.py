@@ -53,6 +53,30 @@ def test_get_rule(
     assert http_response.json == build_response(data=expected_data), "Wrong response"
 
 
+def test_get_limited_rule(
+        core_manager,
+        rule_endpoint,
+        server_rule_factory,
+        registered_rule_prototype,
+        application_client,
+    ):
+    """Check that remaining uses of the rule are obtained with API.
+
+    1. Create a rule with limited uses.
+    2. Make a GET request to get the rule.
+    3. Check the remaining uses.
+    """
+    rule_id = core_manager.add_rule(rule=registered_rule_prototype, remaining_uses=3)
+
+    http_response = application_client.get(rule_endpoint.format(rule_id=rule_id))
+    assert http_response.status_code == 200, "Wrong status code"
+
+    expected_data = server_rule_factory.serialize_rule(registered_rule_prototype)
+    expected_data["rule_id"] = rule_id
+    expected_data["remaining_uses"] = 3
+    assert http_response.json == build_response(data=expected_data), "Wrong response"
+
+
 def test_get_non_existent_rule(
         core_manager,
         rule_endpoint,
@@ -0,0 +1,75 @@
+"""Test cases for the shadowed rules resourse of the looseserver API."""
+
+import pytest
+
+from flask import Flask
+from flask_restful import Api
+
+from looseserver.server.api import ShadowedRules, build_response
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def shadowed_rules_endpoint():
+    """Endpoint of the shadowed rules resource."""
+    return "/shadowed_rules"
+
+
+@pytest.fixture
+def application_client(shadowed_rules_endpoint, core_manager):
+    """Client of the configured application."""
+    application = Flask("TestApplication")
+    api = Api(application)
+    api.add_resource(
+        ShadowedRules,
+        shadowed_rules_endpoint,
+        resource_class_args=(core_manager, ),
+        )
+    return application.test_client()
+
+
+def test_get_shadowed_rules(
+        core_manager,
+        shadowed_rules_endpoint,
+        server_rule_prototype,
+        server_response_prototype,
+        application_client,
+    ):
+    """Check that shadowed rules can be obtained with API.
+
+    1. Create 3 rules with the same predicate.
+    2. Set responses for the rules.
+    3. Make a GET request to get shadowed rules.
+    4. Check that the last 2 rules are shadowed by the first one.
+    """
+    class _KeyedRule(type(server_rule_prototype)):
+        """Rule with a predicate key."""
+
+        @property
+        def predicate_key(self):
+            """Key of the predicate."""
+            return "key"
+
+    rule_ids = [core_manager.add_rule(rule=_KeyedRule()) for _ in range(3)]
+    for rule_id in rule_ids:
+        core_manager.set_response(rule_id=rule_id, response=server_response_prototype)
+
+    http_response = application_client.get(shadowed_rules_endpoint)
+    assert http_response.status_code == 200, "Wrong status code"
+
+    expected_data = [
+        {"rule_id": rule_ids[1], "shadowing_rule_id": rule_ids[0]},
+        {"rule_id": rule_ids[2], "shadowing_rule_id": rule_ids[0]},
+        ]
+    assert http_response.json == build_response(data=expected_data), "Wrong response"
+
+
+def test_no_shadowed_rules(shadowed_rules_endpoint, application_client):
+    """Check that empty list is returned if there are no shadowed rules.
+
+    1. Make a GET request to get shadowed rules.
+    2. Check the response.
+    """
+    http_response = application_client.get(shadowed_rules_endpoint)
+    assert http_response.status_code == 200, "Wrong status code"
+    assert http_response.json == build_response(data=[]), "Wrong response"
@@ -27,3 +27,29 @@ def managed_application_client(base_endpoint, core_manager):
         methods=methods,
         )
     return application.test_client()
+
+
+@pytest.fixture
+def counted_rule(server_rule_prototype):
+    """Factory of rules counting their checks."""
+    class CountedRule(type(server_rule_prototype)):
+        """Rule counting its checks."""
+
+        def __init__(self, result, features):
+            super(CountedRule, self).__init__(match_implementation=self._check)
+            self.checks = 0
+            self._result = result
+            self._features = features
+
+        @staticmethod
+        def _check(rule, request):
+            # pylint: disable=unused-argument
+            rule.checks += 1
+            return rule._result   # pylint: disable=protected-access
+
+        @property
+        def features(self):
+            """Features of the rule."""
+            return self._features
+
+    return CountedRule
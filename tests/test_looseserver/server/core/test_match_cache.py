@@ -0,0 +1,116 @@
+"""Tests for the match cache of the core manager."""
+
+import pytest
+
+from looseserver.server.core import Manager
+from looseserver.server.request import PATH_FEATURE
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def core_manager(base_endpoint):
+    """Core manager with enabled match cache."""
+    return Manager(base=base_endpoint, match_cache_size=10)
+# pylint: enable=redefined-outer-name
+
+
+def test_cached_match(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_response_prototype,
+        counted_rule,
+    ):
+    """Check that match is cached by the features of the request.
+
+    1. Create a rule, that does not find a match, and a rule, that finds a match.
+    2. Set responses for the rules.
+    3. Make 2 requests to the same path.
+    4. Check that rules have been checked once.
+    5. Check statistics of the cache.
+    """
+    no_match_rule = counted_rule(result=False, features=frozenset((PATH_FEATURE, )))
+    match_rule = counted_rule(result=True, features=frozenset((PATH_FEATURE, )))
+
+    for rule in (no_match_rule, match_rule):
+        rule_id = core_manager.add_rule(rule=rule)
+        response = server_response_prototype.create_new(builder_implementation=b"body")
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    for _ in range(2):
+        http_response = managed_application_client.get(base_endpoint)
+        assert http_response.data == b"body", "Wrong body"
+
+    assert no_match_rule.checks == 1, "Wrong number of checks"
+    assert match_rule.checks == 1, "Wrong number of checks"
+
+    cache_info = core_manager.match_cache_info
+    assert (cache_info.hits, cache_info.misses) == (1, 1), "Wrong statistics"
+
+
+def test_invalidation(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_response_prototype,
+        counted_rule,
+    ):
+    """Check that cached matches are invalidated when responses are changed.
+
+    1. Create a rule, that finds a match, and set a response for it.
+    2. Make a request.
+    3. Set another response for the rule.
+    4. Make a request.
+    5. Check that the new response is returned.
+    """
+    rule = counted_rule(result=True, features=frozenset((PATH_FEATURE, )))
+    rule_id = core_manager.add_rule(rule=rule)
+
+    first_response = server_response_prototype.create_new(builder_implementation=b"first")
+    core_manager.set_response(rule_id=rule_id, response=first_response)
+    assert managed_application_client.get(base_endpoint).data == b"first", "Wrong body"
+
+    second_response = server_response_prototype.create_new(builder_implementation=b"second")
+    core_manager.set_response(rule_id=rule_id, response=second_response)
+    assert managed_application_client.get(base_endpoint).data == b"second", "Wrong body"
+
+    assert rule.checks == 2, "Outdated match has been used"
+
+
+def test_unknown_features(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_response_prototype,
+        counted_rule,
+    ):
+    """Check that rules with unknown features bypass the cache.
+
+    1. Create a rule with unknown features, that does not find a match.
+    2. Create a rule with known features, that finds a match.
+    3. Set responses for the rules.
+    4. Make 2 requests to the same path.
+    5. Check that the rule with unknown features has been checked for every request.
+    """
+    unknown_rule = counted_rule(result=False, features=None)
+    known_rule = counted_rule(result=True, features=frozenset((PATH_FEATURE, )))
+
+    for rule in (unknown_rule, known_rule):
+        rule_id = core_manager.add_rule(rule=rule)
+        response = server_response_prototype.create_new(builder_implementation=b"body")
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    for _ in range(2):
+        assert managed_application_client.get(base_endpoint).status_code == 200, "Wrong status"
+
+    assert unknown_rule.checks == 2, "Rule with unknown features has been cached"
+    assert known_rule.checks == 1, "Rule with known features has not been cached"
+
+
+def test_disabled_cache(base_endpoint):
+    """Check that match cache is disabled by default.
+
+    1. Create a manager without specifying the size of the cache.
+    2. Check statistics of the cache.
+    """
+    assert Manager(base=base_endpoint).match_cache_info is None, "Cache is enabled"
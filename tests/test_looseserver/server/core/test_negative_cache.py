@@ -0,0 +1,120 @@
+"""Tests for the negative cache of the core manager."""
+
+import pytest
+
+from looseserver.server.core import Manager
+from looseserver.server.request import PATH_FEATURE
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def core_manager(base_endpoint):
+    """Core manager with enabled negative cache."""
+    return Manager(base=base_endpoint, negative_cache_size=10)
+# pylint: enable=redefined-outer-name
+
+
+def test_cached_miss(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_response_prototype,
+        counted_rule,
+    ):
+    """Check that requests without matches are cached by the features of the request.
+
+    1. Create 2 rules, that do not find a match.
+    2. Set responses for the rules.
+    3. Make 2 requests to the same path.
+    4. Check that responses are not found.
+    5. Check that rules have been checked once.
+    6. Check statistics of the cache.
+    """
+    rules = [
+        counted_rule(result=False, features=frozenset((PATH_FEATURE, ))),
+        counted_rule(result=False, features=frozenset((PATH_FEATURE, ))),
+        ]
+
+    for rule in rules:
+        rule_id = core_manager.add_rule(rule=rule)
+        response = server_response_prototype.create_new(builder_implementation=b"body")
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    for _ in range(2):
+        http_response = managed_application_client.get(base_endpoint)
+        assert http_response.status_code == 404, "Wrong status"
+
+    assert [rule.checks for rule in rules] == [1, 1], "Wrong number of checks"
+
+    cache_info = core_manager.negative_cache_info
+    assert (cache_info.hits, cache_info.misses) == (1, 1), "Wrong statistics"
+    assert core_manager.match_cache_info is None, "Match cache is enabled"
+
+
+def test_invalidation(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_response_prototype,
+        counted_rule,
+    ):
+    """Check that cached misses are invalidated when rules are changed.
+
+    1. Create a rule, that does not find a match, and set a response for it.
+    2. Make a request.
+    3. Add a rule, that finds a match, and set a response for it.
+    4. Make a request.
+    5. Check that the response of the new rule is returned.
+    """
+    no_match_rule = counted_rule(result=False, features=frozenset((PATH_FEATURE, )))
+    rule_id = core_manager.add_rule(rule=no_match_rule)
+    response = server_response_prototype.create_new(builder_implementation=b"body")
+    core_manager.set_response(rule_id=rule_id, response=response)
+
+    assert managed_application_client.get(base_endpoint).status_code == 404, "Wrong status"
+
+    match_rule = counted_rule(result=True, features=frozenset((PATH_FEATURE, )))
+    rule_id = core_manager.add_rule(rule=match_rule)
+    core_manager.set_response(rule_id=rule_id, response=response)
+
+    assert managed_application_client.get(base_endpoint).data == b"body", "Wrong body"
+    assert no_match_rule.checks == 2, "Outdated miss has been used"
+
+
+def test_unknown_features(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_response_prototype,
+        counted_rule,
+    ):
+    """Check that rules with unknown features are checked for cached misses.
+
+    1. Create a rule with known features, that does not find a match.
+    2. Create a rule with unknown features, that does not find a match.
+    3. Set responses for the rules.
+    4. Make 2 requests to the same path.
+    5. Check that the rule with unknown features has been checked for every request.
+    """
+    known_rule = counted_rule(result=False, features=frozenset((PATH_FEATURE, )))
+    unknown_rule = counted_rule(result=False, features=None)
+
+    for rule in (known_rule, unknown_rule):
+        rule_id = core_manager.add_rule(rule=rule)
+        response = server_response_prototype.create_new(builder_implementation=b"body")
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    for _ in range(2):
+        assert managed_application_client.get(base_endpoint).status_code == 404, "Wrong status"
+
+    assert known_rule.checks == 1, "Rule with known features has not been cached"
+    assert unknown_rule.checks == 2, "Rule with unknown features has been cached"
+
+
+def test_disabled_cache(base_endpoint):
+    """Check that negative cache is disabled by default.
+
+    1. Create a manager without specifying the size of the cache.
+    2. Check statistics of the cache.
+    """
+    assert Manager(base=base_endpoint).negative_cache_info is None, "Cache is enabled"
@@ -0,0 +1,73 @@
+"""Tests for the rules with limited uses."""
+
+import threading
+
+from looseserver.server.core import UseCounter
+
+
+def test_retired_rule(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_rule_prototype,
+        server_response_prototype,
+    ):
+    """Check that a rule is removed after its last use.
+
+    1. Create a rule with 2 uses and a rule with unlimited uses.
+    2. Set responses for the rules.
+    3. Make 3 requests.
+    4. Check that the limited rule has answered the first 2 requests.
+    5. Check that the limited rule has been removed.
+    """
+    limited_rule_id = core_manager.add_rule(
+        rule=server_rule_prototype.create_new(match_implementation=True),
+        remaining_uses=2,
+        )
+    unlimited_rule_id = core_manager.add_rule(
+        rule=server_rule_prototype.create_new(match_implementation=True),
+        )
+
+    for rule_id in (limited_rule_id, unlimited_rule_id):
+        response = server_response_prototype.create_new(builder_implementation=rule_id.encode())
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    assert core_manager.get_remaining_uses(rule_id=limited_rule_id) == 2, "Wrong uses"
+    assert core_manager.get_remaining_uses(rule_id=unlimited_rule_id) is None, "Wrong uses"
+
+    bodies = [managed_application_client.get(base_endpoint).data for _ in range(3)]
+    assert bodies == [
+        limited_rule_id.encode(),
+        limited_rule_id.encode(),
+        unlimited_rule_id.encode(),
+        ], "Wrong responses"
+
+    assert core_manager.get_rules_order() == (unlimited_rule_id, ), "Rule has not been retired"
+
+
+def test_concurrent_uses():
+    """Check that uses are acquired atomically by several threads.
+
+    1. Create a counter with limited uses.
+    2. Acquire uses from several threads.
+    3. Check the number of acquired uses.
+    4. Check that the counter has been exhausted once.
+    """
+    exhausted = []
+    counter = UseCounter(uses=100, on_exhausted=lambda: exhausted.append(True))
+    acquired = []
+
+    def _acquire():
+        for _ in range(50):
+            if counter.acquire():
+                acquired.append(True)
+
+    threads = [threading.Thread(target=_acquire) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(acquired) == 100, "Wrong number of uses"
+    assert counter.remaining == 0, "Wrong number of remaining uses"
+    assert exhausted == [True], "Wrong number of notifications"
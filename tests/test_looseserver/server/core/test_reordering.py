@@ -0,0 +1,104 @@
+"""Tests for the adaptive reordering of the rules by the core manager."""
+
+import pytest
+
+import looseserver.server.core as core
+from looseserver.server.request import METHOD_FEATURE
+from looseserver.server.snapshot import RuleSnapshot
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def method_rules(core_manager, server_rule_prototype, server_response_prototype):
+    """Configured rules, that require different methods and record their checks."""
+    checked_methods = []
+
+    class _MethodRule(type(server_rule_prototype)):
+        """Rule, that requires an exact method."""
+
+        def __init__(self, method):
+            super(_MethodRule, self).__init__(match_implementation=self._check)
+            self.method = method
+
+        @staticmethod
+        def _check(rule, request):
+            checked_methods.append(rule.method)
+            return request.method == rule.method
+
+        @property
+        def index_keys(self):
+            """Exact request features required by the rule."""
+            return ((METHOD_FEATURE, self.method), )
+
+    for method in ("GET", "POST", "PUT"):
+        rule_id = core_manager.add_rule(_MethodRule(method))
+        response = server_response_prototype.create_new(builder_implementation=method.encode())
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    return checked_methods
+# pylint: enable=redefined-outer-name
+
+
+def test_background_reordering(
+        monkeypatch,
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        method_rules,
+    ):
+    """Check that rules are reordered in background by the number of their matches.
+
+    1. Configure rules, that require different methods.
+    2. Make requests, that only the last rule matches, until the reordering is started.
+    3. Wait until the reordering is finished.
+    4. Make a request.
+    5. Check the response.
+    6. Check that the last rule is checked first.
+    """
+    monkeypatch.setattr(core, "REORDER_INTERVAL", 3)
+
+    for _ in range(3):
+        assert managed_application_client.put(base_endpoint).data == b"PUT", "Wrong body"
+
+    assert core_manager.wait_reordering(timeout=5), "Rules have not been reordered"
+    del method_rules[:]
+
+    assert managed_application_client.put(base_endpoint).data == b"PUT", "Wrong body"
+    assert method_rules == ["PUT"], "Wrong order of checks"
+
+
+def test_discarded_reordering(
+        monkeypatch,
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_rule_prototype,
+        method_rules,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that reordering is discarded if rules are changed meanwhile.
+
+    1. Configure rules, that require different methods.
+    2. Make a request, that only the last rule matches.
+    3. Add a rule while the rules are reordered.
+    4. Make a request.
+    5. Check that the order of the rules has not been changed.
+    6. Check that the added rule exists.
+    """
+    assert managed_application_client.put(base_endpoint).data == b"PUT", "Wrong body"
+
+    reorder_rules = RuleSnapshot.reorder_rules
+    added_rule_ids = []
+
+    def _reorder_rules(snapshot):
+        added_rule = server_rule_prototype.create_new(match_implementation=False)
+        added_rule_ids.append(core_manager.add_rule(added_rule))
+        return reorder_rules(snapshot)
+
+    monkeypatch.setattr(RuleSnapshot, "reorder_rules", _reorder_rules)
+    core_manager.reorder_rules()
+    del method_rules[:]
+
+    assert managed_application_client.put(base_endpoint).data == b"PUT", "Wrong body"
+    assert method_rules == ["GET", "POST", "PUT"], "Wrong order of checks"
+    assert core_manager.get_rules_order()[-1] == added_rule_ids[0], "Rule has not been added"
@@ -0,0 +1,92 @@
+"""Tests for the rules with TTL."""
+
+import pytest
+
+import looseserver.server.core
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock of the core module."""
+    class _Clock:
+        """Clock with the manually set time."""
+
+        def __init__(self):
+            self.time = 0
+
+        def __call__(self):
+            return self.time
+
+    clock = _Clock()
+    monkeypatch.setattr(looseserver.server.core, "monotonic", clock)
+    return clock
+
+
+def test_expired_rule(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_rule_prototype,
+        server_response_prototype,
+        clock,
+    ):
+    # pylint: disable=too-many-arguments
+    """Check that a rule is removed when its TTL expires.
+
+    1. Create a rule with TTL and a rule without TTL.
+    2. Set responses for the rules.
+    3. Make a request before the TTL expires.
+    4. Check that the response of the rule with TTL is returned.
+    5. Make a request after the TTL expires.
+    6. Check that the response of the rule without TTL is returned.
+    7. Check that the rule with TTL has been removed.
+    """
+    temporary_rule_id = core_manager.add_rule(
+        rule=server_rule_prototype.create_new(match_implementation=True),
+        ttl=10,
+        )
+    permanent_rule_id = core_manager.add_rule(
+        rule=server_rule_prototype.create_new(match_implementation=True),
+        )
+
+    for rule_id in (temporary_rule_id, permanent_rule_id):
+        response = server_response_prototype.create_new(builder_implementation=rule_id.encode())
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    clock.time = 9
+    http_response = managed_application_client.get(base_endpoint)
+    assert http_response.data == temporary_rule_id.encode(), "Wrong response"
+
+    clock.time = 10
+    http_response = managed_application_client.get(base_endpoint)
+    assert http_response.data == permanent_rule_id.encode(), "Wrong response"
+
+    assert core_manager.get_rules_order() == (permanent_rule_id, ), "Wrong rules"
+    with pytest.raises(KeyError):
+        core_manager.get_rule(rule_id=temporary_rule_id)
+
+
+def test_expiry_order(core_manager, server_rule_prototype, clock):
+    """Check that rules expire in the order of their deadlines.
+
+    1. Create rules with different TTLs.
+    2. Remove one of the rules explicitly.
+    3. Check remaining rules at different moments.
+    """
+    rule_ids = [
+        core_manager.add_rule(rule=server_rule_prototype.create_new(), ttl=ttl)
+        for ttl in (30, 10, 20, 40)
+        ]
+    core_manager.remove_rule(rule_id=rule_ids[2])
+
+    expected_rules = [
+        (0, (rule_ids[0], rule_ids[1], rule_ids[3])),
+        (15, (rule_ids[0], rule_ids[3])),
+        (25, (rule_ids[0], rule_ids[3])),
+        (35, (rule_ids[3], )),
+        (45, ()),
+        ]
+    for time, rules in expected_rules:
+        clock.time = time
+        assert core_manager.get_rules_order() == rules, "Wrong rules at {0}".format(time)
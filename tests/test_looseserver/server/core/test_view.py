@@ -1,5 +1,9 @@
 """Tests for the view provided by the core manager."""
 
+import flask
+
+import looseserver.server.core as core
+
 
 def test_view(
         base_endpoint,
@@ -253,3 +257,130 @@ def test_exception_in_response_building(
     assert implementation_triggered, "Exceptional response was not triggered"
     assert http_response.status_code == 200, "Wrong status code"
     assert http_response.data == b"Successful response", "Wrong body"
+
+
+def test_compiled_predicates(base_endpoint, server_rule_prototype, server_response_prototype):
+    """Check that compiled rules return the first matching rule.
+
+    1. Create a manager with compiled predicates.
+    2. Create a rule, that does not find a match, and a rule, that finds a match.
+    3. Set different responses for the rules.
+    4. Make a request.
+    5. Check that response for the second rule is returned.
+    """
+    manager = core.Manager(base=base_endpoint, compile_predicates=True)
+
+    no_match_rule = server_rule_prototype.create_new(match_implementation=False)
+    no_match_rule_id = manager.add_rule(rule=no_match_rule)
+    match_rule_id = manager.add_rule(server_rule_prototype.create_new(match_implementation=True))
+
+    no_match_response = server_response_prototype.create_new(builder_implementation=b"No match")
+    manager.set_response(rule_id=no_match_rule_id, response=no_match_response)
+
+    match_response = server_response_prototype.create_new(builder_implementation=b"Match")
+    manager.set_response(rule_id=match_rule_id, response=match_response)
+
+    application = flask.Flask("TestApplication")
+    with application.test_request_context(base_endpoint):
+        assert manager.view() == b"Match", "Wrong response"
+
+
+def test_change_during_dispatch(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_rule_prototype,
+        server_response_prototype,
+    ):
+    """Check that rules changed during dispatch don't affect the request.
+
+    1. Create a rule, that removes itself and adds new rules while looking for a match.
+    2. Create a rule, that finds a match, and set a response for it.
+    3. Make a request.
+    4. Check that the response of the second rule is returned.
+    """
+    rule_ids = []
+
+    def _changing_implementation(*args, **kwargs):
+        # pylint: disable=unused-argument
+        core_manager.remove_rule(rule_id=rule_ids[0])
+        for _ in range(10):
+            core_manager.add_rule(server_rule_prototype.create_new(match_implementation=False))
+        return False
+
+    changing_rule = server_rule_prototype.create_new(match_implementation=_changing_implementation)
+    rule_ids.append(core_manager.add_rule(rule=changing_rule))
+    match_rule = server_rule_prototype.create_new(match_implementation=True)
+    match_rule_id = core_manager.add_rule(rule=match_rule)
+
+    for rule_id in (rule_ids[0], match_rule_id):
+        response = server_response_prototype.create_new(builder_implementation=b"Match")
+        core_manager.set_response(rule_id=rule_id, response=response)
+
+    http_response = managed_application_client.get(base_endpoint)
+    assert http_response.status_code == 200, "Wrong status code"
+    assert http_response.data == b"Match", "Wrong body"
+
+
+def test_shadowed_rule(
+        base_endpoint,
+        core_manager,
+        managed_application_client,
+        server_rule_prototype,
+        server_response_prototype,
+    ):
+    """Check that shadowed rules are checked only if the shadowing response fails.
+
+    1. Create 2 rules with the same predicate, that count their checks.
+    2. Set responses for the rules.
+    3. Make a request.
+    4. Check that the second rule has not been checked.
+    5. Set a failing response for the first rule.
+    6. Make a request.
+    7. Check that the response of the second rule is returned.
+    """
+    checked_rules = []
+
+    class _KeyedRule(type(server_rule_prototype)):
+        """Rule with a predicate key."""
+
+        def __init__(self, name):
+            super(_KeyedRule, self).__init__(match_implementation=self._check)
+            self.name = name
+
+        @staticmethod
+        def _check(rule, request):
+            # pylint: disable=unused-argument
+            checked_rules.append(rule.name)
+            return True
+
+        @property
+        def predicate_key(self):
+            """Key of the predicate."""
+            return "key"
+
+    first_rule_id = core_manager.add_rule(rule=_KeyedRule(name="first"))
+    second_rule_id = core_manager.add_rule(rule=_KeyedRule(name="second"))
+
+    first_response = server_response_prototype.create_new(builder_implementation=b"first")
+    core_manager.set_response(rule_id=first_rule_id, response=first_response)
+    second_response = server_response_prototype.create_new(builder_implementation=b"second")
+    core_manager.set_response(rule_id=second_rule_id, response=second_response)
+
+    assert core_manager.get_shadowed_rules() == {second_rule_id: first_rule_id}, (
+        "Wrong shadowed rules"
+        )
+
+    assert managed_application_client.get(base_endpoint).data == b"first", "Wrong body"
+    assert checked_rules == ["first"], "Shadowed rule has been checked"
+
+    def _failing_implementation(*args, **kwargs):
+        # pylint: disable=unused-argument
+        raise NotImplementedError()
+
+    failing_response = server_response_prototype.create_new(
+        builder_implementation=_failing_implementation,
+        )
+    core_manager.set_response(rule_id=first_rule_id, response=failing_response)
+
+    assert managed_application_client.get(base_endpoint).data == b"second", "Wrong body"
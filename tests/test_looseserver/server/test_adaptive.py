@@ -0,0 +1,94 @@
+"""Test cases for the adaptive reordering of the rules."""
+
+import pytest
+
+from looseserver.server.adaptive import HitCounter, find_disjoint_runs, rank_rules
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def exact_rule_prototype(server_rule_prototype):
+    """Factory of rules, that require exact values of request features."""
+    class ExactRule(type(server_rule_prototype)):
+        """Rule with index keys."""
+
+        def __init__(self, **values):
+            super(ExactRule, self).__init__()
+            self._values = values
+
+        @property
+        def index_keys(self):
+            """Exact request features required by the rule."""
+            return tuple(sorted(self._values.items()))
+
+    return ExactRule
+
+
+def test_disjoint_runs(server_rule_prototype, exact_rule_prototype):
+    """Check that rules are split into runs of disjoint rules.
+
+    1. Create rules with different exact values of request features.
+    2. Find disjoint runs.
+    3. Check the runs.
+    """
+    rules = [
+        ("get-a", exact_rule_prototype(method="GET", path="/a")),
+        ("post-a", exact_rule_prototype(method="POST", path="/a")),
+        ("put-b", exact_rule_prototype(method="PUT", path="/b")),
+        ("get-b", exact_rule_prototype(method="GET", path="/b")),
+        ("unknown", server_rule_prototype.create_new()),
+        ("get", exact_rule_prototype(method="GET")),
+        ("post", exact_rule_prototype(method="POST")),
+        ("post-c", exact_rule_prototype(method="POST", path="/c")),
+        ]
+
+    assert find_disjoint_runs(rules) == [
+        ["get-a", "post-a", "put-b"],
+        ["get-b"],
+        ["unknown"],
+        ["get", "post"],
+        ["post-c"],
+        ], "Wrong runs"
+
+
+def test_rank_rules():
+    """Check that rules with more matches are ranked first within their runs.
+
+    1. Rank several runs of rules with different counts of matches.
+    2. Check the order of the rules by their ranks.
+    3. Check that the rule of a single rule run is not ranked.
+    """
+    runs = [["first", "second", "third"], ["single"], ["fourth", "fifth"]]
+    positions = {rule_id: position for position, rule_id in enumerate(sum(runs, []))}
+    hit_counts = {"second": 2, "third": 5, "single": 3, "fourth": 1, "fifth": 1}
+
+    ranks = rank_rules(runs=runs, positions=positions, hit_counts=hit_counts)
+    assert sorted(ranks, key=ranks.__getitem__) == [
+        "third",
+        "second",
+        "first",
+        "fourth",
+        "fifth",
+        ], "Wrong order"
+    assert "single" not in ranks, "Single rule is ranked"
+
+
+def test_hit_counter():
+    """Check that collected counts are halved and removed rules are discarded.
+
+    1. Count matches of several rules.
+    2. Collect counts of some of the rules.
+    3. Check the counts.
+    4. Collect counts again.
+    5. Check that the counts have been halved.
+    """
+    counter = HitCounter()
+    for rule_id in ("first", "first", "first", "second", "removed"):
+        counter.add(rule_id)
+
+    assert counter.collect(["first", "second"]) == {"first": 3, "second": 1}, "Wrong counts"
+    assert counter.collect(["first", "second", "removed"]) == {
+        "first": 1,
+        "second": 0,
+        "removed": 0,
+        }, "Wrong counts"
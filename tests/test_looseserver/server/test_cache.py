@@ -0,0 +1,74 @@
+"""Test cases for the caches of the dispatch results."""
+
+import pytest
+
+from looseserver.server.cache import LRUCache, CacheInfo
+
+
+def test_get_and_set():
+    """Check that cached values can be obtained.
+
+    1. Create a cache.
+    2. Get a value for a missing key.
+    3. Cache a value.
+    4. Get the cached value.
+    5. Check statistics of the cache.
+    """
+    cache = LRUCache(maxsize=2)
+    assert cache.get(version=1, key="key", default="default") == "default", "Wrong value"
+
+    cache.set(version=1, key="key", value="value")
+    assert cache.get(version=1, key="key") == "value", "Wrong value"
+
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=1), "Wrong statistics"
+
+
+def test_eviction():
+    """Check that the least recently used item is discarded.
+
+    1. Create a cache of size 2.
+    2. Cache 2 values.
+    3. Get the first value.
+    4. Cache the third value.
+    5. Check that the second value has been discarded.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.get(version=1, key="first")
+    cache.set(version=1, key="first", value=1)
+    cache.set(version=1, key="second", value=2)
+    cache.get(version=1, key="first")
+    cache.set(version=1, key="third", value=3)
+
+    assert cache.get(version=1, key="first") == 1, "Recently used item has been discarded"
+    assert cache.get(version=1, key="second") is None, "Least recently used item is cached"
+    assert cache.get(version=1, key="third") == 3, "New item has not been cached"
+
+
+def test_version():
+    """Check that cache is cleared when the version is changed.
+
+    1. Create a cache.
+    2. Cache a value.
+    3. Get the value for a new version.
+    4. Check that the value is missing.
+    5. Try to cache a value for an outdated version.
+    6. Check that the value is not cached.
+    """
+    cache = LRUCache(maxsize=2)
+    cache.get(version=1, key="key")
+    cache.set(version=1, key="key", value="value")
+
+    assert cache.get(version=2, key="key") is None, "Outdated value has been returned"
+
+    cache.set(version=1, key="key", value="value")
+    assert cache.get(version=2, key="key") is None, "Value of outdated version has been cached"
+
+
+def test_wrong_size():
+    """Check that size of the cache must be positive.
+
+    1. Try to create a cache with zero size.
+    2. Check that ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
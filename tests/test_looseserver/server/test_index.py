@@ -0,0 +1,320 @@
+"""Test cases for the index of the rules."""
+
+from collections import namedtuple
+
+import pytest
+
+from looseserver.server.index import RuleIndex, PrefixTree
+from looseserver.server.request import (
+    RequestView,
+    PATH_FEATURE,
+    HOST_FEATURE,
+    get_header_feature,
+    )
+
+
+_Request = namedtuple("_Request", "base_url")
+_HeaderRequest = namedtuple("_HeaderRequest", "base_url headers")
+_HostRequest = namedtuple("_HostRequest", "base_url host_url")
+
+
+def _create_view(base_url):
+    """Create view of the request for the url."""
+    return RequestView(_Request(base_url=base_url))
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def path_rule_prototype(server_rule_prototype):
+    """Rule prototype, that requires an exact path."""
+    class PathRule(type(server_rule_prototype)):
+        """Rule, that can be indexed by path."""
+
+        def __init__(self, path):
+            super(PathRule, self).__init__(match_implementation=True)
+            self.path = path
+
+        @property
+        def index_keys(self):
+            """Exact request features required by the rule."""
+            return ((PATH_FEATURE, self.path), )
+
+    return PathRule
+
+
+@pytest.fixture
+def prefix_rule_prototype(server_rule_prototype):
+    """Rule prototype, that requires a prefix of the path."""
+    class PrefixRule(type(server_rule_prototype)):
+        """Rule, that can be indexed by path prefix."""
+
+        def __init__(self, prefix):
+            super(PrefixRule, self).__init__(match_implementation=True)
+            self.prefix = prefix
+
+        @property
+        def prefix_keys(self):
+            """Prefixes of request features required by the rule."""
+            return ((PATH_FEATURE, self.prefix), )
+
+    return PrefixRule
+
+
+def test_unindexed_rules(server_rule_prototype):
+    """Check that rules without index keys are candidates for every request.
+
+    1. Create an index.
+    2. Add several rules without index keys.
+    3. Find candidates for a request.
+    4. Check that all rules are returned in the order of addition.
+    """
+    index = RuleIndex()
+    rule_ids = ["first", "second", "third"]
+    for position, rule_id in enumerate(rule_ids):
+        index.add_rule(rule_id=rule_id, rule=server_rule_prototype.create_new(), position=position)
+
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/path"))
+    assert [rule_id for rule_id, _ in candidates] == rule_ids, "Wrong candidates"
+
+
+def test_path_candidates(server_rule_prototype, path_rule_prototype):
+    """Check that only rules for the requested path and unindexed rules are candidates.
+
+    1. Create an index.
+    2. Add rules for different paths and a rule without index keys.
+    3. Find candidates for a request.
+    4. Check the candidates and their order.
+    """
+    index = RuleIndex()
+    index.add_rule(rule_id="first", rule=path_rule_prototype(path="/first"), position=0)
+    index.add_rule(rule_id="unindexed", rule=server_rule_prototype.create_new(), position=1)
+    index.add_rule(rule_id="second", rule=path_rule_prototype(path="/second"), position=2)
+    index.add_rule(rule_id="another-first", rule=path_rule_prototype(path="/first"), position=3)
+
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/first"))
+    assert [rule_id for rule_id, _ in candidates] == ["first", "unindexed", "another-first"], (
+        "Wrong candidates"
+        )
+
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/unknown"))
+    assert [rule_id for rule_id, _ in candidates] == ["unindexed"], "Wrong candidates"
+
+
+def test_addition_order(server_rule_prototype, path_rule_prototype):
+    """Check that candidates are ordered by positions regardless of the order of addition.
+
+    1. Create an index.
+    2. Add rules with decreasing positions.
+    3. Find candidates for a request.
+    4. Check that candidates are ordered by positions.
+    """
+    index = RuleIndex()
+    index.add_rule(rule_id="path-2", rule=path_rule_prototype(path="/path"), position=3)
+    index.add_rule(rule_id="unindexed-2", rule=server_rule_prototype.create_new(), position=2)
+    index.add_rule(rule_id="path-1", rule=path_rule_prototype(path="/path"), position=1)
+    index.add_rule(rule_id="unindexed-1", rule=server_rule_prototype.create_new(), position=0)
+
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/path"))
+    assert [rule_id for rule_id, _ in candidates] == [
+        "unindexed-1",
+        "path-1",
+        "unindexed-2",
+        "path-2",
+        ], "Wrong candidates"
+
+
+def test_remove_rule(server_rule_prototype, path_rule_prototype):
+    """Check that removed rules are not candidates.
+
+    1. Create an index.
+    2. Add a rule for a path and a rule without index keys.
+    3. Remove both rules.
+    4. Check that there are no candidates for the request.
+    """
+    index = RuleIndex()
+    index.add_rule(rule_id="path", rule=path_rule_prototype(path="/path"), position=0)
+    index.add_rule(rule_id="unindexed", rule=server_rule_prototype.create_new(), position=1)
+
+    index.remove_rule(rule_id="path")
+    index.remove_rule(rule_id="unindexed")
+    index.remove_rule(rule_id="non-existent")
+
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/path"))
+    assert not list(candidates), "Removed rules are candidates"
+
+
+def test_prefix_candidates(server_rule_prototype, path_rule_prototype, prefix_rule_prototype):
+    """Check that rules for all prefixes of the requested path are candidates.
+
+    1. Create an index.
+    2. Add rules for different prefixes, a rule for exact path and a rule without index keys.
+    3. Find candidates for a request.
+    4. Check the candidates and their order.
+    """
+    index = RuleIndex()
+    index.add_rule(rule_id="users", rule=prefix_rule_prototype(prefix="/users/"), position=0)
+    index.add_rule(rule_id="orders", rule=prefix_rule_prototype(prefix="/orders/"), position=1)
+    index.add_rule(rule_id="user", rule=prefix_rule_prototype(prefix="/users/1"), position=2)
+    index.add_rule(rule_id="unindexed", rule=server_rule_prototype.create_new(), position=3)
+    index.add_rule(rule_id="path", rule=path_rule_prototype(path="/users/1/orders"), position=4)
+    index.add_rule(rule_id="root", rule=prefix_rule_prototype(prefix="/"), position=5)
+    index.add_rule(rule_id="long", rule=prefix_rule_prototype(prefix="/users/1/x"), position=6)
+
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/users/1/orders"))
+    assert [rule_id for rule_id, _ in candidates] == [
+        "users",
+        "user",
+        "unindexed",
+        "path",
+        "root",
+        ], "Wrong candidates"
+
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/users"))
+    assert [rule_id for rule_id, _ in candidates] == ["unindexed", "root"], "Wrong candidates"
+
+
+def test_remove_prefix_rule(prefix_rule_prototype):
+    """Check that removed prefix rules are not candidates.
+
+    1. Create an index.
+    2. Add rules for nested prefixes.
+    3. Remove the rule for the shorter prefix.
+    4. Check that only the rule for the longer prefix is a candidate.
+    5. Remove the rule for the longer prefix.
+    6. Check that there are no candidates.
+    """
+    index = RuleIndex()
+    index.add_rule(rule_id="short", rule=prefix_rule_prototype(prefix="/path/"), position=0)
+    index.add_rule(rule_id="long", rule=prefix_rule_prototype(prefix="/path/long"), position=1)
+
+    index.remove_rule(rule_id="short")
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/path/long"))
+    assert [rule_id for rule_id, _ in candidates] == ["long"], "Wrong candidates"
+
+    index.remove_rule(rule_id="long")
+    candidates = index.find_candidates(_create_view(base_url="http://localhost/path/long"))
+    assert not list(candidates), "Removed rules are candidates"
+
+
+def test_header_candidates(server_rule_prototype, path_rule_prototype):
+    """Check that rules, that require exact headers, are found by the values of the headers.
+
+    1. Create an index.
+    2. Add rules for different values of a header, a path rule and an unindexed rule.
+    3. Find candidates for requests with different values of the header.
+    4. Check the candidates and their order.
+    5. Remove a rule and check the candidates again.
+    """
+    class _HeaderRule(type(server_rule_prototype)):
+        """Rule, that can be indexed by header."""
+
+        def __init__(self, value):
+            super(_HeaderRule, self).__init__(match_implementation=True)
+            self.value = value
+
+        @property
+        def index_keys(self):
+            """Exact request features required by the rule."""
+            return ((get_header_feature("X-Tenant"), self.value), )
+
+    index = RuleIndex()
+    index.add_rule(rule_id="first", rule=_HeaderRule(value="first"), position=0)
+    index.add_rule(rule_id="path", rule=path_rule_prototype(path="/path"), position=1)
+    index.add_rule(rule_id="unindexed", rule=server_rule_prototype.create_new(), position=2)
+    index.add_rule(rule_id="second", rule=_HeaderRule(value="second"), position=3)
+    index.add_rule(rule_id="another-first", rule=_HeaderRule(value="first"), position=4)
+
+    def _find_candidates(headers):
+        request = _HeaderRequest(base_url="http://localhost/path", headers=headers)
+        return [rule_id for rule_id, _ in index.find_candidates(RequestView(request))]
+
+    assert _find_candidates({"x-tenant": "first"}) == [
+        "first",
+        "path",
+        "unindexed",
+        "another-first",
+        ], "Wrong candidates"
+    assert _find_candidates({"X-Tenant": "second"}) == ["path", "unindexed", "second"], (
+        "Wrong candidates"
+        )
+    assert _find_candidates({}) == ["path", "unindexed"], "Wrong candidates"
+
+    index.remove_rule(rule_id="first")
+    assert _find_candidates({"X-TENANT": "first"}) == ["path", "unindexed", "another-first"], (
+        "Wrong candidates"
+        )
+
+
+def test_host_partitions(server_rule_prototype, path_rule_prototype):
+    """Check that rules, that require exact hosts, are found in the partitions of the hosts.
+
+    1. Create an index.
+    2. Add rules for the same path on different hosts, a path rule and an unindexed rule.
+    3. Copy the index and remove a rule of a host from the copy.
+    4. Find candidates for requests to different hosts in both indexes.
+    5. Check the candidates and their order.
+    """
+    class _HostRule(type(server_rule_prototype)):
+        """Rule, that can be partitioned by host."""
+
+        def __init__(self, host):
+            super(_HostRule, self).__init__(match_implementation=True)
+            self.host = host
+
+        @property
+        def index_keys(self):
+            """Exact request features required by the rule."""
+            return ((HOST_FEATURE, self.host), (PATH_FEATURE, "/path"))
+
+    index = RuleIndex()
+    index.add_rule(rule_id="first", rule=_HostRule(host="first.test"), position=0)
+    index.add_rule(rule_id="path", rule=path_rule_prototype(path="/path"), position=1)
+    index.add_rule(rule_id="unindexed", rule=server_rule_prototype.create_new(), position=2)
+    index.add_rule(rule_id="second", rule=_HostRule(host="second.test"), position=3)
+    index.add_rule(rule_id="another-first", rule=_HostRule(host="first.test"), position=4)
+
+    changed_index = index.copy()
+    changed_index.remove_rule(rule_id="first")
+
+    def _find_candidates(rule_index, host_url):
+        request = _HostRequest(base_url="http://localhost/path", host_url=host_url)
+        return [rule_id for rule_id, _ in rule_index.find_candidates(RequestView(request))]
+
+    assert _find_candidates(index, "http://FIRST.test:8080/") == [
+        "first",
+        "path",
+        "unindexed",
+        "another-first",
+        ], "Wrong candidates"
+    assert _find_candidates(index, "http://second.test/") == ["path", "unindexed", "second"], (
+        "Wrong candidates"
+        )
+    assert _find_candidates(index, "http://localhost/") == ["path", "unindexed"], (
+        "Wrong candidates"
+        )
+    assert _find_candidates(changed_index, "http://first.test/") == [
+        "path",
+        "unindexed",
+        "another-first",
+        ], "Wrong candidates of the changed copy"
+
+
+def test_prefix_tree_persistence():
+    """Check that changes of the prefix tree do not affect its previous versions.
+
+    1. Create a tree with an item.
+    2. Add an item, that splits the node of the first one.
+    3. Remove the first item from the new tree.
+    4. Check items found in every version of the tree.
+    """
+    first_tree = PrefixTree().add(prefix="/abc", position=0, item="abc")
+    second_tree = first_tree.add(prefix="/abd", position=1, item="abd")
+    third_tree = second_tree.remove(prefix="/abc", position=0)
+
+    assert first_tree.find("/abd") == [], "First tree has been changed"
+    assert first_tree.find("/abcd") == [((0, "abc"), )], "Wrong items in the first tree"
+    assert second_tree.find("/abcd") == [((0, "abc"), )], "Wrong items in the second tree"
+    assert second_tree.find("/abd") == [((1, "abd"), )], "Wrong items in the second tree"
+    assert third_tree.find("/abcd") == [], "Removed item is found"
+    assert third_tree.find("/abd") == [((1, "abd"), )], "Wrong items in the third tree"
+    assert not third_tree.remove(prefix="/abd", position=1), "Tree is not empty"
@@ -0,0 +1,67 @@
+"""Test cases for the mappings, that are cheap to copy."""
+
+import pytest
+
+from looseserver.server.mapping import CopyOnWriteDict
+
+
+def test_dictionary_interface():
+    """Check that the mapping behaves like a dictionary.
+
+    1. Create a mapping and a dictionary with the same items.
+    2. Set, replace and delete items in both of them.
+    3. Check that the mapping has the same items as the dictionary.
+    4. Try to delete a missing item.
+    5. Check that KeyError is raised.
+    """
+    items = [(index, str(index)) for index in range(100)]
+    mapping = CopyOnWriteDict(items)
+    expected = dict(items)
+
+    for index in range(50, 150):
+        mapping[index] = -index
+        expected[index] = -index
+
+    for index in range(0, 100, 3):
+        del mapping[index]
+        del expected[index]
+
+    assert len(mapping) == len(expected), "Wrong length"
+    assert dict(mapping.items()) == expected, "Wrong items"
+    assert mapping.get(0) is None, "Deleted item is found"
+    assert 1 in mapping, "Existing item is not found"
+    assert mapping.pop(1) == "1", "Wrong popped value"
+
+    with pytest.raises(KeyError):
+        del mapping[0]
+
+
+def test_independent_copies():
+    """Check that the copies of the mapping can be changed independently.
+
+    1. Create a mapping with enough items to be sharded.
+    2. Copy the mapping.
+    3. Change the original and the copy.
+    4. Check that the changes are applied only to the changed mapping.
+    """
+    original = CopyOnWriteDict((index, index) for index in range(1000))
+    copy = original.copy()
+
+    original[0] = "original"
+    del original[1]
+    copy[0] = "copy"
+    copy[1000] = "new"
+
+    assert original[0] == "original", "Change of the original is lost"
+    assert 1 not in original, "Item is not deleted from the original"
+    assert 1000 not in original, "Item of the copy is added to the original"
+    assert len(original) == 999, "Wrong length of the original"
+
+    assert copy[0] == "copy", "Change of the copy is lost"
+    assert copy[1] == 1, "Item is deleted from the copy"
+    assert copy[1000] == "new", "Item is not added to the copy"
+    assert len(copy) == 1001, "Wrong length of the copy"
+
+    second_copy = copy.copy()
+    second_copy[0] = "second copy"
+    assert copy[0] == "copy", "Change of the second copy is applied to the first one"
@@ -0,0 +1,89 @@
+"""Test cases for the combined patterns of regular expressions."""
+
+import re
+
+import pytest
+
+from looseserver.server.pattern import (
+    CombinedPattern,
+    PatternCompiler,
+    get_regex_key,
+    is_combinable,
+    )
+
+
+@pytest.mark.parametrize(
+    argnames="pattern,combinable",
+    argvalues=[
+        (r"/users/\d+", True),
+        (r"/(?:users|orders)/[^/]+", True),
+        (r"/(?i:users)", True),
+        (r"/(users)/\1", False),
+        (r"/(?P<name>users)", False),
+        (r"(?i)/users", False),
+        ],
+    ids=[
+        "Simple",
+        "Non-capturing group",
+        "Scoped flags",
+        "Backreference",
+        "Named group",
+        "Global flags",
+        ],
+    )
+def test_is_combinable(pattern, combinable):
+    """Check which regular expressions can be combined.
+
+    1. Compile a regular expression.
+    2. Check if it can be combined.
+    """
+    assert is_combinable(re.compile(pattern)) == combinable, "Wrong result"
+
+
+def test_combined_match():
+    """Check that the combined pattern reports all fully matching expressions.
+
+    1. Create a combined pattern from several expressions.
+    2. Match strings.
+    3. Check the keys of the matching expressions.
+    """
+    users = re.compile(r"/users/\d+")
+    any_path = re.compile(r"/.*")
+    prefix = re.compile(r"/users")
+    alternatives = re.compile(r"/users/1|/users/1\d")
+    pattern = CombinedPattern([users, any_path, prefix, alternatives, users])
+
+    assert pattern.covers(users), "Expression is not covered"
+    assert not pattern.covers(re.compile("/other")), "Unknown expression is covered"
+
+    assert pattern.match("/users/12") == frozenset(
+        get_regex_key(regex) for regex in (users, any_path, alternatives)
+        ), "Wrong matches"
+    assert pattern.match("/users") == frozenset(
+        get_regex_key(regex) for regex in (any_path, prefix)
+        ), "Wrong matches"
+    assert pattern.match("orders") == frozenset(), "Wrong matches"
+
+
+def test_compiler():
+    """Check that patterns are built in background.
+
+    1. Create a compiler.
+    2. Request patterns.
+    3. Check that patterns are not ready.
+    4. Wait for the compilation.
+    5. Request patterns again.
+    6. Check that only combinable expressions are covered.
+    """
+    compiler = PatternCompiler()
+    combinable = re.compile("/path")
+    separate = re.compile("(?i)/path")
+    regexes = (("path", combinable), ("path", separate))
+    key = object()
+
+    assert compiler.get_patterns(key=key, regexes=regexes) is None, "Patterns are ready"
+    assert compiler.wait(timeout=5), "Patterns have not been built"
+
+    patterns = compiler.get_patterns(key=key, regexes=regexes)
+    assert patterns["path"].covers(combinable), "Expression is not covered"
+    assert not patterns["path"].covers(separate), "Expression with flags is covered"
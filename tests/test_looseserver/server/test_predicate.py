@@ -0,0 +1,144 @@
+"""Test cases for the graph of shared predicates."""
+
+import pytest
+
+from looseserver.server.predicate import PredicateGraph
+from looseserver.server.request import RequestView
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def keyed_rule_prototype(server_rule_prototype):
+    """Factory of rules with predicate keys and conjuncts."""
+    class KeyedRule(type(server_rule_prototype)):
+        """Rule with predicate key and conjuncts."""
+
+        def __init__(self, predicate_key=None, conjuncts=None, match_implementation=None):
+            super(KeyedRule, self).__init__(match_implementation=match_implementation)
+            self._predicate_key = predicate_key
+            self._conjuncts = conjuncts
+
+        @property
+        def predicate_key(self):
+            """Key of the predicate."""
+            return self._predicate_key
+
+        @property
+        def conjuncts(self):
+            """Conjuncts of the rule."""
+            return self._conjuncts
+
+    return KeyedRule
+
+
+@pytest.fixture
+def counted_leaf(keyed_rule_prototype):
+    """Factory of leaf rules counting their checks."""
+    def _counted_leaf(predicate_key, result, checks):
+        def _match_implementation(*args, **kwargs):
+            # pylint: disable=unused-argument
+            checks.append(predicate_key)
+            return result
+
+        return keyed_rule_prototype(
+            predicate_key=predicate_key,
+            match_implementation=_match_implementation,
+            )
+
+    return _counted_leaf
+# pylint: enable=redefined-outer-name
+
+
+def test_shared_predicate(keyed_rule_prototype, counted_leaf):
+    """Check that identical predicates of different rules are checked once.
+
+    1. Compile 2 conjunctions with an identical predicate and different predicates.
+    2. Check both rules for the same request.
+    3. Check results.
+    4. Check that the identical predicate has been checked once.
+    """
+    checks = []
+    graph = PredicateGraph()
+
+    first_rule = keyed_rule_prototype(conjuncts=(
+        counted_leaf(predicate_key="GET", result=True, checks=checks),
+        counted_leaf(predicate_key="first", result=False, checks=checks),
+        ))
+    second_rule = keyed_rule_prototype(conjuncts=(
+        counted_leaf(predicate_key="GET", result=True, checks=checks),
+        counted_leaf(predicate_key="second", result=True, checks=checks),
+        ))
+    graph.add_rule(rule_id="first", rule=first_rule)
+    graph.add_rule(rule_id="second", rule=second_rule)
+
+    request_view = RequestView(request=None)
+    results = {}
+    assert not graph.is_match_found(rule_id="first", request_view=request_view, results=results), (
+        "Wrong result for the first rule"
+        )
+    assert graph.is_match_found(rule_id="second", request_view=request_view, results=results), (
+        "Wrong result for the second rule"
+        )
+    assert checks == ["GET", "first", "second"], "Wrong checks"
+
+
+def test_remove_rule(keyed_rule_prototype, counted_leaf):
+    """Check that shared predicates are kept while they are used.
+
+    1. Compile 2 rules with an identical predicate.
+    2. Remove the first rule.
+    3. Check the second rule.
+    4. Remove the second rule.
+    5. Check that the graph is empty.
+    """
+    checks = []
+    graph = PredicateGraph()
+
+    graph.add_rule(
+        rule_id="first",
+        rule=keyed_rule_prototype(conjuncts=(
+            counted_leaf(predicate_key="GET", result=True, checks=checks),
+            )),
+        )
+    graph.add_rule(rule_id="second", rule=counted_leaf(predicate_key="GET", result=True, checks=[]))
+
+    graph.remove_rule(rule_id="first")
+    request_view = RequestView(request=None)
+    assert graph.is_match_found(rule_id="second", request_view=request_view, results={}), (
+        "Wrong result"
+        )
+    assert checks == ["GET"], "Shared predicate has been removed"
+
+    graph.remove_rule(rule_id="second")
+    assert not graph._nodes, "Graph is not empty"   # pylint: disable=protected-access
+
+
+def test_exception_in_predicate(keyed_rule_prototype):
+    """Check that exception of a shared predicate is reraised for every rule.
+
+    1. Compile 2 rules with an identical predicate, raising an exception.
+    2. Check both rules.
+    3. Check that exception is raised for both rules, but predicate is checked once.
+    """
+    checks = []
+
+    def _exceptional_implementation(*args, **kwargs):
+        # pylint: disable=unused-argument
+        checks.append(None)
+        raise NotImplementedError()
+
+    graph = PredicateGraph()
+    for rule_id in ("first", "second"):
+        rule = keyed_rule_prototype(
+            predicate_key="exceptional",
+            match_implementation=_exceptional_implementation,
+            )
+        graph.add_rule(rule_id=rule_id, rule=rule)
+
+    request_view = RequestView(request=None)
+    results = {}
+    for rule_id in ("first", "second"):
+        with pytest.raises(NotImplementedError):
+            graph.is_match_found(rule_id=rule_id, request_view=request_view, results=results)
+
+    assert len(checks) == 1, "Predicate has been checked several times"
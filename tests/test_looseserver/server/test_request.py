@@ -0,0 +1,213 @@
+"""Test cases for the view of the request."""
+
+import hashlib
+import re
+
+import flask
+import pytest
+
+import looseserver.server.request as request_module
+from looseserver.server.request import (
+    RequestView,
+    PATH_FEATURE,
+    METHOD_FEATURE,
+    BODY_DIGEST_FEATURE,
+    INVALID_JSON,
+    get_header_feature,
+    get_query_feature,
+    )
+from looseserver.server.pattern import CombinedPattern
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def application():
+    """Flask application to create request contexts."""
+    return flask.Flask("TestApplication")
+# pylint: enable=redefined-outer-name
+
+
+def test_attributes(application):
+    """Check attributes of the request view.
+
+    1. Create a request context.
+    2. Create a view of the request.
+    3. Check path, method, headers, query and body.
+    """
+    with application.test_request_context(
+            "/routes/test?key=value",
+            method="POST",
+            headers={"X-Header": "Value"},
+            data=b"body",
+        ):
+        request_view = RequestView(flask.request)
+
+        current_request = flask.request._get_current_object()   # pylint: disable=protected-access
+        assert request_view.request is current_request, "Wrong request"
+        assert request_view.path == "/routes/test", "Wrong path"
+        assert request_view.method == "POST", "Wrong method"
+        assert request_view.headers["x-header"] == "Value", "Wrong headers"
+        assert request_view.query["key"] == "value", "Wrong query"
+        assert request_view.body == b"body", "Wrong body"
+
+
+def test_lazy_attribute(application, monkeypatch):
+    """Check that attributes are computed once.
+
+    1. Create a request context.
+    2. Create a view of the request.
+    3. Get path several times.
+    4. Check that url has been parsed once.
+    """
+    calls = []
+    original_urlparse = request_module.urlparse
+
+    def _patched_urlparse(url):
+        calls.append(url)
+        return original_urlparse(url)
+
+    monkeypatch.setattr(request_module, "urlparse", _patched_urlparse)
+
+    with application.test_request_context("/path"):
+        request_view = RequestView(flask.request)
+        for _ in range(3):
+            assert request_view.path == "/path", "Wrong path"
+
+    assert len(calls) == 1, "Url has been parsed several times"
+
+
+def test_get_feature(application):
+    """Check that request features can be obtained by their names.
+
+    1. Create a request context.
+    2. Create a view of the request.
+    3. Check path and method features.
+    4. Check that KeyError is raised for an unknown feature.
+    """
+    with application.test_request_context("/path", method="PUT"):
+        request_view = RequestView(flask.request)
+        assert request_view.get_feature(PATH_FEATURE) == "/path", "Wrong path"
+        assert request_view.get_feature(METHOD_FEATURE) == "PUT", "Wrong method"
+
+        with pytest.raises(KeyError):
+            request_view.get_feature("unknown")
+
+
+def test_header_and_query_features(application):
+    """Check features of the headers and query parameters.
+
+    1. Create a request context with headers and a repeated query parameter.
+    2. Create a view of the request.
+    3. Check header features.
+    4. Check query features.
+    """
+    with application.test_request_context("/path?key=first&key=second", headers={"X-Key": "1"}):
+        request_view = RequestView(flask.request)
+        assert request_view.get_feature(get_header_feature("x-KEY")) == "1", "Wrong header"
+        assert request_view.get_feature(get_header_feature("missing")) is None, "Wrong header"
+        assert request_view.get_feature(get_query_feature("key")) == "first", "Wrong parameter"
+        assert request_view.get_feature(get_query_feature("Key")) is None, "Wrong parameter"
+
+
+@pytest.mark.parametrize(
+    argnames="body,expected_json",
+    argvalues=[
+        (b'{"key": [1, null]}', {"key": [1, None]}),
+        (b"null", None),
+        (b"{", INVALID_JSON),
+        (b"\xff", INVALID_JSON),
+        ],
+    ids=["Object", "Null", "Invalid JSON", "Invalid encoding"],
+    )
+def test_json_body(application, monkeypatch, body, expected_json):
+    """Check that JSON body is parsed once.
+
+    1. Create a request context with the body.
+    2. Create a view of the request.
+    3. Get JSON body several times.
+    4. Check the parsed body.
+    5. Check that body has been parsed once.
+    """
+    calls = []
+    original_loads = request_module.json.loads
+
+    def _patched_loads(document):
+        calls.append(document)
+        return original_loads(document)
+
+    monkeypatch.setattr(request_module.json, "loads", _patched_loads)
+
+    with application.test_request_context("/path", method="POST", data=body):
+        request_view = RequestView(flask.request)
+        for _ in range(3):
+            if expected_json is INVALID_JSON:
+                assert request_view.json_body is INVALID_JSON, "Wrong JSON"
+            else:
+                assert request_view.json_body == expected_json, "Wrong JSON"
+
+    assert len(calls) <= 1, "Body has been parsed several times"
+
+
+def test_body_digest(application):
+    """Check the digest of the request body.
+
+    1. Create a request context with a body.
+    2. Create a view of the request.
+    3. Check the digest of the body.
+    """
+    with application.test_request_context("/path", method="POST", data=b"body"):
+        request_view = RequestView(flask.request)
+        expected_digest = hashlib.sha256(b"body").hexdigest()
+        assert request_view.body_digest == expected_digest, "Wrong digest"
+        assert request_view.get_feature(BODY_DIGEST_FEATURE) == expected_digest, "Wrong feature"
+
+
+def test_select_for(server_rule_prototype):
+    """Check that rules receive the representation of the request, they use.
+
+    1. Create a view of the request.
+    2. Check that the raw request is selected for a rule, that doesn't use the view.
+    3. Check that the view is selected for a rule, that uses the view.
+    """
+    request = object()
+    request_view = RequestView(request)
+    assert request_view.select_for(server_rule_prototype) is request, "Wrong request"
+
+    server_rule_prototype.uses_request_view = True
+    assert request_view.select_for(server_rule_prototype) is request_view, "Wrong request"
+
+
+def test_match_regex(application):
+    """Check that regular expressions are matched with and without combined patterns.
+
+    1. Create a view of the request.
+    2. Match regular expressions without combined patterns.
+    3. Set combined patterns, that cover one of the expressions.
+    4. Match regular expressions.
+    5. Check that the combined pattern is matched once.
+    """
+    covered = re.compile(r"/users/\d+")
+    separate = re.compile(r"(?i)/USERS/1")
+
+    class _Pattern(CombinedPattern):
+        """Combined pattern, that counts matches."""
+
+        calls = 0
+
+        def match(self, value):
+            """Count the match and find matching expressions."""
+            _Pattern.calls += 1
+            return super(_Pattern, self).match(value)
+
+    with application.test_request_context("/users/1"):
+        request_view = RequestView(flask.request)
+        assert request_view.match_regex(PATH_FEATURE, covered), "Wrong result"
+        assert request_view.match_regex(PATH_FEATURE, separate), "Wrong result"
+        assert not request_view.match_regex(PATH_FEATURE, re.compile("/users")), "Wrong result"
+
+        request_view.set_combined_patterns({PATH_FEATURE: _Pattern([covered])})
+        assert request_view.match_regex(PATH_FEATURE, covered), "Wrong result"
+        assert request_view.match_regex(PATH_FEATURE, covered), "Wrong result"
+        assert request_view.match_regex(PATH_FEATURE, separate), "Wrong result"
+
+    assert _Pattern.calls == 1, "Combined pattern has been matched several times"
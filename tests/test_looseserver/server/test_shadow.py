@@ -0,0 +1,180 @@
+"""Test cases for the analysis of the shadowed rules."""
+
+import pytest
+
+from looseserver.server.shadow import (
+    find_shadowed_rules,
+    ShadowAnalysis,
+    MAX_ANALYZED_PREDICATES,
+    )
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture
+def keyed_rule_prototype(server_rule_prototype):
+    """Factory of rules with predicate keys and conjuncts."""
+    class KeyedRule(type(server_rule_prototype)):
+        """Rule with predicate key and conjuncts."""
+
+        def __init__(self, predicate_key=None, conjuncts=None):
+            super(KeyedRule, self).__init__()
+            self._predicate_key = predicate_key
+            self._conjuncts = conjuncts
+
+        @property
+        def predicate_key(self):
+            """Key of the predicate."""
+            return self._predicate_key
+
+        @property
+        def conjuncts(self):
+            """Conjuncts of the rule."""
+            return self._conjuncts
+
+    return KeyedRule
+
+
+@pytest.fixture
+def analyzed_rules(keyed_rule_prototype):
+    """Dictionary with pairs (position, rule) by rule IDs."""
+    path = keyed_rule_prototype(predicate_key=("path", "/path"))
+    method = keyed_rule_prototype(predicate_key=("method", "GET"))
+    other_path = keyed_rule_prototype(predicate_key=("path", "/other"))
+    return {
+        "path": (0, path),
+        "composite": (1, keyed_rule_prototype(conjuncts=(method, path))),
+        "duplicate-path": (2, path),
+        "method": (3, method),
+        "duplicate-composite": (4, keyed_rule_prototype(conjuncts=(path, method))),
+        "other-path": (5, other_path),
+        "other-composite": (6, keyed_rule_prototype(conjuncts=(method, other_path))),
+        }
+# pylint: enable=redefined-outer-name
+
+
+def test_shadowed_rules(keyed_rule_prototype):
+    """Check that rules with supersets of the preceding predicates are shadowed.
+
+    1. Create rules with different sets of predicates.
+    2. Find shadowed rules.
+    3. Check the shadowed rules and the first shadowing rules.
+    """
+    path = keyed_rule_prototype(predicate_key=("path", "/path"))
+    method = keyed_rule_prototype(predicate_key=("method", "GET"))
+    composite = keyed_rule_prototype(conjuncts=(method, path))
+    other_path = keyed_rule_prototype(predicate_key=("path", "/other"))
+
+    rules = [
+        ("composite", composite),
+        ("path", path),
+        ("duplicate-composite", keyed_rule_prototype(conjuncts=(path, method))),
+        ("other-path", other_path),
+        ("duplicate-path", path),
+        ("method", method),
+        ("other-composite", keyed_rule_prototype(conjuncts=(method, other_path))),
+        ]
+
+    shadowed_rules = find_shadowed_rules(rules)
+    assert list(shadowed_rules.items()) == [
+        ("duplicate-composite", "composite"),
+        ("duplicate-path", "path"),
+        ("other-composite", "other-path"),
+        ], "Wrong shadowed rules"
+
+
+def test_unknown_predicates(keyed_rule_prototype):
+    """Check that rules with unknown predicates are not analyzed.
+
+    1. Create rules without predicate keys, an empty composite rule and a rule with
+       too many predicates.
+    2. Create rules, that would be shadowed by them.
+    3. Find shadowed rules.
+    4. Check that there are no shadowed rules.
+    """
+    unknown = keyed_rule_prototype()
+    path = keyed_rule_prototype(predicate_key=("path", "/path"))
+    many_predicates = [
+        keyed_rule_prototype(predicate_key=("header", str(index)))
+        for index in range(MAX_ANALYZED_PREDICATES + 1)
+        ]
+
+    rules = [
+        ("unknown", unknown),
+        ("duplicate-unknown", unknown),
+        ("composite-with-unknown", keyed_rule_prototype(conjuncts=(unknown, path))),
+        ("empty-composite", keyed_rule_prototype(conjuncts=())),
+        ("many-predicates", keyed_rule_prototype(conjuncts=tuple(many_predicates))),
+        ("duplicate-many-predicates", keyed_rule_prototype(conjuncts=tuple(many_predicates))),
+        ]
+
+    assert not find_shadowed_rules(rules), "Rules with unknown predicates are shadowed"
+
+
+@pytest.mark.parametrize(
+    argnames="changes",
+    argvalues=[
+        [
+            ("add", "path"),
+            ("add", "composite"),
+            ("add", "duplicate-path"),
+            ("add", "duplicate-composite"),
+            ("remove", "path"),
+            ("remove", "duplicate-path"),
+            ],
+        [
+            ("add", "method"),
+            ("add", "duplicate-composite"),
+            ("add", "other-composite"),
+            ("add", "composite"),
+            ("add", "path"),
+            ("remove", "method"),
+            ],
+        [
+            ("add", "composite"),
+            ("add", "duplicate-composite"),
+            ("add", "other-composite"),
+            ("add", "method"),
+            ("remove", "composite"),
+            ("add", "path"),
+            ("remove", "method"),
+            ("add", "other-path"),
+            ],
+        ],
+    ids=["Rules in order", "Rules out of order", "Removed shadowing rules"],
+    )
+def test_incremental_analysis(analyzed_rules, changes):
+    """Check that the updated analysis is the same as the analysis of all rules.
+
+    1. Add and remove rules one by one.
+    2. Find shadowed rules among the analyzed rules after every change.
+    3. Check that the updated analysis and its copy before the change are correct.
+    """
+    analysis = ShadowAnalysis()
+    rule_ids = set()
+    expected_shadowed_rules = {}
+    for action, rule_id in changes:
+        previous_analysis = analysis.copy()
+        previous_shadowed_rules = expected_shadowed_rules
+
+        position, rule = analyzed_rules[rule_id]
+        if action == "add":
+            analysis.add_rule(rule_id=rule_id, rule=rule, position=position)
+            rule_ids.add(rule_id)
+        else:
+            analysis.remove_rule(rule_id=rule_id)
+            rule_ids.remove(rule_id)
+
+        ordered_rule_ids = sorted(rule_ids, key=lambda rule_id: analyzed_rules[rule_id][0])
+        expected_shadowed_rules = find_shadowed_rules(
+            (rule_id, analyzed_rules[rule_id][1]) for rule_id in ordered_rule_ids
+            )
+
+        assert analysis.get_shadowed_rules() == expected_shadowed_rules, (
+            "Wrong shadowed rules after {0} of {1}".format(action, rule_id)
+            )
+        assert dict(analysis.shadowing_rules.items()) == expected_shadowed_rules, (
+            "Wrong shadowing rules after {0} of {1}".format(action, rule_id)
+            )
+        assert previous_analysis.get_shadowed_rules() == previous_shadowed_rules, (
+            "Copy of the analysis has been changed"
+            )
@@ -0,0 +1,263 @@
+"""Test cases for the snapshots of the rules."""
+
+import re
+from collections import namedtuple
+
+from looseserver.server.snapshot import RuleSnapshot
+from looseserver.server.request import RequestView, PATH_FEATURE
+
+
+_Request = namedtuple("_Request", "base_url")
+_MethodRequest = namedtuple("_MethodRequest", "method")
+
+
+def test_copy(server_rule_prototype, server_response_prototype):
+    """Check that changes of the copy don't affect the original snapshot.
+
+    1. Create a snapshot with a rule and a response.
+    2. Copy the snapshot.
+    3. Remove the rule from the copy and add another one.
+    4. Check rules, responses and version of both snapshots.
+    """
+    snapshot = RuleSnapshot()
+    snapshot.add_rule(rule_id="first", rule=server_rule_prototype)
+    snapshot.set_response(rule_id="first", response=server_response_prototype)
+
+    snapshot_copy = snapshot.copy()
+    snapshot_copy.remove_rule(rule_id="first")
+    snapshot_copy.add_rule(rule_id="second", rule=server_rule_prototype)
+
+    assert snapshot.get_rules_order() == ("first", ), "Original rules have been changed"
+    assert snapshot.responses == {"first": server_response_prototype}, (
+        "Original responses have been changed"
+        )
+    assert snapshot_copy.get_rules_order() == ("second", ), "Wrong rules of the copy"
+    assert not snapshot_copy.responses, "Wrong responses of the copy"
+    assert snapshot_copy.version > snapshot.version, "Version has not been changed"
+
+
+def test_find_matches(server_rule_prototype, server_response_prototype):
+    """Check that only matching rules with responses are found.
+
+    1. Create a snapshot with a matching rule without response, a rule without match
+       and a matching rule with a response.
+    2. Find matches.
+    3. Check that only the last rule is found.
+    """
+    snapshot = RuleSnapshot()
+    no_response_rule = server_rule_prototype.create_new(match_implementation=True)
+    no_match_rule = server_rule_prototype.create_new(match_implementation=False)
+    match_rule = server_rule_prototype.create_new(match_implementation=True)
+
+    snapshot.add_rule(rule_id="no response", rule=no_response_rule)
+    snapshot.add_rule(rule_id="no match", rule=no_match_rule)
+    snapshot.add_rule(rule_id="match", rule=match_rule)
+    snapshot.set_response(rule_id="no match", response=server_response_prototype)
+    snapshot.set_response(rule_id="match", response=server_response_prototype)
+
+    matches = list(snapshot.find_matches(RequestView(request=None)))
+    assert matches == [(match_rule, server_response_prototype)], "Wrong matches"
+
+
+def test_armed_rules(server_rule_prototype, server_response_prototype):
+    """Check that only armed rules are checked in the order of their registration.
+
+    1. Create a snapshot with several matching rules, that count checks.
+    2. Set a response for the last rule, then for the first one.
+    3. Find matches.
+    4. Check that the rules are found in the order of registration.
+    5. Check that the rule without response has not been checked.
+    """
+    checked_rules = []
+
+    def _match(rule, request):
+        # pylint: disable=unused-argument
+        checked_rules.append(rule)
+        return True
+
+    snapshot = RuleSnapshot()
+    first_rule = server_rule_prototype.create_new(match_implementation=_match)
+    unarmed_rule = server_rule_prototype.create_new(match_implementation=_match)
+    last_rule = server_rule_prototype.create_new(match_implementation=_match)
+
+    snapshot.add_rule(rule_id="first", rule=first_rule)
+    snapshot.add_rule(rule_id="unarmed", rule=unarmed_rule)
+    snapshot.add_rule(rule_id="last", rule=last_rule)
+    snapshot.set_response(rule_id="last", response=server_response_prototype)
+    snapshot.set_response(rule_id="first", response=server_response_prototype)
+
+    matches = list(snapshot.find_matches(RequestView(request=None)))
+    assert matches == [
+        (first_rule, server_response_prototype),
+        (last_rule, server_response_prototype),
+        ], "Wrong matches"
+    assert unarmed_rule not in checked_rules, "Rule without response has been checked"
+
+    snapshot.remove_rule(rule_id="first")
+    matches = list(snapshot.find_matches(RequestView(request=None)))
+    assert matches == [(last_rule, server_response_prototype)], "Removed rule is found"
+
+
+def test_combined_regexes(server_rule_prototype, server_response_prototype):
+    """Check that regular expressions of the rules are combined in background.
+
+    1. Create a snapshot with rules, that check regular expressions of the path.
+    2. Find matches.
+    3. Wait until the combined patterns are built.
+    4. Find matches again.
+    5. Check that matches are the same and the combined pattern is used.
+    6. Remove one of the rules.
+    7. Check that the combined pattern does not cover the expression of the removed rule.
+    """
+    class _RegexRule(type(server_rule_prototype)):
+        """Rule, that checks a regular expression of the path."""
+
+        uses_request_view = True
+
+        def __init__(self, pattern):
+            super(_RegexRule, self).__init__()
+            self.regex = re.compile(pattern)
+
+        @property
+        def regex_keys(self):
+            """Regular expressions of request features checked by the rule."""
+            return ((PATH_FEATURE, self.regex), )
+
+        def is_match_found(self, request):
+            """Check if the expression matches the path."""
+            return request.match_regex(PATH_FEATURE, self.regex)
+
+    snapshot = RuleSnapshot()
+    users_rule = _RegexRule(r"/users/\d+")
+    orders_rule = _RegexRule(r"/orders/\d+")
+    snapshot.add_rule(rule_id="users", rule=users_rule)
+    snapshot.add_rule(rule_id="orders", rule=orders_rule)
+    snapshot.set_response(rule_id="users", response=server_response_prototype)
+    snapshot.set_response(rule_id="orders", response=server_response_prototype)
+
+    request = _Request(base_url="http://localhost/users/1")
+    matches = list(snapshot.find_matches(RequestView(request=request)))
+    assert matches == [(users_rule, server_response_prototype)], "Wrong matches"
+
+    assert snapshot.pattern_compiler.wait(timeout=5), "Patterns have not been built"
+
+    request_view = RequestView(request=request)
+    matches = list(snapshot.find_matches(request_view))
+    assert matches == [(users_rule, server_response_prototype)], "Wrong matches"
+    combined_pattern = request_view._combined_patterns[PATH_FEATURE]   # pylint: disable=protected-access
+    assert combined_pattern.covers(users_rule.regex), "Combined pattern is not used"
+
+    snapshot.remove_rule(rule_id="users")
+    list(snapshot.find_matches(RequestView(request=request)))
+    assert snapshot.pattern_compiler.wait(timeout=5), "Patterns have not been built"
+
+    request_view = RequestView(request=request)
+    assert not list(snapshot.find_matches(request_view)), "Removed rule is found"
+    combined_pattern = request_view._combined_patterns[PATH_FEATURE]   # pylint: disable=protected-access
+    assert not combined_pattern.covers(users_rule.regex), "Removed expression is covered"
+    assert combined_pattern.covers(orders_rule.regex), "Expression is not covered"
+
+
+def test_reorder_rules(server_rule_prototype, server_response_prototype):
+    """Check that disjoint rules are reordered by the number of matches.
+
+    1. Create an adaptive snapshot with disjoint rules and a rule matching every request.
+    2. Find matches for a request, that only the last disjoint rule matches.
+    3. Reorder rules.
+    4. Find matches for the request.
+    5. Check that matches are the same and the last disjoint rule is checked first.
+    6. Reorder rules again.
+    7. Check that the order has not been changed, since the last disjoint rule
+       has the most matches.
+    """
+    checked_rules = []
+
+    class _MethodRule(type(server_rule_prototype)):
+        """Rule, that requires an exact method."""
+
+        def __init__(self, method):
+            super(_MethodRule, self).__init__(match_implementation=self._check)
+            self.method = method
+
+        @staticmethod
+        def _check(rule, request):
+            checked_rules.append(rule.method)
+            return request.method == rule.method
+
+        @property
+        def index_keys(self):
+            """Exact request features required by the rule."""
+            return (("method", self.method), )
+
+    snapshot = RuleSnapshot(adaptive=True)
+    rules = [_MethodRule(method) for method in ("GET", "POST", "PUT")]
+    any_rule = server_rule_prototype.create_new(match_implementation=True)
+    for rule_id, rule in enumerate(rules + [any_rule]):
+        snapshot.add_rule(rule_id=rule_id, rule=rule)
+        snapshot.set_response(rule_id=rule_id, response=server_response_prototype)
+
+    request = _MethodRequest(method="PUT")
+    expected_matches = [
+        (rules[2], server_response_prototype),
+        (any_rule, server_response_prototype),
+        ]
+
+    assert list(snapshot.find_matches(RequestView(request))) == expected_matches, "Wrong matches"
+    assert checked_rules == ["GET", "POST", "PUT"], "Wrong order of checks"
+
+    assert snapshot.reorder_rules(), "Rules have not been reordered"
+    del checked_rules[:]
+
+    assert list(snapshot.find_matches(RequestView(request))) == expected_matches, "Wrong matches"
+    assert checked_rules == ["PUT", "GET", "POST"], "Wrong order of checks"
+
+    assert not snapshot.reorder_rules(), "Order has been changed"
+
+
+def test_exhausted_rule(server_rule_prototype, server_response_prototype):
+    """Check that a rule without remaining uses is skipped, but rules shadowed by it are not.
+
+    1. Create a snapshot with a limited rule and a rule shadowed by it.
+    2. Find matches for a request.
+    3. Check that the limited rule is the first match.
+    4. Find matches again, when the rule has no remaining uses.
+    5. Check that the shadowed rule is the only match.
+    """
+    class _Counter:
+        """Counter with a single use."""
+
+        remaining = 1
+
+        def acquire(self):
+            """Acquire a use."""
+            if not self.remaining:
+                return False
+            self.remaining -= 1
+            return True
+
+    class _KeyRule(type(server_rule_prototype)):
+        """Rule with a predicate key."""
+
+        @property
+        def predicate_key(self):
+            """Key of the predicate checked by the rule."""
+            return "key"
+
+    limited_rule = _KeyRule(match_implementation=True)
+    shadowed_rule = _KeyRule(match_implementation=True)
+
+    snapshot = RuleSnapshot()
+    snapshot.add_rule(rule_id="limited", rule=limited_rule, use_counter=_Counter())
+    snapshot.add_rule(rule_id="shadowed", rule=shadowed_rule)
+    for rule_id in ("limited", "shadowed"):
+        snapshot.set_response(rule_id=rule_id, response=server_response_prototype)
+
+    assert snapshot.get_shadowed_rules() == {"shadowed": "limited"}, "Rule is not shadowed"
+
+    request_view = RequestView(_Request(base_url="/"))
+    first_match = next(snapshot.find_matches(request_view))
+    assert first_match == (limited_rule, server_response_prototype), "Wrong match"
+    assert snapshot.get_remaining_uses(rule_id="limited") == 0, "Use has not been acquired"
+
+    matches = list(snapshot.find_matches(RequestView(_Request(base_url="/"))))
+    assert matches == [(shadowed_rule, server_response_prototype)], "Wrong matches"